@@ -0,0 +1 @@
+"""Funciones de cálculo térmico compartidas por las páginas de la aplicación."""
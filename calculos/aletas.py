@@ -0,0 +1,129 @@
+import numpy as np
+from scipy.special import ive, kve
+from calculos.flujo_interno import como_arreglo
+
+CONDICIONES_PUNTA = ["adiabática", "convectiva", "infinita"]
+TIPOS_ALETA = ["recta", "aguja", "anular"]
+
+
+# --- Funciones de Bessel modificadas escaladas ---
+# kve = K_v(z)·e^(z) es analítica; ive escala con e^(-|Re z|), que no lo es, y se
+# corrige la fase para obtener I_v(z)·e^(-z), que admite el paso complejo (Re z > 0)
+def _i_escalada(v, z):
+    if np.iscomplexobj(z):
+        return ive(v, z) * np.exp(-1j * z.imag)
+    return ive(v, z)
+
+
+# --- Aletas de sección uniforme (rectas y de aguja) ---
+def _aleta_uniforme(h, k, P, A_c, L, punta):
+    """Calor por unidad de exceso de temperatura en la base (W/K) y eficiencia."""
+    m = np.sqrt(h * P / (k * A_c))
+    M = np.sqrt(h * P * k * A_c)
+    mL = m * L
+
+    if punta == "adiabática":
+        q_theta = M * np.tanh(mL)
+        A_f = P * L
+    elif punta == "convectiva":
+        razon = h / (m * k)
+        # tanh evita el desbordamiento de sinh/cosh para mL grandes
+        t = np.tanh(mL)
+        q_theta = M * (t + razon) / (1 + razon * t)
+        A_f = P * L + A_c
+    elif punta == "infinita":
+        # η referida al área nominal P·L; solo tiene sentido físico para mL grandes
+        q_theta = M * np.ones_like(mL)
+        A_f = P * L
+    else:
+        raise ValueError(f"Condición de punta desconocida: {punta}")
+
+    return {'q_theta': q_theta, 'eta': q_theta / (h * A_f), 'A_f': A_f, 'A_huella': A_c, 'm': m}
+
+
+def aleta_recta(h, k, espesor, longitud, ancho, punta="adiabática"):
+    """Aleta recta de perfil rectangular."""
+    h, k, t, L, w = np.broadcast_arrays(*(como_arreglo(v) for v in (h, k, espesor, longitud, ancho)))
+    return _aleta_uniforme(h, k, 2 * (w + t), w * t, L, punta)
+
+
+def aleta_aguja(h, k, diametro, longitud, punta="adiabática"):
+    """Aleta de aguja (cilíndrica)."""
+    h, k, D, L = np.broadcast_arrays(*(como_arreglo(v) for v in (h, k, diametro, longitud)))
+    return _aleta_uniforme(h, k, np.pi * D, np.pi * D**2 / 4, L, punta)
+
+
+# --- Aleta anular de espesor uniforme ---
+def aleta_anular(h, k, espesor, r1, r2, punta="adiabática"):
+    """
+    Aleta anular con eficiencia de funciones de Bessel modificadas.
+
+    Se usan versiones escaladas de I y K para que el cociente no desborde con
+    m·r grandes. La punta convectiva se trata con el radio corregido r2c = r2 + t/2.
+    """
+    h, k, t, r1, r2 = np.broadcast_arrays(*(como_arreglo(v) for v in (h, k, espesor, r1, r2)))
+    m = np.sqrt(2 * h / (k * t))
+    A_huella = 2 * np.pi * r1 * t
+
+    if punta == "infinita":
+        A_f = 2 * np.pi * (r2**2 - r1**2)
+        q_theta = 2 * np.pi * k * t * r1 * m * kve(1, m * r1) / kve(0, m * r1)
+        return {'q_theta': q_theta, 'eta': q_theta / (h * A_f), 'A_f': A_f, 'A_huella': A_huella, 'm': m}
+    if punta == "convectiva":
+        r2 = r2 + t / 2
+    elif punta != "adiabática":
+        raise ValueError(f"Condición de punta desconocida: {punta}")
+
+    a, b = m * r1, m * r2
+    # Los factores exp(±m(r2 - r1)) comunes a numerador y denominador se cancelan
+    atenuacion = np.exp(-2 * (b - a))
+    numerador = kve(1, a) * _i_escalada(1, b) - _i_escalada(1, a) * kve(1, b) * atenuacion
+    denominador = _i_escalada(0, a) * kve(1, b) * atenuacion + kve(0, a) * _i_escalada(1, b)
+    A_f = 2 * np.pi * (r2**2 - r1**2)
+    eta = (2 * r1 / m) / (r2**2 - r1**2) * numerador / denominador
+    return {'q_theta': eta * h * A_f, 'eta': eta, 'A_f': A_f, 'A_huella': A_huella, 'm': m}
+
+
+def aleta(tipo, h, k, punta="adiabática", **geometria):
+    """Despacho por tipo: recta (espesor, longitud, ancho), aguja (diametro, longitud) o anular (espesor, r1, r2)."""
+    funciones = {"recta": aleta_recta, "aguja": aleta_aguja, "anular": aleta_anular}
+    if tipo not in funciones:
+        raise ValueError(f"Tipo de aleta desconocido: {tipo}")
+    return funciones[tipo](h, k, punta=punta, **geometria)
+
+
+# --- Arreglos de aletas ---
+def eficiencia_global(n_aletas, resultado_aleta, A_base):
+    """
+    Eficiencia global de superficie η_o = 1 - (N·A_f/A_t)(1 - η_f).
+
+    A_base es el área de la pared sin aletas; la huella de las aletas se descuenta.
+    """
+    A_f = resultado_aleta['A_f']
+    A_b = A_base - n_aletas * resultado_aleta['A_huella']
+    A_t = n_aletas * A_f + A_b
+    eta_o = 1 - (n_aletas * A_f / A_t) * (1 - resultado_aleta['eta'])
+    return {'eta_o': eta_o, 'A_t': A_t, 'A_b': A_b}
+
+
+def resistencia_superficie_aletada(h, n_aletas, resultado_aleta, A_base):
+    """Resistencia convectiva de la pared aletada, R = 1/(η_o·h·A_t), en K/W."""
+    global_ = eficiencia_global(n_aletas, resultado_aleta, A_base)
+    return 1 / (global_['eta_o'] * h * global_['A_t'])
+
+
+def resistencia_pared_aletada(tipo, h, k, n_aletas, A_base, espesor, largo, ancho=None, r_base=None,
+                              punta="adiabática"):
+    """
+    Resistencia exterior de una pared con aletas descritas como en la página de conducción.
+
+    espesor es el diámetro en las agujas; en las anulares largo es la altura radial
+    r2 - r1 sobre la superficie de radio r_base.
+    """
+    if tipo == "recta":
+        geometria = {'espesor': espesor, 'longitud': largo, 'ancho': ancho}
+    elif tipo == "aguja":
+        geometria = {'diametro': espesor, 'longitud': largo}
+    else:
+        geometria = {'espesor': espesor, 'r1': r_base, 'r2': r_base + largo}
+    return resistencia_superficie_aletada(h, n_aletas, aleta(tipo, h, k, punta=punta, **geometria), A_base)
@@ -0,0 +1,129 @@
+import numpy as np
+from calculos.flujo_interno import (
+    nu_gnielinski, nu_dittus_boelter, como_arreglo, RE_LAMINAR, RE_TURBULENTO, LAMINAR, TRANSICION, TURBULENTO,
+)
+
+# --- Tablas para anulo concéntrico, flujo laminar completamente desarrollado ---
+# Una pared a temperatura constante y la otra aislada (Incropera, Tabla 8.2)
+TABLA_UNA_PARED = {
+    'Di_Do': [0.00, 0.05, 0.10, 0.25, 0.50, 1.00],
+    'Nui': [np.nan, 17.46, 11.56, 7.37, 5.74, 4.86],
+    'Nuo': [3.66, 4.06, 4.11, 4.23, 4.43, 4.86],
+}
+
+# Flujo de calor uniforme en ambas paredes: coeficientes de influencia (Kays y Perkins)
+TABLA_AMBAS_PAREDES = {
+    'Di_Do': [0.00, 0.05, 0.10, 0.20, 0.40, 0.60, 0.80, 1.00],
+    'Nuii': [np.nan, 17.81, 11.91, 8.499, 6.583, 5.912, 5.58, 5.385],
+    'Nuoo': [4.364, 4.792, 4.834, 4.883, 4.979, 5.099, 5.24, 5.385],
+    'theta_i': [np.inf, 2.18, 1.383, 0.905, 0.603, 0.473, 0.401, 0.346],
+    'theta_o': [0.0, 0.0294, 0.0562, 0.1041, 0.1823, 0.2455, 0.299, 0.346],
+}
+
+CASOS_FRONTERA = ["pared interna calentada", "pared externa calentada", "ambas paredes calentadas"]
+
+
+# --- Interpolación lineal con coeficientes precalculados ---
+def _coeficientes_lineales(x, y):
+    """Pendiente y ordenada de cada tramo, omitiendo puntos no finitos de la tabla."""
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    finitos = np.isfinite(y)
+    x, y = x[finitos], y[finitos]
+    pendiente = np.diff(y) / np.diff(x)
+    ordenada = y[:-1] - pendiente * x[:-1]
+    return x, pendiente, ordenada
+
+
+def _evaluar_lineal(coeficientes, valor):
+    """Evalúa el interpolante; fuera de la tabla se extrapola con el tramo extremo."""
+    x, pendiente, ordenada = coeficientes
+    tramo = np.clip(np.searchsorted(x, np.real(valor), side='right') - 1, 0, len(pendiente) - 1)
+    return pendiente[tramo] * valor + ordenada[tramo]
+
+
+# Coeficientes construidos una sola vez al importar el módulo
+_COEF_NUI = _coeficientes_lineales(TABLA_UNA_PARED['Di_Do'], TABLA_UNA_PARED['Nui'])
+_COEF_NUO = _coeficientes_lineales(TABLA_UNA_PARED['Di_Do'], TABLA_UNA_PARED['Nuo'])
+_COEF_NUII = _coeficientes_lineales(TABLA_AMBAS_PAREDES['Di_Do'], TABLA_AMBAS_PAREDES['Nuii'])
+_COEF_NUOO = _coeficientes_lineales(TABLA_AMBAS_PAREDES['Di_Do'], TABLA_AMBAS_PAREDES['Nuoo'])
+_COEF_THETA_I = _coeficientes_lineales(TABLA_AMBAS_PAREDES['Di_Do'], TABLA_AMBAS_PAREDES['theta_i'])
+_COEF_THETA_O = _coeficientes_lineales(TABLA_AMBAS_PAREDES['Di_Do'], TABLA_AMBAS_PAREDES['theta_o'])
+
+
+def diametro_hidraulico(Di, Do):
+    return np.asarray(Do) - np.asarray(Di)
+
+
+def nu_anulo_laminar(Di_Do, caso="pared interna calentada", razon_flujos=1.0):
+    """
+    Nu de anulo laminar (basado en Dh = Do - Di) evaluado sobre arreglos.
+
+    Devuelve un diccionario con 'Nui' y 'Nuo'; la pared no calentada queda
+    en NaN. Para "ambas paredes calentadas", razon_flujos = q''o / q''i.
+    """
+    Di_Do = como_arreglo(Di_Do)
+    fuera = (Di_Do <= 0) | (Di_Do > 1)
+    Nui = np.full(Di_Do.shape, np.nan)
+    Nuo = np.full(Di_Do.shape, np.nan)
+
+    if caso == "pared interna calentada":
+        Nui = _evaluar_lineal(_COEF_NUI, Di_Do)
+    elif caso == "pared externa calentada":
+        Nuo = _evaluar_lineal(_COEF_NUO, Di_Do)
+        fuera = (Di_Do < 0) | (Di_Do > 1)
+    elif caso == "ambas paredes calentadas":
+        razon_flujos = como_arreglo(razon_flujos)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            Nui = _evaluar_lineal(_COEF_NUII, Di_Do) / (1 - razon_flujos * _evaluar_lineal(_COEF_THETA_I, Di_Do))
+            Nuo = _evaluar_lineal(_COEF_NUOO, Di_Do) / (1 - _evaluar_lineal(_COEF_THETA_O, Di_Do) / razon_flujos)
+    else:
+        raise ValueError(f"Caso de frontera desconocido: {caso}")
+
+    return {
+        'Nui': np.where(fuera, np.nan, Nui),
+        'Nuo': np.where(fuera, np.nan, Nuo),
+    }
+
+
+def nu_anulo_turbulento(Re, Pr, Di_Do, correlacion="gnielinski", n=0.4):
+    """
+    Nu turbulento en anulo con Re y Nu basados en el diámetro hidráulico.
+
+    Con Gnielinski se aplica la corrección de Petukhov y Roizen para cada
+    pared; Dittus-Boelter no distingue entre paredes.
+    """
+    Re, Pr, Di_Do = np.broadcast_arrays(
+        como_arreglo(Re), como_arreglo(Pr), como_arreglo(Di_Do))
+    if correlacion == "gnielinski":
+        Nu = nu_gnielinski(Re, Pr)
+        return {
+            'Nui': Nu * 0.86 * Di_Do**-0.16,
+            'Nuo': Nu * (1 - 0.14 * Di_Do**0.6),
+        }
+    if correlacion == "dittus-boelter":
+        Nu = nu_dittus_boelter(Re, Pr, n)
+        return {'Nui': Nu, 'Nuo': Nu.copy()}
+    raise ValueError(f"Correlación turbulenta desconocida: {correlacion}")
+
+
+def nu_anulo(Re, Pr, Di_Do, caso="pared interna calentada", razon_flujos=1.0, correlacion="gnielinski", n=0.4):
+    """
+    Nu de anulo con selección de régimen por máscara (tabla laminar o correlación turbulenta).
+
+    Igual que en tubos (nusselt_interno), entre Re = 2300 y 10⁴ se interpola
+    linealmente en Re entre el valor laminar y el turbulento en Re = 10⁴.
+    """
+    Re, Pr, Di_Do = np.broadcast_arrays(
+        como_arreglo(Re), como_arreglo(Pr), como_arreglo(Di_Do))
+    regimen = np.select([np.real(Re) < RE_LAMINAR, np.real(Re) < RE_TURBULENTO], [LAMINAR, TRANSICION], TURBULENTO)
+    laminar = nu_anulo_laminar(Di_Do, caso, razon_flujos)
+    turbulento = nu_anulo_turbulento(Re, Pr, Di_Do, correlacion, n)
+    turbulento_lim = nu_anulo_turbulento(np.full(Re.shape, RE_TURBULENTO), Pr, Di_Do, correlacion, n)
+    gamma = np.clip((Re - RE_LAMINAR) / (RE_TURBULENTO - RE_LAMINAR), 0.0, 1.0)
+    resultado = {
+        pared: np.choose(regimen, [laminar[pared], (1 - gamma) * laminar[pared] + gamma * turbulento_lim[pared],
+                                   turbulento[pared]])
+        for pared in ('Nui', 'Nuo')
+    }
+    resultado.update(regimen=regimen, laminar=regimen == LAMINAR)
+    return resultado
@@ -0,0 +1,34 @@
+import numpy as np
+
+# --- Balances de energía y parámetros térmicos (página de intercambiadores) ---
+def carga_termica(m, cp, T_in, T_out):
+    return m * cp * (T_in - T_out)
+
+def lmtd(T_hot_in, T_hot_out, T_cold_in, T_cold_out):
+    delta_T1 = T_hot_in - T_cold_out
+    delta_T2 = T_hot_out - T_cold_in
+    return (delta_T1 - delta_T2) / np.log(delta_T1 / delta_T2) if delta_T1 != delta_T2 else delta_T1
+
+def temperatura_salida_caliente(m_hot, cp_hot, m_cold, cp_cold, T_hot_in, T_cold_in, T_cold_out):
+    # m_hot * cp_hot * (T_hot_in - T_hot_out) = m_cold * cp_cold * (T_cold_out - T_cold_in)
+    return T_hot_in - (m_cold * cp_cold * (T_cold_out - T_cold_in)) / (m_hot * cp_hot)
+
+def temperatura_salida_fria(m_hot, cp_hot, m_cold, cp_cold, T_hot_in, T_cold_in, T_hot_out):
+    # m_hot * cp_hot * (T_hot_in - T_hot_out) = m_cold * cp_cold * (T_cold_out - T_cold_in)
+    return T_cold_in + (m_hot * cp_hot * (T_hot_in - T_hot_out)) / (m_cold * cp_cold)
+
+def eficacia(Q, m_hot, cp_hot, m_cold, cp_cold, T_hot_in, T_cold_in):
+    cmin = min(m_hot * cp_hot, m_cold * cp_cold)
+    qmax = cmin * (T_hot_in - T_cold_in)
+    return Q / qmax if qmax != 0 else np.nan
+
+def razon_capacidades(m_hot, cp_hot, m_cold, cp_cold):
+    c_hot = m_hot * cp_hot
+    c_cold = m_cold * cp_cold
+    cmax = max(c_hot, c_cold)
+    return min(c_hot, c_cold) / cmax if cmax != 0 else np.nan
+
+def r_y_p(T_hot_in, T_hot_out, T_cold_in, T_cold_out):
+    R = (T_hot_in - T_hot_out) / (T_cold_out - T_cold_in) if (T_cold_out - T_cold_in) != 0 else np.nan
+    P = (T_cold_out - T_cold_in) / (T_hot_in - T_cold_in) if (T_hot_in - T_cold_in) != 0 else np.nan
+    return R, P
@@ -0,0 +1,190 @@
+import numpy as np
+from calculos.efectividad import efectividad_C_cero
+from calculos.flujo_interno import como_arreglo
+from calculos.propiedades import propiedades_saturacion, interpolar_propiedad
+
+G_GRAVEDAD = 9.81
+
+# Rohsenow es una correlación de ebullición en estanque: solo se ofrece en el exterior del tubo
+MECANISMOS_EXTERNOS = ["condensación sobre tubo horizontal", "condensación en banco de tubos", "ebullición nucleada"]
+MECANISMOS_INTERNOS = ["condensación dentro del tubo"]
+CORRELACIONES_CONDENSACION_INTERNA = ["chato", "shah"]
+
+# Punto crítico (para la presión reducida de Shah y la tensión superficial)
+T_CRITICA = {'agua saturada': 647.096}  # K
+P_CRITICA = {'agua saturada': 22064.0}  # kPa
+
+
+# --- Tensión superficial ---
+def tension_superficial_agua(T):
+    """Tensión superficial del agua saturada (IAPWS, 1994) en N/m; T en °C."""
+    tau = 1 - (T + 273.15) / T_CRITICA['agua saturada']
+    return 0.2358 * tau**1.256 * (1 - 0.625 * tau)
+
+
+TENSION_SUPERFICIAL = {'agua saturada': tension_superficial_agua}
+
+
+def _grupo_pelicula(p, dT, D):
+    """g·ρl·(ρl - ρv)·kl³ / (μl·ΔT·D), común a las correlaciones de película de Nusselt."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return G_GRAVEDAD * p['densidad_l'] * (p['densidad_l'] - p['densidad_v']) * p['k_l']**3 / (
+            p['viscosidad_l'] * dT * D)
+
+
+# --- Condensación en película ---
+def condensacion_tubo_horizontal(fluido, T_sat, T_pared, D, N=1):
+    """
+    Condensación en película laminar (Nusselt) sobre tubos horizontales.
+
+    Propiedades del líquido a la temperatura de película y h'fg = hfg·(1 + 0.68·Ja).
+    Para N tubos en una columna vertical se usa h_N = h_1·N^(-1/4).
+    """
+    T_sat, T_pared, D, N = np.broadcast_arrays(
+        como_arreglo(T_sat), como_arreglo(T_pared), como_arreglo(D), como_arreglo(N))
+    dT = T_sat - T_pared
+    p = propiedades_saturacion(fluido, T_sat, (T_sat + T_pared) / 2)
+    Ja = p['cp_l'] * dT / p['h_fg']
+    h = 0.729 * (_grupo_pelicula(p, dT, D) * p['h_fg'] * (1 + 0.68 * Ja))**0.25 * N**-0.25
+    return {'h': h, 'q_flujo': h * dT, 'Ja': Ja, 'valido': (np.real(dT) > 0) & (np.real(Ja) < 0.1)}
+
+
+def condensacion_interna(fluido, T_sat, T_pared, D, G=None, x_entrada=1.0, x_salida=0.0, correlacion="chato"):
+    """
+    Condensación dentro de un tubo horizontal, h promedio.
+
+    "chato": película estratificada a baja velocidad de vapor, h'fg = hfg + 3/8·cp·ΔT;
+    válida para Re_v = G·D/μv < 35 000 (si se indica el flujo másico G en kg/m²s).
+    "shah": correlación de Shah (1979) a partir de h solo-líquido, promediada
+    en calidad entre x_salida y x_entrada con cuadratura de Gauss-Legendre.
+    """
+    T_sat, T_pared, D = np.broadcast_arrays(como_arreglo(T_sat), como_arreglo(T_pared), como_arreglo(D))
+    dT = T_sat - T_pared
+
+    if correlacion == "chato":
+        p = propiedades_saturacion(fluido, T_sat, (T_sat + T_pared) / 2)
+        h = 0.555 * (_grupo_pelicula(p, dT, D) * (p['h_fg'] + 3 / 8 * p['cp_l'] * dT))**0.25
+        valido = np.real(dT) > 0
+        if G is not None:
+            Re_v = G * D / p['viscosidad_v']
+            valido = valido & (np.real(Re_v) < 35000)
+        return {'h': h, 'q_flujo': h * dT, 'valido': valido}
+
+    if correlacion == "shah":
+        if G is None:
+            raise ValueError("La correlación de Shah requiere el flujo másico por unidad de área G")
+        if fluido not in P_CRITICA:
+            raise ValueError(f"No se conoce la presión crítica de {fluido}")
+        p = propiedades_saturacion(fluido, T_sat)
+        Re_lo = G * D / p['viscosidad_l']
+        h_lo = 0.023 * Re_lo**0.8 * p['Pr_l']**0.4 * p['k_l'] / D
+        p_r = p['Psat'] / P_CRITICA[fluido]
+
+        # Calidad en los nodos de cuadratura (eje final) y promedio ponderado
+        nodos, pesos = np.polynomial.legendre.leggauss(8)
+        x = (x_entrada + x_salida) / 2 + (x_entrada - x_salida) / 2 * nodos
+        factor = (1 - x)**0.8 + 3.8 * x**0.76 * (1 - x)**0.04 / p_r[..., None]**0.38
+        h = h_lo * (factor @ pesos) / 2
+        valido = (np.real(dT) > 0) & (np.real(Re_lo) > 350) & (np.real(p_r) > 0.002) & (np.real(p_r) < 0.44)
+        return {'h': h, 'q_flujo': h * dT, 'valido': valido}
+
+    raise ValueError(f"Correlación de condensación desconocida: {correlacion}")
+
+
+# --- Ebullición ---
+def ebullicion_nucleada(fluido, T_sat, T_pared, C_sf=0.013, n=1.0):
+    """
+    Ebullición nucleada en estanque (Rohsenow) con exceso de temperatura ΔTe = T_pared - T_sat.
+
+    C_sf y n dependen de la combinación superficie-fluido (agua-cobre pulido: 0.013 y 1.0).
+    Se marca como no válido si el flujo supera el flujo crítico de Zuber (constante 0.149).
+    """
+    T_sat, T_pared = np.broadcast_arrays(como_arreglo(T_sat), como_arreglo(T_pared))
+    if fluido not in TENSION_SUPERFICIAL:
+        raise ValueError(f"No se conoce la tensión superficial de {fluido}")
+    dT = T_pared - T_sat
+    p = propiedades_saturacion(fluido, T_sat)
+    sigma = TENSION_SUPERFICIAL[fluido](T_sat)
+    empuje = G_GRAVEDAD * (p['densidad_l'] - p['densidad_v'])
+
+    q_flujo = p['viscosidad_l'] * p['h_fg'] * np.sqrt(empuje / sigma) * (
+        p['cp_l'] * dT / (C_sf * p['h_fg'] * p['Pr_l']**n))**3
+    q_max = 0.149 * p['h_fg'] * p['densidad_v'] * (sigma * empuje / p['densidad_v']**2)**0.25
+    with np.errstate(divide="ignore", invalid="ignore"):
+        h = q_flujo / dT
+    return {'h': h, 'q_flujo': q_flujo, 'q_max': q_max,
+            'valido': (np.real(dT) > 0) & (np.real(q_flujo) < np.real(q_max))}
+
+
+def coeficiente_cambio_fase(mecanismo, fluido, T_sat, T_pared, D, **opciones):
+    """h de cambio de fase según el mecanismo; las opciones pasan a la correlación correspondiente."""
+    if mecanismo == "condensación sobre tubo horizontal":
+        return condensacion_tubo_horizontal(fluido, T_sat, T_pared, D)
+    if mecanismo == "condensación en banco de tubos":
+        return condensacion_tubo_horizontal(fluido, T_sat, T_pared, D, N=opciones.get('N', 1))
+    if mecanismo == "condensación dentro del tubo":
+        return condensacion_interna(fluido, T_sat, T_pared, D, **opciones)
+    if mecanismo == "ebullición nucleada":
+        return ebullicion_nucleada(fluido, T_sat, T_pared, **opciones)
+    raise ValueError(f"Mecanismo de cambio de fase desconocido: {mecanismo}")
+
+
+def verificar_lados(cambio_fase_int, cambio_fase_ext):
+    """Un solo lado cambia de fase, y cada lado con un mecanismo válido para él."""
+    if cambio_fase_int is not None and cambio_fase_ext is not None:
+        raise ValueError("Solo uno de los lados puede cambiar de fase")
+    if cambio_fase_int is not None and cambio_fase_int not in MECANISMOS_INTERNOS:
+        raise ValueError(f"Mecanismo no válido dentro del tubo: {cambio_fase_int}")
+    if cambio_fase_ext is not None and cambio_fase_ext not in MECANISMOS_EXTERNOS:
+        raise ValueError(f"Mecanismo no válido en el exterior del tubo: {cambio_fase_ext}")
+
+
+def temperatura_pared(mecanismo, fluido, T_sat, T_otro, h_otro, D, tol=1e-6, max_iter=60, **opciones):
+    """
+    Temperatura de pared que iguala el flujo de cambio de fase con el del otro lado.
+
+    h_cf(Tw)·|Tw - T_sat| = h_otro·|T_otro - Tw|, con resistencia de pared despreciable
+    (igual que U = 1/(1/h_int + 1/h_ext)). Con Tw = T_sat + t·(T_otro - T_sat) el
+    residuo es creciente en t ∈ [0, 1]; se resuelve por bisección vectorizada.
+    Devuelve el resultado de la correlación evaluado en la pared con 'T_pared'.
+    """
+    T_sat, T_otro, h_otro, D = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (T_sat, T_otro, h_otro, D)))
+    sentido = (T_otro > T_sat) if mecanismo == "ebullición nucleada" else (T_otro < T_sat)
+    salto = T_otro - T_sat
+    t_min, t_max = np.zeros(T_sat.shape), np.ones(T_sat.shape)
+
+    for _ in range(max_iter):
+        t = (t_min + t_max) / 2
+        T_pared = T_sat + t * salto
+        q_fase = coeficiente_cambio_fase(mecanismo, fluido, T_sat, T_pared, D, **opciones)['q_flujo']
+        residuo = np.abs(q_fase) - h_otro * np.abs(T_otro - T_pared)
+        t_min = np.where(residuo < 0, t, t_min)
+        t_max = np.where(residuo < 0, t_max, t)
+        if np.all((t_max - t_min) * np.abs(salto) < tol):
+            break
+
+    T_pared = T_sat + (t_min + t_max) / 2 * salto
+    resultado = coeficiente_cambio_fase(mecanismo, fluido, T_sat, T_pared, D, **opciones)
+    resultado['T_pared'] = T_pared
+    resultado['valido'] = resultado['valido'] & sentido
+    return resultado
+
+
+# --- Intercambiador con un fluido en cambio de fase (C = 0) ---
+def intercambiador_cambio_fase(U, A, m, cp, T_entrada, T_sat, fluido_cambio_fase=None):
+    """
+    ε-NTU con C = 0: el fluido que cambia de fase está a T_sat y el otro tiene Cmin = m·cp.
+
+    Devuelve NTU, ε, Q (positivo si el fluido sensible se calienta), su temperatura de
+    salida y, si se indica el fluido en cambio de fase, el flujo condensado/evaporado Q/hfg.
+    """
+    U, A, m, cp, T_entrada, T_sat = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (U, A, m, cp, T_entrada, T_sat)))
+    C_min = m * cp
+    NTU = U * A / C_min
+    epsilon = efectividad_C_cero(NTU, 0.0)
+    Q = epsilon * C_min * (T_sat - T_entrada)
+    resultado = {'NTU': NTU, 'epsilon': epsilon, 'Q': Q, 'T_salida': T_entrada + Q / C_min}
+    if fluido_cambio_fase is not None:
+        resultado['m_cambio_fase'] = np.abs(Q) / (1000 * interpolar_propiedad(fluido_cambio_fase, 'h_fg', T_sat))
+    return resultado
@@ -0,0 +1,323 @@
+import numpy as np
+from functools import lru_cache
+from scipy.interpolate import RectBivariateSpline
+
+# Arreglos sin forma cerrada exacta: se describen con tuplas (claves de la caché)
+#   ('cruzado', mezclado_x, mezclado_y, pasos, contracorriente, Cmin_en_x)
+#   ('coraza', pasos_tubo, corazas, Cmin_en_tubos)
+
+
+def arreglo_cruzado(mezclado_x=False, mezclado_y=False, pasos=1, contracorriente=True, Cmin_en_x=True):
+    """
+    Flujo cruzado: el fluido X recorre `pasos` pasos (mezclado entre pasos) a través
+    del fluido Y, que atraviesa el banco una sola vez. mezclado_x / mezclado_y indican
+    si cada fluido se mezcla transversalmente dentro de un paso.
+    """
+    if mezclado_x and mezclado_y:
+        raise ValueError("Con ambos fluidos mezclados use la forma cerrada")
+    return ('cruzado', bool(mezclado_x), bool(mezclado_y), int(pasos), bool(contracorriente), bool(Cmin_en_x))
+
+
+def arreglo_coraza(pasos_tubo=2, corazas=1, Cmin_en_tubos=True):
+    """Coraza y tubos con `corazas` corazas en serie a contracorriente y `pasos_tubo` (par) pasos por coraza."""
+    if pasos_tubo < 2 or pasos_tubo % 2:
+        raise ValueError("El número de pasos de tubo por coraza debe ser par")
+    return ('coraza', int(pasos_tubo), int(corazas), bool(Cmin_en_tubos))
+
+
+# --- Flujo cruzado: malla 2-D de celdas ---
+def _razon(a):
+    """Factor de una celda de punto medio frente a una temperatura fija: (1 - a/2)/(1 + a/2)."""
+    return (1 - a / 2) / (1 + a / 2)
+
+
+def _ganancia_mezclado(a_sin_mezclar, a_mezclado, n):
+    """
+    Cambio del fluido mezclado en una franja de n celdas, por unidad de diferencia con
+    su temperatura media: (a_mezclado / a_sin_mezclar)·(1 - r^n)/n, con límite a_mezclado.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        g = a_mezclado / a_sin_mezclar * (1 - _razon(a_sin_mezclar)**n) / n
+    return np.where(a_sin_mezclar > 0, g, a_mezclado)
+
+
+def _bloque_cruzado(theta_x, theta_y, a_x, a_y, n, mezclado_x, mezclado_y):
+    """
+    Un paso de flujo cruzado en una malla n × n.
+
+    theta_x (B,): entrada de X, uniforme (cabezales mezclados); theta_y (B, n): entrada
+    de Y por columna. a_x, a_y (B,) son los NTU de una celda referidos al caudal de
+    X de una fila y al de Y de una columna. Devuelve la salida media de X y la de Y por columna.
+    """
+    if mezclado_x:
+        # X uniforme en cada columna: barrido en x; en la columna Y atraviesa n celdas
+        # frente a la temperatura media de X, con solución geométrica en y
+        g = _ganancia_mezclado(a_y, a_x, n)
+        razon_n = _razon(a_y)**n
+        theta_x, salida_y = theta_x.copy(), np.empty_like(theta_y)
+        for i in range(n):
+            caida = g * (theta_x - theta_y[:, i]) / (1 + g / 2)
+            media_x = theta_x - caida / 2
+            salida_y[:, i] = media_x - (media_x - theta_y[:, i]) * razon_n
+            theta_x = theta_x - caida
+        return theta_x, salida_y
+
+    if mezclado_y:
+        # Y uniforme en cada fila: barrido en y, solución geométrica en x
+        g = _ganancia_mezclado(a_x, a_y, n)
+        razon_n = _razon(a_x)**n
+        theta_y_fila = theta_y.mean(axis=1)
+        salida_x = np.zeros_like(theta_x)
+        for _ in range(n):
+            ganancia = g * (theta_x - theta_y_fila) / (1 + g / 2)
+            media_y = theta_y_fila + ganancia / 2
+            salida_x += (media_y + (theta_x - media_y) * razon_n) / n
+            theta_y_fila = theta_y_fila + ganancia
+        return salida_x, np.repeat(theta_y_fila[:, None], n, axis=1)
+
+    # Ambos sin mezclar: balance de cada celda con las temperaturas medias (punto medio),
+    # barrido por antidiagonales (las celdas i + j = d son independientes)
+    D = 1 + a_x / 2 + a_y / 2
+    k_x, k_y = (a_x / D)[:, None], (a_y / D)[:, None]
+    X = np.repeat(theta_x[:, None], n, axis=1)
+    Y = theta_y.copy()
+    for d in range(2 * n - 1):
+        i = np.arange(max(0, d - n + 1), min(d, n - 1) + 1)
+        j = d - i
+        delta = X[:, j] - Y[:, i]
+        X[:, j] -= k_x * delta
+        Y[:, i] += k_y * delta
+    return X.mean(axis=1), Y
+
+
+def _cruzado(NTU, C, n, arreglo):
+    _, mezclado_x, mezclado_y, pasos, contracorriente, Cmin_en_x = arreglo
+    NTU_x, NTU_y = (NTU, C * NTU) if Cmin_en_x else (C * NTU, NTU)
+    a_x, a_y = NTU_x / (n * pasos), NTU_y / (n * pasos)
+    B = NTU.size
+
+    # Superposición: corrida 0 con los pasos 2..P a temperatura de entrada 0 y una
+    # corrida por cada paso con entrada unitaria (el sistema es lineal)
+    entradas = np.zeros((pasos, B, pasos))
+    entradas[:, :, 0] = 1.0
+    for r in range(1, pasos):
+        entradas[r, :, r] = 1.0
+    entradas = entradas.reshape(pasos * B, pasos)
+    a_x, a_y = np.tile(a_x, pasos), np.tile(a_y, pasos)
+
+    theta_y = np.zeros((pasos * B, n))
+    salidas_x = np.zeros((pasos * B, pasos))
+    # Y entra por el bloque inferior: a contracorriente es el último paso de X
+    orden = range(pasos - 1, -1, -1) if contracorriente else range(pasos)
+    for p in orden:
+        invertido = p % 2 == 1
+        if invertido:
+            theta_y = theta_y[:, ::-1]
+        salidas_x[:, p], theta_y = _bloque_cruzado(entradas[:, p], theta_y, a_x, a_y, n, mezclado_x, mezclado_y)
+        if invertido:
+            theta_y = theta_y[:, ::-1]
+
+    salidas_x = salidas_x.reshape(pasos, B, pasos)
+    salida_y = theta_y.mean(axis=1).reshape(pasos, B)
+    salida_x = salidas_x[0, :, -1]
+    if pasos > 1:
+        # Cabezales: la entrada del paso p + 1 es la salida mezclada del paso p
+        base = salidas_x[0, :, :-1]
+        G = np.moveaxis(salidas_x[1:, :, :-1] - base, 0, -1)
+        u = np.linalg.solve(np.eye(pasos - 1) - G, base[..., None])[..., 0]
+        salida_x = salida_x + np.einsum('bk,kb->b', u, salidas_x[1:, :, -1] - salidas_x[0, :, -1])
+        salida_y = salida_y[0] + np.einsum('bk,kb->b', u, salida_y[1:] - salida_y[0])
+    else:
+        salida_y = salida_y[0]
+    return 1 - salida_x if Cmin_en_x else salida_y
+
+
+# --- Coraza y tubos: celdas axiales con la coraza mezclada en cada sección ---
+def _matriz_coraza(NTU_t, NTU_s, pasos):
+    """Matriz A de dy/dx = A·y con y = [θ_coraza, θ_paso1, ..., θ_pasoP] y x ∈ [0, 1]."""
+    B = NTU_t.size
+    A = np.zeros((B, pasos + 1, pasos + 1))
+    A[:, 0, 0] = -NTU_s
+    for p in range(1, pasos + 1):
+        sentido = 1 if p % 2 == 1 else -1
+        A[:, 0, p] = NTU_s / pasos
+        A[:, p, p] = -sentido * NTU_t / pasos
+        A[:, p, 0] = sentido * NTU_t / pasos
+    return A
+
+
+def _coraza(NTU, C, n, arreglo):
+    _, pasos, corazas, Cmin_en_tubos = arreglo
+    NTU = NTU / corazas
+    NTU_t, NTU_s = (NTU, C * NTU) if Cmin_en_tubos else (C * NTU, NTU)
+    A = _matriz_coraza(NTU_t, NTU_s, pasos)
+    I = np.eye(pasos + 1)
+
+    # Celdas de longitud 1/n con balance de punto medio (Crank-Nicolson); la matriz de
+    # transferencia de toda la coraza se obtiene elevando la de una celda por cuadrados
+    M = np.linalg.solve(I - A / (2 * n), I + A / (2 * n))
+    for _ in range(int(np.log2(n))):
+        M = M @ M
+
+    # Incógnitas: temperaturas en x = 0 de los pasos 2..P; el tubo entra a 1, la coraza a 0
+    m = pasos - 1
+    sistema = np.zeros((NTU.size, m, m))
+    lado_derecho = np.zeros((NTU.size, m))
+    fila = 0
+    for k in range(1, pasos // 2 + 1):
+        # Cabezal en x = 1: salida del paso 2k-1 = entrada del paso 2k
+        diferencia = M[:, 2 * k - 1, :] - M[:, 2 * k, :]
+        sistema[:, fila, :] = diferencia[:, 2:]
+        lado_derecho[:, fila] = -diferencia[:, 1]
+        fila += 1
+    for k in range(1, pasos // 2):
+        # Cabezal en x = 0: salida del paso 2k = entrada del paso 2k+1
+        sistema[:, fila, 2 * k - 2] = 1.0
+        sistema[:, fila, 2 * k - 1] = -1.0
+        fila += 1
+    u = np.linalg.solve(sistema, lado_derecho[..., None])[..., 0]
+
+    y0 = np.concatenate([np.zeros((NTU.size, 1)), np.ones((NTU.size, 1)), u], axis=1)
+    salida_coraza = np.einsum('bj,bj->b', M[:, 0, :], y0)
+    salida_tubo = u[:, -1]
+    epsilon_1 = 1 - salida_tubo if Cmin_en_tubos else salida_coraza
+    if corazas == 1:
+        return epsilon_1
+
+    # Corazas idénticas en serie a contracorriente
+    with np.errstate(divide="ignore", invalid="ignore"):
+        razon = ((1 - epsilon_1) / (1 - epsilon_1 * C))**corazas
+        general = (1 - razon) / (1 - C * razon)
+    unitario = corazas * epsilon_1 / (1 + (corazas - 1) * epsilon_1)
+    return np.where(np.isclose(C, 1.0), unitario, general)
+
+
+_SOLUCIONADORES = {'cruzado': (_cruzado, 4, 512), 'coraza': (_coraza, 8, 2**14)}
+
+
+def efectividad_celdas(NTU, C, arreglo, tol=1e-7):
+    """
+    ε(NTU, C) del arreglo por el método de celdas, con la tolerancia pedida.
+
+    Los esquemas de punto medio tienen error en potencias pares del tamaño de celda,
+    por lo que la malla se duplica y se extrapola por Romberg; solo se refinan los
+    casos no convergidos. Devuelve un diccionario con 'epsilon', 'error' (estimado
+    como la diferencia entre las dos últimas extrapolaciones) y 'n' (celdas por
+    dirección y por paso de la malla más fina).
+    """
+    NTU, C = np.broadcast_arrays(np.asarray(NTU, dtype=float), np.asarray(C, dtype=float))
+    forma = NTU.shape
+    NTU, C = NTU.ravel(), C.ravel()
+    solucionador, n, n_max = _SOLUCIONADORES[arreglo[0]]
+
+    epsilon = np.where(NTU == 0, 0.0, np.nan)
+    error = np.where(NTU == 0, 0.0, np.inf)
+    celdas = np.zeros(NTU.shape, dtype=int)
+    pendientes = np.flatnonzero(NTU > 0)
+
+    anterior = [solucionador(NTU[pendientes], C[pendientes], n, arreglo)]
+    while pendientes.size and n < n_max:
+        n *= 2
+        fila = [solucionador(NTU[pendientes], C[pendientes], n, arreglo)]
+        for j, valor in enumerate(anterior, start=1):
+            fila.append(fila[-1] + (fila[-1] - valor) / (4**j - 1))
+        estimado = np.abs(fila[-1] - anterior[-1])
+        epsilon[pendientes], error[pendientes], celdas[pendientes] = fila[-1], estimado, n
+        convergido = estimado < tol
+        pendientes = pendientes[~convergido]
+        anterior = [valor[~convergido] for valor in fila]
+
+    return {'epsilon': epsilon.reshape(forma), 'error': error.reshape(forma), 'n': celdas.reshape(forma)}
+
+
+# --- Tablas ε(NTU, C) por arreglo ---
+NTU_TABLA = np.geomspace(1e-3, 100.0, 121)
+C_TABLA = np.linspace(0.0, 1.0, 41)
+TOLERANCIA_TABLA = 1e-7
+
+
+@lru_cache(maxsize=None)
+def tabla_efectividad(arreglo):
+    """
+    Interpolante bicúbico de ε sobre (ln NTU, C), resuelto una sola vez por arreglo y proceso.
+
+    Armarla toma a lo sumo un par de segundos; después cada consulta cuesta lo
+    mismo que una forma cerrada.
+    """
+    NTU, C = np.meshgrid(NTU_TABLA, C_TABLA, indexing="ij")
+    epsilon = efectividad_celdas(NTU, C, arreglo, tol=TOLERANCIA_TABLA)['epsilon']
+    return RectBivariateSpline(np.log(NTU_TABLA), C_TABLA, epsilon)
+
+
+def efectividad_arreglo(arreglo, NTU, C):
+    """
+    ε(NTU, C) del arreglo desde su tabla; fuera del rango tabulado se resuelve la malla.
+
+    Admite entradas complejas (paso complejo): la parte imaginaria se obtiene de las
+    derivadas del interpolante.
+    """
+    NTU, C = np.broadcast_arrays(np.asarray(NTU), np.asarray(C))
+    NTU_r, C_r = np.real(NTU).astype(float), np.real(C).astype(float)
+    dentro = (NTU_r >= NTU_TABLA[0]) & (NTU_r <= NTU_TABLA[-1])
+    tabla = tabla_efectividad(arreglo)
+
+    x = np.log(np.where(dentro, NTU_r, 1.0))
+    epsilon = tabla.ev(x, C_r)
+    if np.iscomplexobj(NTU) or np.iscomplexobj(C):
+        epsilon = epsilon + 1j * (tabla.ev(x, C_r, dx=1) * np.imag(NTU) / np.where(dentro, NTU_r, 1.0)
+                                  + tabla.ev(x, C_r, dy=1) * np.imag(C))
+    if not np.all(dentro):
+        epsilon = np.asarray(epsilon, dtype=epsilon.dtype)
+        epsilon[~dentro] = efectividad_celdas(NTU_r[~dentro], C_r[~dentro], arreglo)['epsilon']
+    return epsilon[()] if epsilon.ndim == 0 else epsilon
+
+
+def _pico_tabla(arreglo, C):
+    """
+    Máximo tabulado de ε para cada C y el ln NTU en que se alcanza.
+
+    Es la fuente común de ε_max: la factibilidad (efectividad_maxima_arreglo) y la
+    inversión (ntu_arreglo) evalúan el mismo interpolante en los mismos puntos.
+    """
+    C = np.asarray(C, dtype=float)
+    tabla = tabla_efectividad(arreglo)
+    # grid=True exige C creciente: se evalúa sobre los valores únicos
+    C_unicos, inversa = np.unique(C, return_inverse=True)
+    indice = tabla(np.log(NTU_TABLA), C_unicos, grid=True).argmax(axis=0)
+    x_pico = np.log(NTU_TABLA)[indice][inversa].reshape(C.shape)
+    return x_pico, tabla.ev(x_pico, C)
+
+
+def efectividad_maxima_arreglo(arreglo, C):
+    """Mayor ε alcanzable en el rango tabulado (el máximo puede ser interior con pasos en paralelo)."""
+    return _pico_tabla(arreglo, C)[1]
+
+
+def ntu_arreglo(arreglo, epsilon, C, iteraciones=60):
+    """
+    NTU(ε, C) invirtiendo la tabla por bisección vectorizada sobre ln NTU.
+
+    Se toma la raíz de la rama creciente, entre el primer punto de la tabla y el
+    máximo de _pico_tabla; ε = ε_max todavía es factible (el dimensionamiento exige
+    ε < ε_max, lo que deja margen). Si ε no es alcanzable se devuelve NaN.
+    Con entradas complejas la parte imaginaria sale de la derivada implícita.
+    """
+    epsilon, C = np.broadcast_arrays(np.asarray(epsilon), np.asarray(C))
+    epsilon_r, C_r = np.real(epsilon).astype(float), np.real(C).astype(float)
+    tabla = tabla_efectividad(arreglo)
+
+    x_min = np.full(epsilon_r.shape, np.log(NTU_TABLA[0]))
+    x_max, epsilon_max = _pico_tabla(arreglo, C_r)
+    factible = (epsilon_r > tabla.ev(x_min, C_r)) & (epsilon_r <= epsilon_max)
+    for _ in range(iteraciones):
+        x = (x_min + x_max) / 2
+        debajo = tabla.ev(x, C_r) < epsilon_r
+        x_min = np.where(debajo, x, x_min)
+        x_max = np.where(debajo, x_max, x)
+    x = (x_min + x_max) / 2
+    NTU = np.where(factible, np.exp(x), np.nan)
+
+    if np.iscomplexobj(epsilon) or np.iscomplexobj(C):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            NTU = NTU + 1j * (np.imag(epsilon) - tabla.ev(x, C_r, dy=1) * np.imag(C)) * NTU / tabla.ev(x, C_r, dx=1)
+    return NTU[()] if NTU.ndim == 0 else NTU
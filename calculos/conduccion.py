@@ -0,0 +1,125 @@
+import numpy as np
+
+SIGMA_SB = 5.670374419e-8  # W/m²K⁴
+KELVIN = 273.15
+
+
+# --- Resistencias de la pared multicapa ---
+def capas_desde_argumentos(capas):
+    """Listas de k y espesores a partir de argumentos k_1, e_1, k_2, e_2, ..."""
+    n_capas = len([nombre for nombre in capas if nombre.startswith("k_")])
+    return [capas[f"k_{i + 1}"] for i in range(n_capas)], [capas[f"e_{i + 1}"] for i in range(n_capas)]
+
+
+def resistencias_capas(geometria, k, e, A=None, L_cil=None, r_interior=None):
+    """
+    Resistencia de conducción de cada capa y áreas de las superficies interior y exterior.
+
+    Plana: área A; cilíndrica: longitud L_cil; cilíndrica y esférica: radio interior r_interior.
+    """
+    if geometria == "Plana":
+        return {'R_capas': [e_i / (k_i * A) for k_i, e_i in zip(k, e)], 'A_in': A, 'A_out': A}
+    radios = [r_interior]
+    for e_i in e:
+        radios.append(radios[-1] + e_i)
+    if geometria == "Cilíndrica":
+        R_capas = [np.log(r_o / r_i) / (2 * np.pi * L_cil * k_i) for r_i, r_o, k_i in zip(radios, radios[1:], k)]
+        return {'R_capas': R_capas, 'A_in': 2 * np.pi * radios[0] * L_cil, 'A_out': 2 * np.pi * radios[-1] * L_cil}
+    R_capas = [(1 / (4 * np.pi * k_i)) * (1 / r_i - 1 / r_o) for r_i, r_o, k_i in zip(radios, radios[1:], k)]
+    return {'R_capas': R_capas, 'A_in': 4 * np.pi * radios[0]**2, 'A_out': 4 * np.pi * radios[-1]**2}
+
+
+def coeficiente_radiacion(emisividad, T_superficie, T_alrededores):
+    """h_rad = ε·σ·(Ts + Talr)·(Ts² + Talr²) (W/m²K), con temperaturas en °C."""
+    Ts, Ta = T_superficie + KELVIN, T_alrededores + KELVIN
+    return emisividad * SIGMA_SB * (Ts + Ta) * (Ts**2 + Ta**2)
+
+
+# --- Superficies con convección y radiación ---
+def pared_conveccion_radiacion(geometria, T1, T2, h_in=0.0, h_out=0.0, emisividad_in=0.0, emisividad_out=0.0,
+                               T_alr_in=None, T_alr_out=None, A=None, L_cil=None, r_interior=None,
+                               R_exterior=None, tol=1e-10, max_iter=50, **capas):
+    """
+    Pared multicapa con convección y radiación en ambas superficies, evaluada sobre arreglos.
+
+    Cada superficie intercambia por convección con su fluido (T1 adentro, T2 afuera) y
+    por radiación con alrededores a T_alr (por defecto la temperatura del fluido):
+        h_in·A_in·(T1 - Ts1) + ε_in·σ·A_in·(Talr_in⁴ - Ts1⁴) = (Ts1 - Ts2)/R_cond
+        (Ts1 - Ts2)/R_cond = h_out·A_out·(Ts2 - T2) + ε_out·σ·A_out·(Ts2⁴ - Talr_out⁴)
+    Las temperaturas de superficie se resuelven con Newton vectorizado (sistema 2×2 por
+    caso), partiendo de la radiación linealizada. Una superficie sin convección ni
+    radiación queda a la temperatura del fluido, como en el cálculo solo conductivo.
+    R_exterior (superficie aletada) reemplaza a la convección exterior y debe ser positiva;
+    sin convección exterior se omite. La radiación se toma sobre el área exterior lisa.
+
+    Temperaturas en °C. Devuelve q, las temperaturas de superficie y de cada interfaz
+    (T_interfaces[0] = Ts1, T_interfaces[-1] = Ts2), el desglose del calor y h_rad.
+    """
+    if R_exterior is not None and not np.all(np.real(R_exterior) > 0):
+        raise ValueError("R_exterior debe ser positiva; sin convección exterior no se indica")
+
+    k, e = capas_desde_argumentos(capas)
+    geometria_pared = resistencias_capas(geometria, k, e, A, L_cil, r_interior)
+    R_cond = sum(geometria_pared['R_capas'])
+    A_in, A_out = geometria_pared['A_in'], geometria_pared['A_out']
+
+    T_alr_in = T1 if T_alr_in is None else T_alr_in
+    T_alr_out = T2 if T_alr_out is None else T_alr_out
+    T1, T2, Ta1, Ta2 = (np.asarray(T) + KELVIN for T in (T1, T2, T_alr_in, T_alr_out))
+    h_in, h_out = np.asarray(h_in), np.asarray(h_out)
+
+    # Conductancias de convección y coeficientes de radiación de cada superficie
+    a1 = np.where(np.real(h_in) > 0, h_in * A_in, 0.0)
+    if R_exterior is None:
+        a2 = np.where(np.real(h_out) > 0, h_out * A_out, 0.0)
+    else:
+        a2 = 1 / np.asarray(R_exterior)
+    r1 = emisividad_in * SIGMA_SB * A_in
+    r2 = emisividad_out * SIGMA_SB * A_out
+    g = 1 / R_cond
+    T1, T2, Ta1, Ta2, a1, a2, r1, r2, g = np.broadcast_arrays(T1, T2, Ta1, Ta2, a1, a2, r1, r2, g)
+    activa_in = (np.real(a1) > 0) | (np.real(r1) > 0)
+    activa_out = (np.real(a2) > 0) | (np.real(r2) > 0)
+
+    # Valor inicial: radiación linealizada alrededor de la temperatura de los alrededores
+    b1, b2 = a1 + 4 * r1 * Ta1**3, a2 + 4 * r2 * Ta2**3
+    c1, c2 = a1 * T1 + 4 * r1 * Ta1**4, a2 * T2 + 4 * r2 * Ta2**4
+
+    def resolver_2x2(J11, J12, J21, J22, F1, F2):
+        # Superficies inactivas: la ecuación pasa a ser Ts - T_fluido = 0
+        J11, J12, F1 = np.where(activa_in, J11, 1.0), np.where(activa_in, J12, 0.0), np.where(activa_in, F1, 0.0)
+        J22, J21, F2 = np.where(activa_out, J22, 1.0), np.where(activa_out, J21, 0.0), np.where(activa_out, F2, 0.0)
+        det = J11 * J22 - J12 * J21
+        return (F1 * J22 - J12 * F2) / det, (J11 * F2 - F1 * J21) / det
+
+    x1, x2 = resolver_2x2(b1 + g, -g, -g, b2 + g, c1, c2)
+    x1, x2 = np.where(activa_in, x1, T1), np.where(activa_out, x2, T2)
+
+    convergido = np.zeros(x1.shape, dtype=bool)
+    for _ in range(max_iter):
+        F1 = a1 * (T1 - x1) + r1 * (Ta1**4 - x1**4) - g * (x1 - x2)
+        F2 = g * (x1 - x2) - a2 * (x2 - T2) - r2 * (x2**4 - Ta2**4)
+        paso1, paso2 = resolver_2x2(-a1 - 4 * r1 * x1**3 - g, g, g, -g - a2 - 4 * r2 * x2**3, F1, F2)
+        # Amortiguado para no cruzar el cero absoluto en el primer paso
+        x1 = np.where(np.real(x1 - paso1) > 0, x1 - paso1, np.real(x1) / 2)
+        x2 = np.where(np.real(x2 - paso2) > 0, x2 - paso2, np.real(x2) / 2)
+        convergido = (np.abs(np.real(paso1)) < tol * np.real(x1)) & (np.abs(np.real(paso2)) < tol * np.real(x2))
+        if np.all(convergido):
+            break
+
+    q = g * (x1 - x2)
+    T_interfaces = [x1 - KELVIN]
+    for R_capa in geometria_pared['R_capas']:
+        T_interfaces.append(T_interfaces[-1] - q * R_capa)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        R_total = (T1 - T2) / q
+    return {
+        'q': q, 'R_total': R_total, 'R_conduccion': R_cond,
+        'T_superficie_in': x1 - KELVIN, 'T_superficie_out': x2 - KELVIN,
+        'T_interfaces': np.stack(np.broadcast_arrays(*T_interfaces)),
+        'q_conveccion_in': a1 * (T1 - x1), 'q_radiacion_in': r1 * (Ta1**4 - x1**4),
+        'q_conveccion_out': a2 * (x2 - T2), 'q_radiacion_out': r2 * (x2**4 - Ta2**4),
+        'h_rad_in': coeficiente_radiacion(emisividad_in, x1 - KELVIN, Ta1 - KELVIN),
+        'h_rad_out': coeficiente_radiacion(emisividad_out, x2 - KELVIN, Ta2 - KELVIN),
+        'convergido': convergido,
+    }
@@ -0,0 +1,165 @@
+import numpy as np
+from calculos.doble_tubo import coeficiente_global
+from calculos.efectividad import FUNCIONES_NTU, efectividad_maxima
+from calculos.flujo_interno import CORRELACIONES_CON_LONGITUD
+from calculos.hidraulica import hidraulica_doble_tubo
+from calculos.propiedades import interpolar_propiedad, derivada_propiedad
+
+TIPO_C_CERO = "Caso especial (C=0): Evaporación/Condensación"
+
+
+def _temperaturas_salida(fluido, fase, m, T_entrada, Q, signo, reevaluar, tol, max_iter):
+    """
+    Temperatura de salida que cumple m·cp(Tm)·|T_entrada - T_salida| = Q.
+
+    signo = +1 para el fluido caliente (se enfría) y -1 para el frío. Con
+    reevaluación, cp se toma a la temperatura media y se resuelve con Newton
+    vectorizado usando la derivada analítica del interpolante de cp.
+    """
+    cp = interpolar_propiedad(fluido, 'cp', T_entrada, fase)
+    T_salida = T_entrada - signo * Q / (m * cp)
+    convergido = np.ones(T_salida.shape, dtype=bool)
+    if not reevaluar:
+        return T_salida, convergido
+
+    for _ in range(max_iter):
+        T_media = (T_entrada + T_salida) / 2
+        cp = interpolar_propiedad(fluido, 'cp', T_media, fase)
+        dcp = derivada_propiedad(fluido, 'cp', T_media, fase)
+        salto = signo * (T_entrada - T_salida)
+        residuo = m * cp * salto - Q
+        jacobiano = m * (dcp / 2 * salto - signo * cp)
+        paso = residuo / jacobiano
+        T_salida = T_salida - paso
+        convergido = np.abs(paso) < tol * (1 + np.abs(T_salida))
+        if np.all(convergido):
+            break
+    return T_salida, convergido
+
+
+def dimensionar(fluido_caliente, fluido_frio, m_caliente, m_frio, T_caliente_entrada, T_frio_entrada,
+                Di, Do, Q=None, T_caliente_salida=None, T_frio_salida=None,
+                tipo="Flujo en contraflujo (doble tubo)", caliente_en_tubo=True,
+                fase_caliente="líquido", fase_frio="líquido", reevaluar_propiedades=True, lado_cambio_fase=None,
+                tol=1e-10, max_iter=30, opciones_hidraulica=None, **opciones_U):
+    """
+    Área y longitud requeridas para una carga térmica objetivo, sobre arreglos.
+
+    La especificación es Q (W), T_caliente_salida o T_frio_salida (°C). Se
+    calculan las temperaturas de salida, U con las correlaciones de doble tubo
+    a las temperaturas medias, ε = Q/Qmax y NTU con la inversa ε-NTU del tipo
+    de intercambiador. Los casos con ε fuera de (0, ε_max(C)) se marcan como
+    no factibles y su área queda en NaN. Con la longitud obtenida se evalúan la
+    caída de presión y la potencia de bombeo de cada fluido.
+
+    En el caso C = 0, lado_cambio_fase ("caliente" o "frío") indica el fluido que
+    cambia de fase: su temperatura no varía y C_min es el m·cp del otro fluido.
+    Si la correlación laminar depende de la longitud (Hausen, Shah-London), U se
+    reevalúa con la longitud estimada hasta que esta converge.
+    """
+    C_cero = tipo == TIPO_C_CERO
+    if C_cero and lado_cambio_fase not in ("caliente", "frío"):
+        raise ValueError("El caso C = 0 requiere lado_cambio_fase: 'caliente' o 'frío'")
+    if C_cero and (T_caliente_salida if lado_cambio_fase == "caliente" else T_frio_salida) is not None:
+        raise ValueError("La temperatura del fluido que cambia de fase es constante: especifique Q "
+                         "o la salida del otro fluido")
+
+    # La especificación también define la forma del lote (p. ej. caudales escalares y un arreglo de objetivos)
+    especificacion = next((v for v in (Q, T_caliente_salida, T_frio_salida) if v is not None), 0.0)
+    m_h, m_c, Th_in, Tc_in, _ = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float)
+          for v in (m_caliente, m_frio, T_caliente_entrada, T_frio_entrada, especificacion)))
+
+    # --- Carga térmica objetivo ---
+    if Q is not None:
+        Q = np.broadcast_to(np.asarray(Q, dtype=float), m_h.shape)
+    elif T_caliente_salida is not None:
+        Th_out = np.asarray(T_caliente_salida, dtype=float)
+        T_cp = (Th_in + Th_out) / 2 if reevaluar_propiedades else Th_in
+        Q = m_h * interpolar_propiedad(fluido_caliente, 'cp', T_cp, fase_caliente) * (Th_in - Th_out)
+    elif T_frio_salida is not None:
+        Tc_out = np.asarray(T_frio_salida, dtype=float)
+        T_cp = (Tc_in + Tc_out) / 2 if reevaluar_propiedades else Tc_in
+        Q = m_c * interpolar_propiedad(fluido_frio, 'cp', T_cp, fase_frio) * (Tc_out - Tc_in)
+    else:
+        raise ValueError("Debe especificarse Q, T_caliente_salida o T_frio_salida")
+
+    # --- Temperaturas de salida (el fluido que cambia de fase la conserva) ---
+    sin_cambio = np.ones(m_h.shape, dtype=bool)
+    if C_cero and lado_cambio_fase == "caliente":
+        Th_out, conv_h = Th_in, sin_cambio
+    else:
+        Th_out, conv_h = _temperaturas_salida(fluido_caliente, fase_caliente, m_h, Th_in, Q, 1,
+                                              reevaluar_propiedades, tol, max_iter)
+    if C_cero and lado_cambio_fase == "frío":
+        Tc_out, conv_c = Tc_in, sin_cambio
+    else:
+        Tc_out, conv_c = _temperaturas_salida(fluido_frio, fase_frio, m_c, Tc_in, Q, -1,
+                                              reevaluar_propiedades, tol, max_iter)
+
+    # --- Capacidades y efectividad requerida ---
+    Th_cp = (Th_in + Th_out) / 2 if reevaluar_propiedades else Th_in
+    Tc_cp = (Tc_in + Tc_out) / 2 if reevaluar_propiedades else Tc_in
+    C_h = m_h * interpolar_propiedad(fluido_caliente, 'cp', Th_cp, fase_caliente)
+    C_c = m_c * interpolar_propiedad(fluido_frio, 'cp', Tc_cp, fase_frio)
+    if C_cero:
+        # La capacidad del fluido que cambia de fase es infinita
+        C_min = C_c if lado_cambio_fase == "caliente" else C_h
+        C = np.zeros_like(C_min)
+    else:
+        C_min = np.minimum(C_h, C_c)
+        C = C_min / np.maximum(C_h, C_c)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        epsilon = Q / (C_min * (Th_in - Tc_in))
+    epsilon_max = efectividad_maxima(tipo, C)
+
+    factible = (epsilon > 0) & (epsilon < epsilon_max) & conv_h & conv_c
+    with np.errstate(divide="ignore", invalid="ignore"):
+        NTU = np.where(factible, FUNCIONES_NTU[tipo](np.where(factible, epsilon, 0.5), C), np.nan)
+
+    # --- Coeficiente global a las temperaturas medias ---
+    Th_media, Tc_media = (Th_in + Th_out) / 2, (Tc_in + Tc_out) / 2
+
+    def coeficiente(L, **opciones):
+        if caliente_en_tubo:
+            return coeficiente_global(fluido_caliente, fluido_frio, Th_media, Tc_media, m_h, m_c, Di, Do,
+                                      fase_caliente, fase_frio, L=L, con_hidraulica=False, **opciones)
+        return coeficiente_global(fluido_frio, fluido_caliente, Tc_media, Th_media, m_c, m_h, Di, Do,
+                                  fase_frio, fase_caliente, L=L, con_hidraulica=False, **opciones)
+
+    def longitud(U):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            A = NTU * C_min / U
+        return A, A / (np.pi * np.asarray(Di, dtype=float))
+
+    # Las correlaciones de desarrollo térmico parten de la estimación con Nu desarrollado
+    depende_de_L = opciones_U.get('correlacion_laminar') in CORRELACIONES_CON_LONGITUD
+    opciones_iniciales = {**opciones_U, 'correlacion_laminar': "laminar desarrollado"} if depende_de_L else opciones_U
+    resultado_U = coeficiente(None, **opciones_iniciales)
+    A, L = longitud(resultado_U['U'])
+    if depende_de_L:
+        for _ in range(max_iter):
+            # Los casos no factibles (L = NaN) se evalúan con una longitud cualquiera
+            resultado_U = coeficiente(np.where(np.isfinite(L) & (L > 0), L, 1.0), **opciones_U)
+            A, L_nueva = longitud(resultado_U['U'])
+            convergido = ~(np.abs(L_nueva - L) > tol * np.abs(L_nueva))
+            L = L_nueva
+            if np.all(convergido):
+                break
+    U = resultado_U['U']
+    factible = factible & np.isfinite(U) & (U > 0)
+
+    # --- Caída de presión a la longitud requerida ---
+    hidraulica = hidraulica_doble_tubo(resultado_U['Re_int'], resultado_U['Re_ext'],
+                                       resultado_U['velocidad_int'], resultado_U['velocidad_ext'],
+                                       resultado_U['props_int']['densidad'], resultado_U['props_ext']['densidad'],
+                                       Di, Do, L, **(opciones_hidraulica or {}))
+    lado_caliente, lado_frio = ('int', 'ext') if caliente_en_tubo else ('ext', 'int')
+
+    return {
+        'A': A, 'L': L, 'NTU': NTU, 'epsilon': epsilon, 'epsilon_max': epsilon_max,
+        'C': C, 'U': U, 'Q': Q, 'T_caliente_salida': Th_out, 'T_frio_salida': Tc_out,
+        'delta_p_caliente': hidraulica[lado_caliente]['delta_p'], 'delta_p_frio': hidraulica[lado_frio]['delta_p'],
+        'potencia_caliente': hidraulica[lado_caliente]['potencia'], 'potencia_frio': hidraulica[lado_frio]['potencia'],
+        'factible': factible,
+    }
@@ -0,0 +1,82 @@
+import numpy as np
+from calculos.anulo import nu_anulo, diametro_hidraulico
+from calculos.cambio_fase import temperatura_pared, verificar_lados
+from calculos.flujo_interno import nusselt_interno
+from calculos.hidraulica import hidraulica_doble_tubo
+from calculos.propiedades import propiedades
+
+
+def coeficiente_global(fluido_int, fluido_ext, T_int, T_ext, m_int, m_ext, Di, Do,
+                       fase_int="líquido", fase_ext="líquido", L=None,
+                       correlacion_laminar="laminar desarrollado", correlacion_turbulenta="gnielinski",
+                       n=0.4, caso_anulo="pared interna calentada", razon_flujos=1.0,
+                       cambio_fase_int=None, cambio_fase_ext=None, opciones_cambio_fase=None,
+                       opciones_hidraulica=None, con_hidraulica=True):
+    """
+    U de un intercambiador de doble tubo evaluado sobre arreglos.
+
+    Mismo modelo que la página de coeficiente global: 1/U = 1/h_int + 1/h_ext,
+    con h_int de flujo interno y h_ext del anulo basado en Dh = Do - Di.
+    Los caudales son másicos (kg/s) y las temperaturas medias de cada fluido (°C).
+    Con caso_anulo "ambas paredes calentadas", razon_flujos = q''o/q''i.
+
+    Con cambio_fase_int o cambio_fase_ext (un mecanismo de calculos.cambio_fase)
+    ese lado condensa o hierve a su temperatura, tomada como T_sat, y su h se
+    acopla al del otro lado a través de la temperatura de pared.
+
+    Si se indica la longitud L también se devuelven, en 'hidraulica', el factor de
+    fricción, la caída de presión y la potencia de bombeo de cada lado
+    (opciones_hidraulica pasa a hidraulica_doble_tubo). El lado con cambio de
+    fase se evalúa como líquido en una sola fase. Con con_hidraulica=False L
+    solo interviene en las correlaciones de desarrollo térmico.
+    """
+    verificar_lados(cambio_fase_int, cambio_fase_ext)
+    opciones_cambio_fase = opciones_cambio_fase or {}
+    props_int = propiedades(fluido_int, T_int, fase_int)
+    props_ext = propiedades(fluido_ext, T_ext, fase_ext)
+    Di, Do = np.asarray(Di, dtype=float), np.asarray(Do, dtype=float)
+
+    # Lado tubo
+    area_int = np.pi * Di**2 / 4
+    velocidad_int = m_int / (props_int['densidad'] * area_int)
+    Re_int = velocidad_int * Di * props_int['densidad'] / props_int['viscosidad']
+    nu_int = nusselt_interno(Re_int, props_int['Pr'], D=Di, L=L,
+                             correlacion_laminar=correlacion_laminar,
+                             correlacion_turbulenta=correlacion_turbulenta, n=n)
+    h_int = nu_int['Nu'] * props_int['k'] / Di
+
+    # Lado anulo
+    D_h = diametro_hidraulico(Di, Do)
+    area_ext = np.pi * (Do**2 - Di**2) / 4
+    velocidad_ext = m_ext / (props_ext['densidad'] * area_ext)
+    Re_ext = velocidad_ext * D_h * props_ext['densidad'] / props_ext['viscosidad']
+    nu_ext = nu_anulo(Re_ext, props_ext['Pr'], Di / Do, caso=caso_anulo, razon_flujos=razon_flujos)
+    Nu_ext = nu_ext['Nuo'] if caso_anulo == "pared externa calentada" else nu_ext['Nui']
+    h_ext = Nu_ext * props_ext['k'] / D_h
+
+    # Lado con cambio de fase
+    cambio_fase = None
+    if cambio_fase_int is not None:
+        cambio_fase = temperatura_pared(cambio_fase_int, fluido_int, T_int, T_ext, h_ext, Di, **opciones_cambio_fase)
+        h_int = cambio_fase['h']
+    elif cambio_fase_ext is not None:
+        cambio_fase = temperatura_pared(cambio_fase_ext, fluido_ext, T_ext, T_int, h_int, Di, **opciones_cambio_fase)
+        h_ext = cambio_fase['h']
+
+    # Caída de presión con los mismos arreglos de casos
+    hidraulica = None
+    if L is not None and con_hidraulica:
+        hidraulica = hidraulica_doble_tubo(Re_int, Re_ext, velocidad_int, velocidad_ext,
+                                           props_int['densidad'], props_ext['densidad'], Di, Do, L,
+                                           **(opciones_hidraulica or {}))
+
+    U = 1 / (1 / h_int + 1 / h_ext)
+    return {
+        'U': U, 'h_int': h_int, 'h_ext': h_ext,
+        'Re_int': Re_int, 'Re_ext': Re_ext,
+        'velocidad_int': velocidad_int, 'velocidad_ext': velocidad_ext,
+        'Nu_int': nu_int['Nu'], 'Nu_ext': Nu_ext,
+        'valido_int': nu_int['valido'],
+        'props_int': props_int, 'props_ext': props_ext,
+        'cambio_fase': cambio_fase, 'hidraulica': hidraulica,
+    }
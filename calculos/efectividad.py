@@ -0,0 +1,149 @@
+import numpy as np
+from calculos.celdas import (arreglo_coraza, arreglo_cruzado, efectividad_arreglo, efectividad_maxima_arreglo,
+                             ntu_arreglo)
+
+# --- Funciones para calcular ε dado NTU (vectorizadas) ---
+def efectividad_paralelo(NTU, C):
+    return (1 - np.exp(-NTU * (1 + C))) / (1 + C)
+
+def efectividad_contraflujo(NTU, C):
+    NTU, C = np.broadcast_arrays(np.asarray(NTU), np.asarray(C))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        general = (1 - np.exp(-NTU * (1 - C))) / (1 - C * np.exp(-NTU * (1 - C)))
+    resultado = np.where(np.real(C) == 1, NTU / (1 + NTU), general)
+    return resultado[()] if resultado.ndim == 0 else resultado
+
+def efectividad_coraza_tubos(NTU, C):
+    gamma = NTU * np.sqrt(1 + C**2)
+    return 2 / (1 + C + np.sqrt(1 + C**2) * (1 + np.exp(-gamma)) / (1 - np.exp(-gamma)))
+
+def efectividad_cruzado_Cmax_mezclado(NTU, C):
+    return (1 / C) * (1 - np.exp(-C * (1 - np.exp(-NTU))))
+
+def efectividad_cruzado_Cmin_mezclado(NTU, C):
+    return 1 - np.exp(-(1 / C) * (1 - np.exp(-C * NTU)))
+
+def efectividad_cruzado_no_mezclado(NTU, C):
+    """Sin forma cerrada: tabla del método de celdas (calculos.celdas)."""
+    return efectividad_arreglo(arreglo_cruzado(), NTU, C)
+
+def efectividad_C_cero(NTU, _):
+    return 1 - np.exp(-NTU)
+
+
+# --- Funciones para calcular NTU dado ε (forma cerrada cuando existe) ---
+def ntu_paralelo(epsilon, C):
+    return -np.log(1 - epsilon * (1 + C)) / (1 + C)
+
+def ntu_contraflujo(epsilon, C):
+    epsilon, C = np.broadcast_arrays(np.asarray(epsilon), np.asarray(C))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        general = np.log((epsilon - 1) / (epsilon * C - 1)) / (C - 1)
+        unitario = epsilon / (1 - epsilon)
+    return np.where(np.real(C) == 1, unitario, general)
+
+def ntu_coraza_tubos(epsilon, C):
+    E = (2 / epsilon - (1 + C)) / np.sqrt(1 + C**2)
+    return -np.log((E - 1) / (E + 1)) / np.sqrt(1 + C**2)
+
+def ntu_cruzado_Cmax_mezclado(epsilon, C):
+    return -np.log(1 + np.log(1 - epsilon * C) / C)
+
+def ntu_cruzado_Cmin_mezclado(epsilon, C):
+    return -np.log(C * np.log(1 - epsilon) + 1) / C
+
+def ntu_cruzado_no_mezclado(epsilon, C):
+    """Sin forma cerrada: inversa de la tabla del método de celdas."""
+    return ntu_arreglo(arreglo_cruzado(), epsilon, C)
+
+def ntu_C_cero(epsilon, _):
+    return -np.log(1 - epsilon)
+
+
+# --- Efectividad asintótica (NTU → ∞) ---
+def efectividad_maxima(tipo, C, **configuracion):
+    arreglo = arreglo_numerico(tipo, **configuracion)
+    if arreglo is not None:
+        return efectividad_maxima_arreglo(arreglo, C)
+    C = np.asarray(C, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        limites = {
+            "Flujo paralelo (doble tubo)": 1 / (1 + C),
+            "Flujo en contraflujo (doble tubo)": np.ones_like(C),
+            "Coraza y tubos (1-2, 1-4, ...)": 2 / (1 + C + np.sqrt(1 + C**2)),
+            "Flujo cruzado: Cmax mezclado, Cmin no mezclado": np.where(C > 0, (1 - np.exp(-C)) / C, 1.0),
+            "Flujo cruzado: Cmax no mezclado, Cmin mezclado": 1 - np.exp(-1 / C),
+            "Caso especial (C=0): Evaporación/Condensación": np.ones_like(C),
+        }
+    return limites[tipo]
+
+
+# Mapeo de funciones
+FUNCIONES_EFECTIVIDAD = {
+    "Flujo paralelo (doble tubo)": efectividad_paralelo,
+    "Flujo en contraflujo (doble tubo)": efectividad_contraflujo,
+    "Coraza y tubos (1-2, 1-4, ...)": efectividad_coraza_tubos,
+    "Flujo cruzado: Cmax mezclado, Cmin no mezclado": efectividad_cruzado_Cmax_mezclado,
+    "Flujo cruzado: Cmax no mezclado, Cmin mezclado": efectividad_cruzado_Cmin_mezclado,
+    "Flujo cruzado: Ambos no mezclados": efectividad_cruzado_no_mezclado,
+    "Caso especial (C=0): Evaporación/Condensación": efectividad_C_cero
+}
+
+FUNCIONES_NTU = {
+    "Flujo paralelo (doble tubo)": ntu_paralelo,
+    "Flujo en contraflujo (doble tubo)": ntu_contraflujo,
+    "Coraza y tubos (1-2, 1-4, ...)": ntu_coraza_tubos,
+    "Flujo cruzado: Cmax mezclado, Cmin no mezclado": ntu_cruzado_Cmax_mezclado,
+    "Flujo cruzado: Cmax no mezclado, Cmin mezclado": ntu_cruzado_Cmin_mezclado,
+    "Flujo cruzado: Ambos no mezclados": ntu_cruzado_no_mezclado,
+    "Caso especial (C=0): Evaporación/Condensación": ntu_C_cero
+}
+
+
+# --- Configuraciones resueltas por el método de celdas ---
+# Mezcla transversal de (Cmin, Cmax) en cada tipo de flujo cruzado
+MEZCLA_CRUZADO = {
+    "Flujo cruzado: Cmax mezclado, Cmin no mezclado": (False, True),
+    "Flujo cruzado: Cmax no mezclado, Cmin mezclado": (True, False),
+    "Flujo cruzado: Ambos no mezclados": (False, False),
+}
+
+
+def arreglo_numerico(tipo, pasos=None, corazas=1, contracorriente=True, pasos_Cmin=True):
+    """
+    Arreglo de calculos.celdas para el tipo y su configuración, o None si tiene forma cerrada.
+
+    Coraza y tubos: `pasos` pasos de tubo por coraza (2 por defecto) y `corazas` en serie.
+    Flujo cruzado: `pasos` pasos (1 por defecto), a contracorriente o en paralelo.
+    pasos_Cmin indica si el fluido que recorre los pasos (los tubos) es el de Cmin.
+    """
+    if tipo == "Coraza y tubos (1-2, 1-4, ...)":
+        pasos = pasos or 2
+        if pasos == 2 and corazas == 1:
+            return None
+        return arreglo_coraza(pasos, corazas, Cmin_en_tubos=pasos_Cmin)
+    if tipo in MEZCLA_CRUZADO:
+        pasos = pasos or 1
+        mezclado_Cmin, mezclado_Cmax = MEZCLA_CRUZADO[tipo]
+        if pasos == 1 and (mezclado_Cmin or mezclado_Cmax):
+            return None
+        if pasos_Cmin:
+            return arreglo_cruzado(mezclado_Cmin, mezclado_Cmax, pasos, contracorriente, Cmin_en_x=True)
+        return arreglo_cruzado(mezclado_Cmax, mezclado_Cmin, pasos, contracorriente, Cmin_en_x=False)
+    return None
+
+
+def efectividad(tipo, NTU, C, **configuracion):
+    """ε del tipo de intercambiador; las configuraciones sin forma cerrada usan la tabla de celdas."""
+    arreglo = arreglo_numerico(tipo, **configuracion)
+    if arreglo is None:
+        return FUNCIONES_EFECTIVIDAD[tipo](NTU, C)
+    return efectividad_arreglo(arreglo, NTU, C)
+
+
+def ntu(tipo, epsilon, C, **configuracion):
+    """NTU del tipo de intercambiador; las configuraciones sin forma cerrada invierten la tabla de celdas."""
+    arreglo = arreglo_numerico(tipo, **configuracion)
+    if arreglo is None:
+        return FUNCIONES_NTU[tipo](epsilon, C)
+    return ntu_arreglo(arreglo, epsilon, C)
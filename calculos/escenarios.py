@@ -0,0 +1,365 @@
+"""
+Almacén local de escenarios (SQLite) para guardar, consultar y recalcular resultados.
+
+Uso desde la línea de comandos:
+    python -m calculos.escenarios recalcular [--base escenarios.db] [--procesos N]
+    python -m calculos.escenarios exportar archivo.jsonl
+    python -m calculos.escenarios importar archivo.jsonl
+"""
+import argparse
+import ast
+import hashlib
+import json
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+from calculos import balance
+from calculos.sensibilidad import modelo_coeficiente_global, modelo_conduccion, modelo_efectividad, modelo_ntu
+
+_DIRECTORIO_CALCULOS = os.path.dirname(os.path.abspath(__file__))
+BASE_POR_DEFECTO = os.path.join(os.path.dirname(_DIRECTORIO_CALCULOS), "escenarios.db")
+
+# Columnas indexadas: se extraen de las entradas/salidas al guardar
+COLUMNAS_INDEXADAS = {
+    'fluido_int': 'TEXT', 'fluido_ext': 'TEXT', 'geometria': 'TEXT',
+    'diametro_int': 'REAL', 'diametro_ext': 'REAL',
+    'U': 'REAL', 'Q': 'REAL', 'epsilon': 'REAL', 'NTU': 'REAL',
+}
+
+# SQLite no distingue mayúsculas en nombres de columna: el flujo de calor q de
+# conducción se indexa en la misma columna que la carga térmica Q
+ALIAS_COLUMNAS = {'Q': ('Q', 'q')}
+
+_ESQUEMA = f"""
+CREATE TABLE IF NOT EXISTS escenarios (
+    id INTEGER PRIMARY KEY,
+    pagina TEXT NOT NULL,
+    hash TEXT NOT NULL UNIQUE,
+    version TEXT NOT NULL,
+    creado TEXT NOT NULL,
+    entradas TEXT NOT NULL,
+    salidas TEXT NOT NULL,
+    {", ".join(f"{nombre} {tipo}" for nombre, tipo in COLUMNAS_INDEXADAS.items())}
+);
+CREATE INDEX IF NOT EXISTS idx_fluidos ON escenarios (pagina, fluido_int, fluido_ext);
+CREATE INDEX IF NOT EXISTS idx_geometria ON escenarios (geometria, diametro_int, diametro_ext);
+CREATE INDEX IF NOT EXISTS idx_U ON escenarios (U);
+CREATE INDEX IF NOT EXISTS idx_Q ON escenarios (Q);
+CREATE INDEX IF NOT EXISTS idx_epsilon ON escenarios (epsilon);
+CREATE INDEX IF NOT EXISTS idx_NTU ON escenarios (NTU);
+CREATE INDEX IF NOT EXISTS idx_version ON escenarios (version);
+"""
+
+
+# Módulos de los que parte cada calculadora. sensibilidad reúne los modelos de
+# todas las páginas: se incluye, pero no se siguen sus importaciones
+MODULOS_CALCULO = {
+    'u': ("sensibilidad", "anulo", "cambio_fase", "flujo_interno", "propiedades"),
+    'conduc': ("sensibilidad", "aletas", "conduccion"),
+    'ntu_e': ("sensibilidad", "efectividad"),
+    'hx3': ("balance",),
+}
+_MODULOS_SIN_SEGUIR = {"sensibilidad"}
+
+
+def _importados(modulo):
+    """Módulos de calculos importados por calculos/<modulo>.py."""
+    with open(os.path.join(_DIRECTORIO_CALCULOS, f"{modulo}.py"), encoding="utf-8") as f:
+        arbol = ast.parse(f.read())
+    for nodo in ast.walk(arbol):
+        if isinstance(nodo, ast.ImportFrom) and nodo.module == "calculos":
+            yield from (alias.name for alias in nodo.names)
+        elif isinstance(nodo, ast.ImportFrom) and (nodo.module or "").startswith("calculos."):
+            yield nodo.module.split(".")[1]
+
+
+def modulos_calculo(pagina):
+    """Módulos de los que depende la calculadora de la página, con sus importaciones."""
+    pendientes, modulos = list(MODULOS_CALCULO[pagina]), set()
+    while pendientes:
+        modulo = pendientes.pop()
+        if modulo not in modulos:
+            modulos.add(modulo)
+            if modulo not in _MODULOS_SIN_SEGUIR:
+                pendientes.extend(_importados(modulo))
+    return modulos
+
+
+def _version_calculo(pagina):
+    """Huella de los módulos que usa la página: solo cambia si se modifica alguno de ellos."""
+    huella = hashlib.sha256()
+    for modulo in sorted(modulos_calculo(pagina)):
+        with open(os.path.join(_DIRECTORIO_CALCULOS, f"{modulo}.py"), "rb") as f:
+            huella.update(f.read())
+    return huella.hexdigest()[:12]
+
+
+VERSIONES_CALCULO = {pagina: _version_calculo(pagina) for pagina in MODULOS_CALCULO}
+
+
+# --- Normalización y hash de contenido ---
+def normalizar(valor):
+    """Convierte tipos de numpy a tipos de Python y redondea flotantes a 12 cifras significativas."""
+    if isinstance(valor, dict):
+        return {str(k): normalizar(v) for k, v in sorted(valor.items())}
+    if isinstance(valor, (list, tuple)):
+        return [normalizar(v) for v in valor]
+    if isinstance(valor, np.ndarray):
+        return normalizar(valor.tolist())
+    if isinstance(valor, (bool, np.bool_)):
+        return bool(valor)
+    if isinstance(valor, (int, np.integer)):
+        return int(valor)
+    if isinstance(valor, (float, np.floating)):
+        valor = float(valor)
+        return float(f"{valor:.12g}") if np.isfinite(valor) else None
+    return valor
+
+
+def hash_contenido(pagina, entradas):
+    texto = json.dumps({'pagina': pagina, 'entradas': normalizar(entradas)}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+# --- Calculadoras por página (usadas para recalcular en lote) ---
+def _calcular_u(e):
+    opciones = {k: e[k] for k in ('fluido_int', 'fluido_ext', 'fase_int', 'fase_ext', 'correlacion_laminar',
+                                  'correlacion_turbulenta', 'n', 'caso_anulo', 'razon_flujos', 'cambio_fase_int',
+                                  'cambio_fase_ext', 'opciones_cambio_fase') if k in e}
+    numericas = {k: e[k] for k in ('diametro_int', 'diametro_ext', 'T_prom_int', 'T_prom_ext', 'velocidad',
+                                   'velocidad_ext', 'longitud_tubo')}
+    return modelo_coeficiente_global(**numericas, **opciones)
+
+
+def _calcular_conduc(e):
+    e = dict(e)
+    return modelo_conduccion(e.pop('geometria'), **e)
+
+
+def _calcular_ntu_e(e):
+    configuracion = e.get('configuracion', {})
+    if 'NTU' in e:
+        return modelo_efectividad(e['NTU'], e['C'], tipo=e['tipo'], **configuracion)
+    return modelo_ntu(e['epsilon'], e['C'], tipo=e['tipo'], **configuracion)
+
+
+def _calcular_hx3(e):
+    e = dict(e)
+    parametro = e.pop('parametro')
+    if parametro == "Carga térmica (Q)":
+        return {'Q': balance.carga_termica(**e)}
+    if parametro == "LMTD":
+        return {'LMTD': balance.lmtd(**e)}
+    if parametro == "Temperatura salida caliente":
+        return {'T_hot_out': balance.temperatura_salida_caliente(**e)}
+    if parametro == "Temperatura salida fría":
+        return {'T_cold_out': balance.temperatura_salida_fria(**e)}
+    if parametro == "Eficacia (ε)":
+        return {'epsilon': balance.eficacia(**e)}
+    if parametro == "Razón de capacidades (c)":
+        return {'c': balance.razon_capacidades(**e)}
+    if parametro == "R y P":
+        R, P = balance.r_y_p(**e)
+        return {'R': R, 'P': P}
+    raise ValueError(f"Parámetro desconocido: {parametro}")
+
+
+CALCULADORAS = {
+    'u': _calcular_u,
+    'conduc': _calcular_conduc,
+    'ntu_e': _calcular_ntu_e,
+    'hx3': _calcular_hx3,
+}
+
+
+def calcular(pagina, entradas):
+    salidas = CALCULADORAS[pagina](entradas)
+    # Las salidas de ε-NTU usan la letra griega; se indexan como 'epsilon'
+    if 'ε' in salidas:
+        salidas = {('epsilon' if k == 'ε' else k): v for k, v in salidas.items()}
+    return normalizar(salidas)
+
+
+# --- Acceso a la base ---
+def conectar(ruta=BASE_POR_DEFECTO):
+    conexion = sqlite3.connect(ruta)
+    conexion.executescript(_ESQUEMA)
+    return conexion
+
+
+def _fila(pagina, entradas, salidas, version=None, creado=None):
+    entradas, salidas = normalizar(entradas), normalizar(salidas)
+    indexadas = []
+    for nombre in COLUMNAS_INDEXADAS:
+        claves = ALIAS_COLUMNAS.get(nombre, (nombre,))
+        valores = [fuente[clave] for clave in claves for fuente in (salidas, entradas) if clave in fuente]
+        indexadas.append(valores[0] if valores else None)
+    return (pagina, hash_contenido(pagina, entradas), version or VERSIONES_CALCULO[pagina],
+            creado or datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            json.dumps(entradas, ensure_ascii=False), json.dumps(salidas, ensure_ascii=False), *indexadas)
+
+
+_INSERTAR = f"""
+INSERT INTO escenarios (pagina, hash, version, creado, entradas, salidas, {", ".join(COLUMNAS_INDEXADAS)})
+VALUES ({", ".join("?" * (6 + len(COLUMNAS_INDEXADAS)))})
+ON CONFLICT(hash) DO UPDATE SET
+    version = excluded.version, salidas = excluded.salidas,
+    {", ".join(f"{nombre} = excluded.{nombre}" for nombre in COLUMNAS_INDEXADAS)}
+"""
+
+
+def guardar(pagina, entradas, salidas, ruta=BASE_POR_DEFECTO):
+    """Guarda un escenario; si las mismas entradas ya existen se actualizan sus salidas. Devuelve el hash."""
+    fila = _fila(pagina, entradas, salidas)
+    with conectar(ruta) as conexion:
+        conexion.execute(_INSERTAR, fila)
+    return fila[1]
+
+
+def buscar(ruta=BASE_POR_DEFECTO, pagina=None, fluido=None, geometria=None, limite=1000, **rangos):
+    """
+    Consulta por página, fluido (interno o externo), geometría y rangos de columnas indexadas.
+
+    Los rangos se pasan como <columna>_min / <columna>_max, por ejemplo U_min=500.
+    """
+    condiciones, parametros = [], []
+    if pagina is not None:
+        condiciones.append("pagina = ?")
+        parametros.append(pagina)
+    if fluido is not None:
+        condiciones.append("(fluido_int = ? OR fluido_ext = ?)")
+        parametros += [fluido, fluido]
+    if geometria is not None:
+        condiciones.append("geometria = ?")
+        parametros.append(geometria)
+    for clave, valor in rangos.items():
+        columna, _, limite_rango = clave.rpartition("_")
+        if columna not in COLUMNAS_INDEXADAS or limite_rango not in ("min", "max") or valor is None:
+            raise ValueError(f"Filtro desconocido: {clave}")
+        condiciones.append(f"{columna} {'>=' if limite_rango == 'min' else '<='} ?")
+        parametros.append(valor)
+
+    consulta = "SELECT * FROM escenarios"
+    if condiciones:
+        consulta += " WHERE " + " AND ".join(condiciones)
+    consulta += " ORDER BY id DESC LIMIT ?"
+    with conectar(ruta) as conexion:
+        return pd.read_sql_query(consulta, conexion, params=parametros + [limite])
+
+
+def firma(ruta=BASE_POR_DEFECTO):
+    """
+    Firma barata del contenido de la base, para cachear exportaciones.
+
+    Último id y fecha de modificación del archivo: cambia con cada inserción, y
+    también con las actualizaciones en el lugar (guardar repetido, recálculo).
+    """
+    with conectar(ruta) as conexion:
+        ultimo_id = conexion.execute("SELECT MAX(id) FROM escenarios").fetchone()[0]
+    return ultimo_id, os.stat(ruta).st_mtime_ns
+
+
+def lineas_exportacion(ruta=BASE_POR_DEFECTO):
+    """Genera los escenarios como líneas JSON, en orden de creación."""
+    with conectar(ruta) as conexion:
+        for pagina, version, creado, entradas, salidas in conexion.execute(
+                "SELECT pagina, version, creado, entradas, salidas FROM escenarios ORDER BY id"):
+            registro = {'pagina': pagina, 'version': version, 'creado': creado,
+                        'entradas': json.loads(entradas), 'salidas': json.loads(salidas)}
+            yield json.dumps(registro, ensure_ascii=False) + "\n"
+
+
+def exportar(destino, ruta=BASE_POR_DEFECTO):
+    """Exporta todos los escenarios a JSON Lines. Devuelve el número de registros."""
+    with open(destino, "w", encoding="utf-8") as f:
+        n = 0
+        for linea in lineas_exportacion(ruta):
+            f.write(linea)
+            n += 1
+    return n
+
+
+def importar(origen, ruta=BASE_POR_DEFECTO):
+    """Importa escenarios desde JSON Lines en una sola transacción. Devuelve el número de registros."""
+    with open(origen, encoding="utf-8") as f:
+        filas = [
+            _fila(r['pagina'], r['entradas'], r['salidas'], r.get('version'), r.get('creado'))
+            for r in map(json.loads, filter(str.strip, f))
+        ]
+    with conectar(ruta) as conexion:
+        conexion.executemany(_INSERTAR, filas)
+    return len(filas)
+
+
+def _recalcular_registro(registro):
+    id_, pagina, entradas = registro
+    try:
+        return id_, pagina, json.loads(entradas), calcular(pagina, json.loads(entradas)), None
+    except Exception as e:
+        return id_, pagina, json.loads(entradas), None, str(e)
+
+
+def recalcular_todos(ruta=BASE_POR_DEFECTO, procesos=None, solo_desactualizados=True):
+    """
+    Recalcula en paralelo los escenarios guardados con otra versión del código de su página.
+
+    Devuelve un diccionario con el número de registros actualizados y los errores por id.
+    """
+    consulta = "SELECT id, pagina, entradas FROM escenarios"
+    parametros = []
+    if solo_desactualizados:
+        consulta += f" WHERE (pagina, version) NOT IN (VALUES {', '.join(['(?, ?)'] * len(VERSIONES_CALCULO))})"
+        parametros += [valor for par in VERSIONES_CALCULO.items() for valor in par]
+    with conectar(ruta) as conexion:
+        registros = conexion.execute(consulta, parametros).fetchall()
+    if not registros:
+        return {'actualizados': 0, 'errores': {}}
+
+    procesos = procesos or os.cpu_count() or 1
+    tamano_bloque = max(1, len(registros) // (4 * procesos))
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        resultados = list(ejecutor.map(_recalcular_registro, registros, chunksize=tamano_bloque))
+
+    actualizaciones, errores = [], {}
+    for id_, pagina, entradas, salidas, error in resultados:
+        if error is not None:
+            errores[id_] = error
+            continue
+        fila = _fila(pagina, entradas, salidas)
+        actualizaciones.append((fila[2], fila[5], *fila[6:], id_))
+    with conectar(ruta) as conexion:
+        conexion.executemany(
+            f"UPDATE escenarios SET version = ?, salidas = ?, "
+            f"{', '.join(f'{nombre} = ?' for nombre in COLUMNAS_INDEXADAS)} WHERE id = ?",
+            actualizaciones)
+    return {'actualizados': len(actualizaciones), 'errores': errores}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Almacén de escenarios de cálculo")
+    parser.add_argument("--base", default=BASE_POR_DEFECTO, help="Ruta de la base SQLite")
+    sub = parser.add_subparsers(dest="comando", required=True)
+    p_recalcular = sub.add_parser("recalcular", help="Recalcula los escenarios con la versión actual")
+    p_recalcular.add_argument("--procesos", type=int, default=None)
+    p_recalcular.add_argument("--todos", action="store_true", help="Incluye los ya actualizados")
+    sub.add_parser("exportar").add_argument("archivo")
+    sub.add_parser("importar").add_argument("archivo")
+    args = parser.parse_args()
+
+    if args.comando == "recalcular":
+        resultado = recalcular_todos(args.base, args.procesos, solo_desactualizados=not args.todos)
+        print(f"Escenarios actualizados: {resultado['actualizados']}")
+        for id_, error in resultado['errores'].items():
+            print(f"  id {id_}: {error}")
+    elif args.comando == "exportar":
+        print(f"Escenarios exportados: {exportar(args.archivo, args.base)}")
+    else:
+        print(f"Escenarios importados: {importar(args.archivo, args.base)}")
+
+
+if __name__ == "__main__":
+    main()
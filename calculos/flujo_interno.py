@@ -0,0 +1,181 @@
+import numpy as np
+
+# --- Límites de régimen ---
+RE_LAMINAR = 2300.0
+RE_TURBULENTO = 1.0e4
+
+LAMINAR = 0
+TRANSICION = 1
+TURBULENTO = 2
+
+NOMBRES_REGIMEN = {
+    LAMINAR: "Laminar",
+    TRANSICION: "Transición",
+    TURBULENTO: "Turbulento",
+}
+
+# Rangos de validez (Re_min, Re_max, Pr_min, Pr_max) de cada correlación
+RANGOS_VALIDEZ = {
+    "laminar desarrollado": (0.0, RE_LAMINAR, 0.0, np.inf),
+    "hausen": (0.0, RE_LAMINAR, 0.0, np.inf),
+    "shah": (0.0, RE_LAMINAR, 0.0, np.inf),
+    "dittus-boelter": (1.0e4, np.inf, 0.6, 160.0),
+    "sieder-tate": (1.0e4, np.inf, 0.7, 16700.0),
+    "gnielinski": (3000.0, 5.0e6, 0.5, 2000.0),
+}
+
+CORRELACIONES_LAMINARES = ["laminar desarrollado", "hausen", "shah"]
+CORRELACIONES_TURBULENTAS = ["gnielinski", "dittus-boelter", "sieder-tate"]
+
+# Correlaciones de desarrollo térmico: necesitan D y L
+CORRELACIONES_CON_LONGITUD = ["hausen", "shah"]
+
+# Las correlaciones turbulentas suponen flujo desarrollado en casi todo el tubo
+LD_MINIMO_TURBULENTO = 10.0
+
+
+def como_arreglo(valor):
+    """Arreglo de punto flotante que conserva la parte imaginaria (derivación por paso complejo)."""
+    arreglo = np.asarray(valor)
+    return arreglo.astype(np.result_type(arreglo, float), copy=False)
+
+
+# --- Correlaciones laminares (temperatura de pared constante) ---
+def nu_laminar_desarrollado(Re, Pr):
+    return np.full(np.broadcast(Re, Pr).shape, 3.66)
+
+
+def nu_hausen(Re, Pr, D, L):
+    """Flujo laminar térmicamente en desarrollo (Hausen), Nu promedio."""
+    Gz = (D / L) * Re * Pr
+    return 3.66 + 0.0668 * Gz / (1 + 0.04 * Gz**(2/3))
+
+
+def nu_shah(Re, Pr, D, L):
+    """
+    Flujo laminar en desarrollo térmico (Shah-London), Nu promedio con x* = L/(D·Re·Pr).
+
+    Las ramas por tramos de Shah-London no empalman entre sí; se combinan sus
+    asíntotas (3.657 en tubo largo, Lévêque 1.615·x*^(-1/3) - 0.7 en tubo corto)
+    por superposición cúbica (Gnielinski), continua en todo x*.
+    """
+    x_est = L / (D * Re * Pr)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        leveque = 1.615 * x_est**(-1/3) - 0.7
+    return (3.657**3 + 0.7**3 + leveque**3)**(1/3)
+
+
+# --- Correlaciones turbulentas ---
+def factor_friccion_petukhov(Re):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (0.790 * np.log(Re) - 1.64)**-2
+
+
+def nu_gnielinski(Re, Pr):
+    f = factor_friccion_petukhov(Re)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (f / 8) * (Re - 1000) * Pr / (1 + 12.7 * np.sqrt(f / 8) * (Pr**(2/3) - 1))
+
+
+def nu_dittus_boelter(Re, Pr, n=0.4):
+    return 0.023 * Re**0.8 * Pr**n
+
+
+def nu_sieder_tate(Re, Pr, mu_mu_s=1.0):
+    """Sieder-Tate con corrección por viscosidad en la pared (μ/μs)^0.14."""
+    return 0.027 * Re**0.8 * Pr**(1/3) * mu_mu_s**0.14
+
+
+def rango_valido(correlacion, Re, Pr):
+    Re_min, Re_max, Pr_min, Pr_max = RANGOS_VALIDEZ[correlacion]
+    return (Re >= Re_min) & (Re <= Re_max) & (Pr >= Pr_min) & (Pr <= Pr_max)
+
+
+def longitud_valida(correlacion, Re, Pr, D, L):
+    """
+    Condición L/D de la correlación; sin D o L no se verifica.
+
+    Nu = 3.66 exige que la entrada térmica (≈ 0.05·Re·Pr·D) sea corta frente a L;
+    Hausen y Shah-London incluyen la entrada y no tienen límite.
+    """
+    if D is None or L is None:
+        return np.ones(np.shape(Re), dtype=bool)
+    L_D = np.real(L / D)
+    if correlacion == "laminar desarrollado":
+        return L_D >= 0.05 * np.real(Re * Pr)
+    if correlacion in CORRELACIONES_TURBULENTAS:
+        return L_D >= LD_MINIMO_TURBULENTO
+    return np.ones(np.shape(Re), dtype=bool)
+
+
+def _nu_laminar(correlacion, Re, Pr, D, L):
+    if correlacion in CORRELACIONES_CON_LONGITUD and (D is None or L is None):
+        raise ValueError(f"La correlación {correlacion} requiere el diámetro D y la longitud L del tubo")
+    if correlacion == "laminar desarrollado":
+        return nu_laminar_desarrollado(Re, Pr)
+    if correlacion == "hausen":
+        return nu_hausen(Re, Pr, D, L)
+    if correlacion == "shah":
+        return nu_shah(Re, Pr, D, L)
+    raise ValueError(f"Correlación laminar desconocida: {correlacion}")
+
+
+def _nu_turbulento(correlacion, Re, Pr, n, mu_mu_s):
+    if correlacion == "gnielinski":
+        return nu_gnielinski(Re, Pr)
+    if correlacion == "dittus-boelter":
+        return nu_dittus_boelter(Re, Pr, n)
+    if correlacion == "sieder-tate":
+        return nu_sieder_tate(Re, Pr, mu_mu_s)
+    raise ValueError(f"Correlación turbulenta desconocida: {correlacion}")
+
+
+def nusselt_interno(Re, Pr, D=None, L=None, correlacion_laminar="laminar desarrollado",
+                    correlacion_turbulenta="gnielinski", n=0.4, mu_mu_s=1.0):
+    """
+    Nu de flujo interno evaluado sobre arreglos.
+
+    El régimen se selecciona con máscaras: laminar (Re < 2300), transición
+    (2300 ≤ Re < 10⁴) y turbulento (Re ≥ 10⁴). En transición se interpola
+    linealmente en Re entre el valor laminar en Re = 2300 y el turbulento en
+    Re = 10⁴ (Gnielinski, 2013). Devuelve un diccionario con 'Nu', 'regimen'
+    y 'valido' (si el punto está dentro del rango de la correlación usada,
+    incluida su condición L/D). Hausen y Shah-London requieren D y L.
+    """
+    Re, Pr, mu_mu_s = np.broadcast_arrays(como_arreglo(Re), como_arreglo(Pr), como_arreglo(mu_mu_s))
+    if D is not None and L is not None:
+        D, L = np.broadcast_to(D, Re.shape), np.broadcast_to(L, Re.shape)
+
+    regimen = np.select([Re < RE_LAMINAR, Re < RE_TURBULENTO], [LAMINAR, TRANSICION], TURBULENTO)
+
+    Nu_lam = _nu_laminar(correlacion_laminar, Re, Pr, D, L)
+    Nu_turb = _nu_turbulento(correlacion_turbulenta, Re, Pr, n, mu_mu_s)
+
+    # Extremos de la zona de transición
+    Re_lam = np.full(Re.shape, RE_LAMINAR)
+    Re_turb = np.full(Re.shape, RE_TURBULENTO)
+    Nu_lam_lim = _nu_laminar(correlacion_laminar, Re_lam, Pr, D, L)
+    Nu_turb_lim = _nu_turbulento(correlacion_turbulenta, Re_turb, Pr, n, mu_mu_s)
+    gamma = np.clip((Re - RE_LAMINAR) / (RE_TURBULENTO - RE_LAMINAR), 0.0, 1.0)
+    Nu_trans = (1 - gamma) * Nu_lam_lim + gamma * Nu_turb_lim
+
+    Nu = np.choose(regimen, [Nu_lam, Nu_trans, Nu_turb])
+
+    # La transición hereda las condiciones de sus dos extremos
+    longitud_lam = longitud_valida(correlacion_laminar, Re, Pr, D, L)
+    longitud_turb = longitud_valida(correlacion_turbulenta, Re, Pr, D, L)
+    valido = np.choose(regimen, [
+        rango_valido(correlacion_laminar, Re, Pr) & longitud_lam,
+        (Pr >= RANGOS_VALIDEZ[correlacion_turbulenta][2]) & (Pr <= RANGOS_VALIDEZ[correlacion_turbulenta][3])
+        & longitud_valida(correlacion_laminar, Re_lam, Pr, D, L) & longitud_turb,
+        rango_valido(correlacion_turbulenta, Re, Pr) & longitud_turb,
+    ])
+
+    return {'Nu': Nu, 'regimen': regimen, 'valido': valido}
+
+
+def coeficiente_interno(Re, Pr, k, D, **kwargs):
+    """h interno (W/m²K) a partir de nusselt_interno; acepta los mismos argumentos."""
+    resultado = nusselt_interno(Re, Pr, D=D, **kwargs)
+    resultado['h'] = resultado['Nu'] * k / D
+    return resultado
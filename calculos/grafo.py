@@ -0,0 +1,91 @@
+import inspect
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.figure import Figure
+
+
+def _iguales(a, b):
+    """Comparación tolerante a arreglos; ante cualquier duda se consideran distintos."""
+    if a is b:
+        return True
+    try:
+        if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+            return np.array_equal(a, b, equal_nan=True)
+        return bool(a == b)
+    except (ValueError, TypeError):
+        return False
+
+
+def _liberar(valor):
+    """Cierra las figuras reemplazadas para que pyplot no las acumule entre reejecuciones."""
+    if isinstance(valor, Figure):
+        plt.close(valor)
+
+
+class GrafoCalculo:
+    """
+    Grafo de dependencias con memoización para recálculo incremental.
+
+    Cada nodo es una función cuyos parámetros son los nombres de los nodos o
+    entradas de los que depende. Un nodo solo se recalcula si cambió la
+    versión de alguna dependencia; si su nuevo valor es igual al anterior, su
+    versión no avanza y los nodos aguas abajo tampoco se recalculan.
+
+    El estado (valores, versiones y firmas) vive en un diccionario externo,
+    por ejemplo st.session_state, para que persista entre reejecuciones. Las
+    figuras de matplotlib que un nodo reemplaza se cierran.
+    """
+
+    def __init__(self, estado=None):
+        self.nodos = {}
+        self.estado = estado if estado is not None else {}
+        self.estado.setdefault('valores', {})
+        self.estado.setdefault('versiones', {})
+        self.estado.setdefault('firmas', {})
+
+    def nodo(self, funcion=None, *, nombre=None):
+        """Decorador que registra una función como nodo; las dependencias salen de su firma."""
+        def registrar(f):
+            dependencias = tuple(inspect.signature(f).parameters)
+            self.nodos[nombre or f.__name__] = (f, dependencias)
+            return f
+        return registrar(funcion) if funcion is not None else registrar
+
+    def entrada(self, nombre, valor):
+        valores, versiones = self.estado['valores'], self.estado['versiones']
+        if nombre not in valores or not _iguales(valores[nombre], valor):
+            valores[nombre] = valor
+            versiones[nombre] = versiones.get(nombre, 0) + 1
+        return valor
+
+    def entradas(self, **valores):
+        for nombre, valor in valores.items():
+            self.entrada(nombre, valor)
+
+    def valor(self, nombre):
+        if nombre not in self.nodos:
+            if nombre not in self.estado['valores']:
+                raise KeyError(f"Entrada o nodo desconocido: {nombre}")
+            return self.estado['valores'][nombre]
+
+        funcion, dependencias = self.nodos[nombre]
+        argumentos = [self.valor(dep) for dep in dependencias]
+        versiones = self.estado['versiones']
+        firma = tuple(versiones[dep] for dep in dependencias)
+
+        valores = self.estado['valores']
+        if nombre in valores and self.estado['firmas'].get(nombre) == firma:
+            return valores[nombre]
+
+        nuevo = funcion(*argumentos)
+        if nombre not in valores or not _iguales(valores[nombre], nuevo):
+            versiones[nombre] = versiones.get(nombre, 0) + 1
+        if nombre in valores and valores[nombre] is not nuevo:
+            _liberar(valores[nombre])
+        valores[nombre] = nuevo
+        self.estado['firmas'][nombre] = firma
+        return nuevo
+
+    def valores(self, *nombres):
+        return tuple(self.valor(nombre) for nombre in nombres)
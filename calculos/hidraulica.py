@@ -0,0 +1,146 @@
+import numpy as np
+from calculos.anulo import diametro_hidraulico
+from calculos.flujo_interno import como_arreglo, RE_LAMINAR
+
+# Fin de la zona de transición para fricción (Colebrook es válida desde Re ≈ 4000)
+RE_TURBULENTO_FRICCION = 4000.0
+
+METODOS_FRICCION = ["colebrook", "haaland", "swamee-jain"]
+
+# Rugosidad absoluta equivalente (m)
+RUGOSIDADES = {
+    "tubo estirado (liso)": 1.5e-6,
+    "acero comercial": 4.5e-5,
+    "hierro galvanizado": 1.5e-4,
+    "hierro fundido": 2.6e-4,
+    "acero remachado": 3.0e-3,
+}
+
+# Coeficientes de pérdida K (número de cargas de velocidad) de accesorios
+COEFICIENTES_ACCESORIOS = {
+    "retorno 180°": 1.5,
+    "codo 90° estándar": 0.75,
+    "codo 90° radio largo": 0.45,
+    "te (flujo directo)": 0.4,
+    "válvula de compuerta abierta": 0.17,
+    "válvula de globo abierta": 6.0,
+    "entrada brusca": 0.5,
+    "salida": 1.0,
+}
+
+
+def coeficiente_accesorios(accesorios):
+    """ΣK a partir de un diccionario {accesorio: cantidad}."""
+    if not accesorios:
+        return 0.0
+    return sum(COEFICIENTES_ACCESORIOS[nombre] * cantidad for nombre, cantidad in accesorios.items())
+
+
+# --- Factor de fricción de Darcy ---
+def f_re_anulo_laminar(Di_Do):
+    """f·Re laminar del anulo concéntrico basado en Dh (64 para el tubo circular, 96 para placas paralelas)."""
+    k = como_arreglo(Di_Do)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f_re = 64 * (1 - k)**2 / (1 + k**2 - (1 - k**2) / np.log(1 / k))
+    return np.where(np.real(k) <= 0, 64.0, f_re)
+
+
+def factor_friccion_haaland(Re, rugosidad_relativa=0.0):
+    """Haaland (1983), explícita; error menor al 2 % respecto de Colebrook."""
+    return (-1.8 * np.log10((rugosidad_relativa / 3.7)**1.11 + 6.9 / Re))**-2
+
+
+def factor_friccion_swamee_jain(Re, rugosidad_relativa=0.0):
+    """Swamee-Jain (1976), explícita; error menor al 3 % para 5000 ≤ Re ≤ 10⁸ y 10⁻⁶ ≤ ε/D ≤ 10⁻²."""
+    return 0.25 / np.log10(rugosidad_relativa / 3.7 + 5.74 / Re**0.9)**2
+
+
+def factor_friccion_colebrook(Re, rugosidad_relativa=0.0, tol=1e-12, max_iter=20):
+    """
+    Colebrook-White resuelta en lote con Newton sobre x = 1/√f.
+
+    Se parte de Haaland, por lo que bastan 2-3 iteraciones en todo el diagrama de Moody.
+    """
+    Re, e = np.broadcast_arrays(como_arreglo(Re), como_arreglo(rugosidad_relativa))
+    x = 1 / np.sqrt(factor_friccion_haaland(Re, e))
+    for _ in range(max_iter):
+        argumento = e / 3.7 + 2.51 * x / Re
+        residuo = x + 2 * np.log10(argumento)
+        derivada = 1 + 2 / np.log(10) * (2.51 / Re) / argumento
+        paso = residuo / derivada
+        x = x - paso
+        if np.all(np.abs(np.real(paso)) < tol * np.abs(np.real(x))):
+            break
+    return 1 / x**2
+
+
+_FUNCIONES_FRICCION = {
+    "colebrook": factor_friccion_colebrook,
+    "haaland": factor_friccion_haaland,
+    "swamee-jain": factor_friccion_swamee_jain,
+}
+
+
+def factor_friccion(Re, rugosidad_relativa=0.0, f_re_laminar=64.0, metodo="colebrook"):
+    """
+    Factor de fricción de Darcy evaluado sobre arreglos.
+
+    Laminar (Re < 2300): f = (f·Re)/Re; turbulento (Re ≥ 4000): Colebrook o una
+    aproximación explícita. En transición se interpola linealmente en Re entre
+    ambos extremos, igual que en nusselt_interno.
+    """
+    Re, e, f_re_laminar = np.broadcast_arrays(
+        como_arreglo(Re), como_arreglo(rugosidad_relativa), como_arreglo(f_re_laminar))
+    funcion = _FUNCIONES_FRICCION[metodo]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f_lam = f_re_laminar / Re
+        # Re no positivos (sin flujo) no deben propagar NaN a la iteración turbulenta
+        f_turb = funcion(np.where(np.real(Re) > 0, Re, RE_TURBULENTO_FRICCION), e)
+    f_lam_lim = f_re_laminar / RE_LAMINAR
+    f_turb_lim = funcion(np.full(Re.shape, RE_TURBULENTO_FRICCION), e)
+    gamma = np.clip((Re - RE_LAMINAR) / (RE_TURBULENTO_FRICCION - RE_LAMINAR), 0.0, 1.0)
+    f_trans = (1 - gamma) * f_lam_lim + gamma * f_turb_lim
+    return np.select([np.real(Re) < RE_LAMINAR, np.real(Re) < RE_TURBULENTO_FRICCION], [f_lam, f_trans], f_turb)
+
+
+# --- Caída de presión y potencia ---
+def caida_presion(f, L, D, densidad, velocidad, K_total=0.0):
+    """Δp (Pa) = (f·L/D + ΣK)·ρ·v²/2."""
+    return (f * L / D + K_total) * densidad * velocidad**2 / 2
+
+
+def potencia_bombeo(delta_p, caudal_volumetrico, eficiencia=1.0):
+    """Potencia (W) que debe entregar la bomba: Δp·V̇/η."""
+    return delta_p * caudal_volumetrico / eficiencia
+
+
+def _lado(Re, f_re_laminar, D, L, densidad, velocidad, area, rugosidad, K_total, eficiencia, metodo):
+    f = factor_friccion(Re, rugosidad / D, f_re_laminar, metodo)
+    with np.errstate(invalid="ignore"):
+        delta_p = caida_presion(f, L, D, densidad, velocidad, K_total)
+    # Sin flujo f es infinito pero la caída de presión es nula
+    delta_p = np.where(np.real(velocidad) == 0, 0.0, delta_p)
+    return {'f': f, 'delta_p': delta_p, 'potencia': potencia_bombeo(delta_p, velocidad * area, eficiencia)}
+
+
+def hidraulica_doble_tubo(Re_int, Re_ext, velocidad_int, velocidad_ext, densidad_int, densidad_ext, Di, Do, L,
+                          rugosidad=0.0, accesorios_int=None, accesorios_ext=None, n_retornos=0,
+                          eficiencia_bomba=1.0, metodo="colebrook"):
+    """
+    Fricción, caída de presión y potencia de bombeo de ambos lados de un doble tubo.
+
+    L es la longitud total de tubo recorrida por cada fluido y n_retornos el número
+    de retornos de 180° (horquillas) que atraviesa. En el anulo se usa Dh = Do - Di
+    y el f·Re laminar propio del anulo. Devuelve un diccionario por lado con
+    'f', 'delta_p' (Pa) y 'potencia' (W).
+    """
+    Di, Do = como_arreglo(Di), como_arreglo(Do)
+    D_h = diametro_hidraulico(Di, Do)
+    K_retornos = n_retornos * COEFICIENTES_ACCESORIOS["retorno 180°"]
+    return {
+        'int': _lado(Re_int, 64.0, Di, L, densidad_int, velocidad_int, np.pi * Di**2 / 4, rugosidad,
+                     coeficiente_accesorios(accesorios_int) + K_retornos, eficiencia_bomba, metodo),
+        'ext': _lado(Re_ext, f_re_anulo_laminar(Di / Do), D_h, L, densidad_ext, velocidad_ext,
+                     np.pi * (Do**2 - Di**2) / 4, rugosidad,
+                     coeficiente_accesorios(accesorios_ext) + K_retornos, eficiencia_bomba, metodo),
+    }
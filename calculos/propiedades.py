@@ -0,0 +1,113 @@
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# Diccionario de archivos con las tablas de propiedades
+ARCHIVOS_PROPIEDADES = {
+    "agua saturada": "tabla_a9.csv",
+    "refrigerante 134a": "tabla_a10.csv",
+    "amoniaco": "tabla_a11.csv",
+    "propano": "tabla_a12.csv",
+    "aire": "tabla_a15.csv",
+    "glicerina": "tabla_glicerina.csv",
+    "isobutano": "tabla_isobutano.csv",
+    "metano": "tabla_metano.csv",
+    "metanol": "tabla_metanol.csv",
+    "aceite para motor": "tabla_aceitemotor.csv"
+}
+
+FLUIDOS_CON_FASES = ["agua saturada", "refrigerante 134a", "amoniaco", "propano"]
+
+# Nombre base y unidad de cada propiedad en los CSV
+COLUMNAS = {
+    'densidad': ("Densidad", "(kg/m³)"),
+    'viscosidad': ("Viscosidad dinámica", "(kg/m·s)"),
+    'k': ("Conductividad térmica", "(W/m·K)"),
+    'Pr': ("Número de Prandtl", ""),
+    'cp': ("Calor específico", "(J/kg·K)"),
+}
+
+# Columnas de saturación (sin fase); solo las tablas que las incluyen admiten cambio de fase
+COLUMNAS_SATURACION = {
+    'h_fg': "Entalpia Vaporizacion (kJ/kg)",
+    'Psat': "Psat (kPa)",
+}
+
+_DIRECTORIO_TABLAS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def nombre_columna(propiedad, fase=None):
+    base, unidad = COLUMNAS[propiedad]
+    nombre = f"{base} {fase}" if fase else base
+    return f"{nombre} {unidad}".strip()
+
+
+@lru_cache(maxsize=None)
+def cargar_tabla(fluido):
+    """Lee la tabla del fluido una sola vez por proceso."""
+    df = pd.read_csv(os.path.join(_DIRECTORIO_TABLAS, ARCHIVOS_PROPIEDADES[fluido]))
+    df.columns = df.columns.str.strip()
+    return df
+
+
+@lru_cache(maxsize=None)
+def _columnas(fluido, propiedad, fase):
+    """Temperaturas y valores de una propiedad como arreglos, sin filas vacías."""
+    df = cargar_tabla(fluido)
+    fase = fase if fluido in FLUIDOS_CON_FASES else None
+    T = df['Temp. (°C)'].to_numpy(dtype=float)
+    columna = COLUMNAS_SATURACION.get(propiedad) or nombre_columna(propiedad, fase)
+    y = df[columna].to_numpy(dtype=float)
+    finitos = np.isfinite(y)
+    return T[finitos], y[finitos]
+
+
+def interpolar_propiedad(fluido, propiedad, T, fase="líquido"):
+    T_tabla, y = _columnas(fluido, propiedad, fase)
+    if np.iscomplexobj(T):
+        # Paso complejo: el interpolante es lineal por tramos, su extensión es exacta
+        T = np.asarray(T)
+        return np.interp(T.real, T_tabla, y) + 1j * T.imag * derivada_propiedad(fluido, propiedad, T.real, fase)
+    return np.interp(T, T_tabla, y)
+
+
+def derivada_propiedad(fluido, propiedad, T, fase="líquido"):
+    """dP/dT del interpolante lineal; fuera de la tabla vale 0 (np.interp satura)."""
+    T_tabla, y = _columnas(fluido, propiedad, fase)
+    pendiente = np.diff(y) / np.diff(T_tabla)
+    T = np.asarray(T, dtype=float)
+    tramo = np.clip(np.searchsorted(T_tabla, T, side='right') - 1, 0, len(pendiente) - 1)
+    dentro = (T >= T_tabla[0]) & (T <= T_tabla[-1])
+    return np.where(dentro, pendiente[tramo], 0.0)
+
+
+def propiedades(fluido, T, fase="líquido"):
+    """Densidad, viscosidad, k, Pr y cp a la temperatura T (°C), evaluadas sobre arreglos."""
+    return {propiedad: interpolar_propiedad(fluido, propiedad, T, fase) for propiedad in COLUMNAS}
+
+
+def admite_cambio_fase(fluido):
+    return fluido in FLUIDOS_CON_FASES and all(c in cargar_tabla(fluido).columns for c in COLUMNAS_SATURACION.values())
+
+
+def propiedades_saturacion(fluido, T_sat, T_pelicula=None):
+    """
+    Propiedades para cambio de fase: líquido a la temperatura de película,
+    vapor, h_fg (J/kg) y Psat (kPa) a la temperatura de saturación.
+    """
+    if not admite_cambio_fase(fluido):
+        raise ValueError(f"La tabla de {fluido} no incluye entalpía de vaporización")
+    T_pelicula = T_sat if T_pelicula is None else T_pelicula
+    return {
+        'densidad_l': interpolar_propiedad(fluido, 'densidad', T_pelicula, "líquido"),
+        'viscosidad_l': interpolar_propiedad(fluido, 'viscosidad', T_pelicula, "líquido"),
+        'k_l': interpolar_propiedad(fluido, 'k', T_pelicula, "líquido"),
+        'cp_l': interpolar_propiedad(fluido, 'cp', T_pelicula, "líquido"),
+        'Pr_l': interpolar_propiedad(fluido, 'Pr', T_pelicula, "líquido"),
+        'densidad_v': interpolar_propiedad(fluido, 'densidad', T_sat, "vapor"),
+        'viscosidad_v': interpolar_propiedad(fluido, 'viscosidad', T_sat, "vapor"),
+        'h_fg': 1000 * interpolar_propiedad(fluido, 'h_fg', T_sat),
+        'Psat': interpolar_propiedad(fluido, 'Psat', T_sat),
+    }
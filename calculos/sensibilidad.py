@@ -0,0 +1,164 @@
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from calculos.aletas import resistencia_pared_aletada
+from calculos.anulo import nu_anulo, diametro_hidraulico
+from calculos.cambio_fase import temperatura_pared, verificar_lados
+from calculos.conduccion import capas_desde_argumentos, pared_conveccion_radiacion, resistencias_capas
+from calculos.efectividad import efectividad, efectividad_maxima, ntu
+from calculos.flujo_interno import nusselt_interno
+from calculos.propiedades import propiedades
+
+PASO_COMPLEJO = 1e-30
+
+
+def derivadas_paso_complejo(modelo, entradas, h=PASO_COMPLEJO):
+    """
+    Derivadas parciales de todas las salidas de `modelo` respecto de todas las entradas.
+
+    Se arma un lote con un eje inicial de tamaño n (una fila por entrada) en el
+    que la fila j lleva el paso imaginario ih en la entrada j, y se evalúa el
+    modelo una sola vez: ∂y/∂x_j = Im(y[j])/h, sin error de cancelación.
+    El modelo recibe las entradas como argumentos con nombre y devuelve un
+    diccionario de salidas.
+    """
+    nombres = list(entradas)
+    base = {nombre: np.asarray(valor, dtype=float) for nombre, valor in entradas.items()}
+    forma = np.broadcast_shapes(*(valor.shape for valor in base.values()))
+
+    lote = {}
+    for j, nombre in enumerate(nombres):
+        x = np.broadcast_to(base[nombre], (len(nombres),) + forma).astype(complex)
+        x[j] += 1j * h
+        lote[nombre] = x
+
+    resultado = {}
+    for salida, y in modelo(**lote).items():
+        y = np.broadcast_to(np.asarray(y), (len(nombres),) + forma)
+        valor = y[0].real
+        derivadas = {nombre: np.where(np.isfinite(valor), y[j].imag / h, np.nan) for j, nombre in enumerate(nombres)}
+        with np.errstate(divide="ignore", invalid="ignore"):
+            elasticidades = {nombre: derivadas[nombre] * base[nombre] / valor for nombre in nombres}
+        resultado[salida] = {'valor': valor, 'derivadas': derivadas, 'elasticidades': elasticidades}
+    return resultado
+
+
+def tabla_sensibilidad(resultado_salida):
+    """Tabla ordenada por |elasticidad| para un caso escalar."""
+    tabla = pd.DataFrame({
+        'Entrada': list(resultado_salida['derivadas']),
+        'Derivada': [float(v) for v in resultado_salida['derivadas'].values()],
+        'Elasticidad': [float(v) for v in resultado_salida['elasticidades'].values()],
+    })
+    orden = tabla['Elasticidad'].abs().sort_values(ascending=False).index
+    return tabla.loc[orden].reset_index(drop=True)
+
+
+def dibujar_tornado(tabla, salida, variacion=10.0):
+    """Gráfico de tornado: cambio porcentual linealizado de la salida para ±variacion % en cada entrada."""
+    tabla = tabla.iloc[::-1]
+    efecto = tabla['Elasticidad'].to_numpy() * variacion
+    fig, ax = plt.subplots(figsize=(8, 0.4 * len(tabla) + 1.5))
+    ax.barh(tabla['Entrada'], efecto, color="#d62728", edgecolor='k', label=f"+{variacion:.0f} %")
+    ax.barh(tabla['Entrada'], -efecto, color="#1f77b4", edgecolor='k', label=f"-{variacion:.0f} %")
+    ax.axvline(0, color='k', linewidth=0.8)
+    ax.set_xlabel(f"Cambio en {salida} (%)")
+    ax.set_title(f"Sensibilidad de {salida}")
+    ax.legend(loc='lower right')
+    ax.grid(True, axis='x', alpha=0.3)
+    return fig
+
+
+# --- Modelos derivables (aceptan entradas complejas) ---
+def modelo_coeficiente_global(diametro_int, diametro_ext, T_prom_int, T_prom_ext, velocidad, velocidad_ext,
+                              longitud_tubo, *, fluido_int, fluido_ext, fase_int=None, fase_ext=None,
+                              correlacion_laminar="laminar desarrollado", correlacion_turbulenta="gnielinski",
+                              n=0.4, caso_anulo="pared interna calentada", razon_flujos=1.0,
+                              cambio_fase_int=None, cambio_fase_ext=None, opciones_cambio_fase=None):
+    """
+    U de la página de coeficiente global a partir de velocidades y temperaturas medias.
+
+    El lado con cambio de fase se resuelve por bisección sobre la temperatura de
+    pared, que no admite paso complejo: en ese caso solo sirve para evaluar U.
+    """
+    props_int = propiedades(fluido_int, T_prom_int, fase_int)
+    props_ext = propiedades(fluido_ext, T_prom_ext, fase_ext)
+
+    Re = velocidad * diametro_int * props_int['densidad'] / props_int['viscosidad']
+    mu_mu_s = 1.0
+    if correlacion_turbulenta == "sieder-tate":
+        mu_mu_s = props_int['viscosidad'] / propiedades(fluido_int, (T_prom_int + T_prom_ext) / 2, fase_int)['viscosidad']
+    Nu = nusselt_interno(Re, props_int['Pr'], D=diametro_int, L=longitud_tubo,
+                         correlacion_laminar=correlacion_laminar, correlacion_turbulenta=correlacion_turbulenta,
+                         n=n, mu_mu_s=mu_mu_s)['Nu']
+    h_int = Nu * props_int['k'] / diametro_int
+
+    D_h = diametro_hidraulico(diametro_int, diametro_ext)
+    Re_ext = velocidad_ext * D_h * props_ext['densidad'] / props_ext['viscosidad']
+    nu_ext = nu_anulo(Re_ext, props_ext['Pr'], diametro_int / diametro_ext, caso=caso_anulo,
+                      razon_flujos=razon_flujos)
+    Nu_ext = nu_ext['Nuo'] if caso_anulo == "pared externa calentada" else nu_ext['Nui']
+    h_ext = Nu_ext * props_ext['k'] / D_h
+
+    verificar_lados(cambio_fase_int, cambio_fase_ext)
+    opciones_cambio_fase = opciones_cambio_fase or {}
+    if cambio_fase_int is not None:
+        h_int = temperatura_pared(cambio_fase_int, fluido_int, T_prom_int, T_prom_ext, h_ext, diametro_int,
+                                  **opciones_cambio_fase)['h']
+    elif cambio_fase_ext is not None:
+        h_ext = temperatura_pared(cambio_fase_ext, fluido_ext, T_prom_ext, T_prom_int, h_int, diametro_int,
+                                  **opciones_cambio_fase)['h']
+
+    return {'U': 1 / (1 / h_int + 1 / h_ext), 'h_int': h_int, 'h_ext': h_ext}
+
+
+def modelo_conduccion(geometria, T1, T2, h_in=0.0, h_out=0.0, A=None, L_cil=None, r_interior=None,
+                      R_exterior=None, emisividad_in=0.0, emisividad_out=0.0, T_alr_in=None, T_alr_out=None,
+                      aletas=None, k_aleta=None, espesor_aleta=None, largo_aleta=None, ancho_aleta=None,
+                      **capas):
+    """
+    q y R_total de la pared multicapa; las capas llegan como k_1, e_1, k_2, e_2, ...
+
+    Si R_exterior se indica reemplaza al término 1/(h_out·A). Con aletas (el diccionario
+    de la página de conducción) la resistencia exterior se calcula aquí a partir de h_out;
+    k_aleta, espesor_aleta, largo_aleta y ancho_aleta reemplazan a los valores del
+    diccionario, de modo que también admiten el paso complejo.
+    Con emisividades, las superficies también radian y se resuelve el balance no lineal
+    (pared_conveccion_radiacion): R_total pasa a ser (T1 - T2)/q.
+    """
+    k, e = capas_desde_argumentos(capas)
+    pared = resistencias_capas(geometria, k, e, A, L_cil, r_interior)
+    R, A_in, A_out = sum(pared['R_capas']), pared['A_in'], pared['A_out']
+
+    if aletas is not None and R_exterior is None and np.all(np.real(h_out) > 0):
+        R_exterior = resistencia_pared_aletada(
+            aletas['tipo'], h_out, aletas['k'] if k_aleta is None else k_aleta, aletas['n'], A_out,
+            aletas['espesor'] if espesor_aleta is None else espesor_aleta,
+            aletas['largo'] if largo_aleta is None else largo_aleta,
+            aletas['ancho'] if ancho_aleta is None else ancho_aleta,
+            r_base=None if geometria == "Plana" else r_interior + sum(e), punta=aletas['punta'])
+
+    if np.any(np.real(emisividad_in) > 0) or np.any(np.real(emisividad_out) > 0):
+        resultado = pared_conveccion_radiacion(geometria, T1, T2, h_in, h_out, emisividad_in, emisividad_out,
+                                               T_alr_in, T_alr_out, A, L_cil, r_interior, R_exterior, **capas)
+        return {'q': resultado['q'], 'R_total': resultado['R_total']}
+
+    h_in, h_out = np.asarray(h_in), np.asarray(h_out)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        R = R + np.where(np.real(h_in) > 0, 1 / (h_in * A_in), 0.0)
+        if R_exterior is None:
+            R = R + np.where(np.real(h_out) > 0, 1 / (h_out * A_out), 0.0)
+        else:
+            R = R + R_exterior
+    return {'q': (T1 - T2) / R, 'R_total': R}
+
+
+def modelo_efectividad(NTU, C, *, tipo, **configuracion):
+    return {'ε': efectividad(tipo, NTU, C, **configuracion)}
+
+
+def modelo_ntu(epsilon, C, *, tipo, **configuracion):
+    # Fuera de (0, ε_max) el logaritmo complejo daría derivadas espurias en lugar de NaN
+    factible = (np.real(epsilon) > 0) & (np.real(epsilon) < efectividad_maxima(tipo, np.real(C), **configuracion))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return {'NTU': np.where(factible, ntu(tipo, epsilon, C, **configuracion), np.nan)}
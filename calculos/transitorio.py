@@ -0,0 +1,182 @@
+import numpy as np
+from scipy.linalg.lapack import dgbtrf, dgbtrs
+from calculos.doble_tubo import coeficiente_global
+from calculos.flujo_interno import CORRELACIONES_CON_LONGITUD
+
+# Densidad (kg/m³) y calor específico (J/kg·K) del material del tubo interno
+MATERIALES_PARED = {
+    "cobre": (8933.0, 385.0),
+    "acero al carbono": (7854.0, 434.0),
+    "acero inoxidable 304": (7900.0, 477.0),
+    "aluminio": (2702.0, 903.0),
+}
+
+# Estados intercalados [T_int, T_pared, T_ext] por segmento: el acople con el segmento
+# vecino queda a 3 posiciones de la diagonal
+_BANDA = 3
+
+
+# --- Perfiles de entrada ---
+def escalon(inicial, final, t_escalon=0.0):
+    """Perfil en escalón para temperaturas o caudales de entrada: f(t)."""
+    return lambda t: np.where(t < t_escalon, inicial, final)
+
+
+def _perfil(valor):
+    return valor if callable(valor) else (lambda t: valor)
+
+
+# --- Sistema semidiscreto dT/dt = A·T + b ---
+def _sistema(coeficientes, m_int, m_ext, T_int_entrada, T_ext_entrada, contraflujo):
+    """
+    Diagonales de A (por desplazamiento respecto de la diagonal) y vector b.
+
+    Volúmenes finitos con esquema aguas arriba: cada fluido recibe m·cp·(T_aguas_arriba - T)
+    y h·P·dx·(T_pared - T); la pared intercambia con ambos fluidos. Arreglos (B, N, 3).
+    """
+    C_int, C_pared, C_ext, H_int, H_ext, cp_int, cp_ext = coeficientes
+    G_int, G_ext = m_int[:, None] * cp_int, m_ext[:, None] * cp_ext
+    forma = C_int.shape + (3,)
+    diagonales = {d: np.zeros(forma) for d in (-3, -1, 0, 1, 3)}
+    b = np.zeros(forma)
+
+    diagonales[0][..., 0] = -(G_int + H_int) / C_int
+    diagonales[0][..., 1] = -(H_int + H_ext) / C_pared
+    diagonales[0][..., 2] = -(G_ext + H_ext) / C_ext
+    diagonales[1][..., 0] = H_int / C_int
+    diagonales[1][..., 1] = H_ext / C_pared
+    diagonales[-1][..., 1] = H_int / C_pared
+    diagonales[-1][..., 2] = H_ext / C_ext
+
+    # Fluido interno: entra en el segmento 0
+    diagonales[-3][:, 1:, 0] = (G_int / C_int)[:, 1:]
+    b[:, 0, 0] = (G_int / C_int)[:, 0] * T_int_entrada
+    # Fluido externo: en contraflujo entra en el último segmento y avanza hacia el primero
+    if contraflujo:
+        diagonales[3][:, :-1, 2] = (G_ext / C_ext)[:, :-1]
+        b[:, -1, 2] = (G_ext / C_ext)[:, -1] * T_ext_entrada
+    else:
+        diagonales[-3][:, 1:, 2] = (G_ext / C_ext)[:, 1:]
+        b[:, 0, 2] = (G_ext / C_ext)[:, 0] * T_ext_entrada
+    return diagonales, b.ravel()
+
+
+def _factorizar(diagonales, gamma, identidad=True):
+    """LU en banda (LAPACK) de I - γ·A, o de -γ·A sin la identidad; se reutiliza mientras A no cambie."""
+    n = diagonales[0].size
+    # Almacenamiento de dgbtrf: _BANDA filas extra arriba para el relleno del pivoteo
+    banda = np.zeros((3 * _BANDA + 1, n))
+    for d, valores in diagonales.items():
+        valores = -gamma * valores.ravel()
+        if d >= 0:
+            banda[2 * _BANDA - d, d:] = valores[:n - d]
+        else:
+            banda[2 * _BANDA - d, :d] = valores[-d:]
+    if identidad:
+        banda[2 * _BANDA] += 1.0
+    lu, pivotes, info = dgbtrf(banda, _BANDA, _BANDA)
+    if info != 0:
+        raise ValueError("Sistema singular: revise que los caudales sean positivos")
+    return lu, pivotes
+
+
+def _resolver(factorizacion, lado_derecho):
+    lu, pivotes = factorizacion
+    return dgbtrs(lu, _BANDA, _BANDA, lado_derecho, pivotes)[0]
+
+
+# --- Simulación ---
+def simular_doble_tubo(fluido_int, fluido_ext, T_int_entrada, T_ext_entrada, m_int, m_ext, Di, Do, L,
+                       t_final, dt, n_segmentos=50, contraflujo=True, fase_int="líquido", fase_ext="líquido",
+                       espesor_pared=1e-3, material_pared="cobre", T_inicial=None, actualizar_cada=10,
+                       **opciones_U):
+    """
+    Respuesta transitoria de un doble tubo por el método de líneas.
+
+    Ambos fluidos y la pared del tubo interno se discretizan en n_segmentos a lo
+    largo de L; el sistema de EDOs se integra con BDF2 (el primer paso con Euler
+    implícito), resolviendo en cada paso un sistema en banda: costo y memoria
+    lineales en el número de segmentos.
+
+    Temperaturas (°C) y caudales (kg/s) de entrada pueden ser constantes, arreglos
+    (un lote de casos que se integra en el mismo sistema en banda) o funciones del
+    tiempo (p. ej. escalon). h y propiedades salen de coeficiente_global en cada
+    segmento a sus temperaturas locales y se reevalúan cada `actualizar_cada` pasos.
+    Sin T_inicial se parte del estado estacionario a las condiciones de t = 0.
+
+    Es un generador: entrega por paso un diccionario con 't', 'T_int_salida',
+    'T_ext_salida' y 'Q' (W, calor que cede el fluido interno a la pared).
+    """
+    perfiles = [_perfil(v) for v in (T_int_entrada, T_ext_entrada, m_int, m_ext)]
+    forma = np.broadcast_shapes(*(np.shape(f(0.0)) for f in perfiles))
+
+    def entradas(t):
+        return [np.broadcast_to(np.asarray(f(t), dtype=float), forma).ravel() for f in perfiles]
+
+    n_casos, N = int(np.prod(forma)), n_segmentos
+    dx = L / N
+    area_int = np.pi * Di**2 / 4
+    area_ext = np.pi * (Do**2 - Di**2) / 4
+    densidad_pared, cp_pared = MATERIALES_PARED[material_pared]
+    C_pared = densidad_pared * cp_pared * np.pi * ((Di + 2 * espesor_pared)**2 - Di**2) / 4 * dx
+    # La geometría no cambia: la caída de presión no se reevalúa y L solo se pasa a las
+    # correlaciones de desarrollo térmico, que la necesitan
+    L_nu = L if opciones_U.get('correlacion_laminar') in CORRELACIONES_CON_LONGITUD else None
+
+    def coeficientes(T, m_i, m_e):
+        resultado = coeficiente_global(fluido_int, fluido_ext, T[..., 0], T[..., 2], m_i[:, None], m_e[:, None],
+                                       Di, Do, fase_int, fase_ext, L=L_nu, con_hidraulica=False, **opciones_U)
+        p_int, p_ext = resultado['props_int'], resultado['props_ext']
+        return (p_int['densidad'] * p_int['cp'] * area_int * dx, C_pared,
+                p_ext['densidad'] * p_ext['cp'] * area_ext * dx,
+                resultado['h_int'] * np.pi * Di * dx, resultado['h_ext'] * np.pi * Di * dx, p_int['cp'], p_ext['cp'])
+
+    def salida(t, T, coef):
+        return {
+            't': t,
+            'T_int_salida': T[:, -1, 0].reshape(forma),
+            'T_ext_salida': (T[:, 0, 2] if contraflujo else T[:, -1, 2]).reshape(forma),
+            'Q': (coef[3] * (T[..., 0] - T[..., 1])).sum(axis=1).reshape(forma),
+        }
+
+    # --- Condición inicial ---
+    T_i0, T_e0, m_i0, m_e0 = entradas(0.0)
+    if T_inicial is None:
+        T = np.empty((n_casos, N, 3))
+        T[..., 0], T[..., 2] = T_i0[:, None], T_e0[:, None]
+        T[..., 1] = (T[..., 0] + T[..., 2]) / 2
+        # Estado estacionario A·T = -b, con las propiedades reevaluadas sobre el perfil
+        for _ in range(3):
+            coef = coeficientes(T, m_i0, m_e0)
+            diagonales, b = _sistema(coef, m_i0, m_e0, T_i0, T_e0, contraflujo)
+            T = _resolver(_factorizar(diagonales, 1.0, identidad=False), b).reshape(n_casos, N, 3)
+    else:
+        T = np.broadcast_to(np.asarray(T_inicial, dtype=float), (n_casos, N, 3)).copy()
+        coef = coeficientes(T, m_i0, m_e0)
+    yield salida(0.0, T, coef)
+
+    # --- Integración: Euler implícito en el primer paso y BDF2 en los siguientes ---
+    # La matriz solo cambia con γ, con los caudales o al reevaluar las propiedades
+    T_anterior, factorizacion, clave, actualizaciones = None, None, None, 0
+    n_pasos = int(np.ceil(t_final / dt - 1e-9))
+    for paso in range(1, n_pasos + 1):
+        t = paso * dt
+        T_i, T_e, m_i, m_e = entradas(t)
+        if paso % actualizar_cada == 0:
+            coef, actualizaciones = coeficientes(T, m_i, m_e), actualizaciones + 1
+        diagonales, b = _sistema(coef, m_i, m_e, T_i, T_e, contraflujo)
+        if T_anterior is None:
+            gamma, lado_derecho = dt, T.ravel()
+        else:
+            gamma, lado_derecho = 2 * dt / 3, (4 * T.ravel() - T_anterior.ravel()) / 3
+        nueva_clave = (gamma, actualizaciones, m_i.tobytes(), m_e.tobytes())
+        if nueva_clave != clave:
+            factorizacion, clave = _factorizar(diagonales, gamma), nueva_clave
+        T_anterior, T = T, _resolver(factorizacion, lado_derecho + gamma * b).reshape(n_casos, N, 3)
+        yield salida(t, T, coef)
+
+
+def respuesta_doble_tubo(*args, **kwargs):
+    """Integra simular_doble_tubo completo y apila las salidas: arreglos (pasos + 1, *forma del lote)."""
+    pasos = list(simular_doble_tubo(*args, **kwargs))
+    return {clave: np.array([p[clave] for p in pasos]) for clave in pasos[0]}
@@ -3,6 +3,11 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.patches import Wedge
+from calculos.aletas import resistencia_pared_aletada, CONDICIONES_PUNTA, TIPOS_ALETA
+from calculos import escenarios
+from calculos.conduccion import pared_conveccion_radiacion, resistencias_capas
+from calculos.grafo import GrafoCalculo
+from calculos.sensibilidad import derivadas_paso_complejo, tabla_sensibilidad, dibujar_tornado, modelo_conduccion
 
 # --- Configuración inicial
 st.set_page_config(layout="wide")
@@ -21,6 +26,11 @@ def convertir_temperatura(valor, unidad_entrada):
     elif unidad_entrada == "K": return valor - 273.15
     return valor
 
+def temperatura_desde_C(valor, unidad_salida):
+    if unidad_salida == "°F": return valor * 9/5 + 32
+    elif unidad_salida == "K": return valor + 273.15
+    return valor
+
 def convertir_k(valor, unidad_entrada):
     factores = {"W/m·K": 1.0, "W/cm·K": 100, "W/mm·K": 1000, "BTU/(h·ft·°F)": 1.73073}
     return valor * factores[unidad_entrada]
@@ -59,7 +69,7 @@ def dibujar_anillos_radiales(radios):
     ax.set_ylim(-radios[-1][1], radios[-1][1])
     ax.axis('off')
     ax.set_title("Visualización de Sección Circular (Radial)")
-    st.pyplot(fig)
+    return fig
 
 def dibujar_capas_rectangulares(capas, unidad_longitud):
     fig, ax = plt.subplots(figsize=(8, 2))
@@ -76,7 +86,7 @@ def dibujar_capas_rectangulares(capas, unidad_longitud):
     ax.set_xlim(0, inicio)
     ax.axis('off')
     ax.set_title(f"Visualización de Capas (Unidad: {unidad_longitud})")
-    st.pyplot(fig)
+    return fig
 
 # --- Sidebar
 st.sidebar.title("Configuración de Unidades")
@@ -103,6 +113,7 @@ with col1:
     T1 = st.number_input(f"Temperatura interna ({unidad_temp})", value=100.0, step=1.0)
     T2 = st.number_input(f"Temperatura externa ({unidad_temp})", value=25.0, step=1.0)
 with col2:
+    A_total = L_cil = None
     if geometria == "Plana":
         A_total = st.number_input(f"Área total ({unidad_area})", value=1.0, step=1.0)
     else:
@@ -116,6 +127,18 @@ if usar_conveccion:
 else:
     h_in = h_out = 0
 
+radiacion = None
+if st.checkbox("¿Incluir radiación en las superficies interna y externa?"):
+    col1, col2 = st.columns(2)
+    with col1:
+        emisividad_in = st.number_input("Emisividad superficie interior", min_value=0.0, max_value=1.0, value=0.8, step=0.05)
+        T_alr_in = st.number_input(f"Temperatura de alrededores interior ({unidad_temp})", value=T1, step=1.0)
+    with col2:
+        emisividad_out = st.number_input("Emisividad superficie exterior", min_value=0.0, max_value=1.0, value=0.8, step=0.05)
+        T_alr_out = st.number_input(f"Temperatura de alrededores exterior ({unidad_temp})", value=T2, step=1.0)
+    radiacion = {"emisividad_in": emisividad_in, "emisividad_out": emisividad_out,
+                 "T_alr_in": T_alr_in, "T_alr_out": T_alr_out}
+
 materiales = cargar_materiales("tabla_a3.csv")
 tabla_capas = []
 radios = []
@@ -150,48 +173,231 @@ for i in range(n_capas):
         st.write(" ")
     tabla_capas.append({"material": mat, "L": e, "k": k})
 
+# --- Aletas en la superficie exterior
+aletas = None
+if usar_conveccion and st.checkbox("¿Superficie exterior con aletas?"):
+    st.subheader("Aletas exteriores")
+    tipos_disponibles = TIPOS_ALETA if geometria == "Cilíndrica" else TIPOS_ALETA[:2]
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        tipo_aleta = st.selectbox("Tipo de aleta", tipos_disponibles)
+        punta = st.selectbox("Condición en la punta", CONDICIONES_PUNTA)
+        n_aletas = st.number_input("Número de aletas", min_value=1, value=10, step=1)
+    with col2:
+        mat_aleta = st.selectbox("Material de la aleta", materiales["Material"], key="mat_aleta")
+        k_aleta = materiales[materiales["Material"] == mat_aleta]["Conductividad térmica (W/m·K)"].values[0]
+        espesor_aleta = convertir_longitud(st.number_input(
+            "Diámetro de la aguja" if tipo_aleta == "aguja" else "Espesor de la aleta",
+            min_value=0.00001, value=0.002, key="espesor_aleta", format="%.4f"), unidad_longitud)
+    with col3:
+        if tipo_aleta == "anular":
+            largo_aleta = convertir_longitud(st.number_input(
+                "Altura radial de la aleta (r2 - r1)", min_value=0.0001, value=0.02, key="largo_aleta"), unidad_longitud)
+        else:
+            largo_aleta = convertir_longitud(st.number_input(
+                "Longitud de la aleta", min_value=0.0001, value=0.02, key="largo_aleta"), unidad_longitud)
+        ancho_aleta = None
+        if tipo_aleta == "recta":
+            ancho_aleta = convertir_longitud(st.number_input(
+                "Ancho de la aleta", min_value=0.0001, value=0.1, key="ancho_aleta"), unidad_longitud)
+    aletas = {"tipo": tipo_aleta, "punta": punta, "n": n_aletas, "k": float(k_aleta),
+              "espesor": espesor_aleta, "largo": largo_aleta, "ancho": ancho_aleta}
+
+# --- Grafo de cálculo: solo se recalcula lo que depende de entradas modificadas
+grafo = GrafoCalculo(st.session_state.setdefault("grafo_conduc", {}))
+grafo.entradas(
+    geometria=geometria, unidad_longitud=unidad_longitud, unidad_area=unidad_area, unidad_temp=unidad_temp,
+    unidad_h=unidad_h, T1=T1, T2=T2, A_total=A_total, L_cil=L_cil, h_in=h_in, h_out=h_out,
+    tabla_capas=tabla_capas, radios=radios, aletas=aletas, radiacion=radiacion,
+)
+
+@grafo.nodo
+def figura_capas(geometria, tabla_capas, radios, unidad_longitud):
+    if geometria == "Plana":
+        return dibujar_capas_rectangulares(tabla_capas, unidad_longitud)
+    return dibujar_anillos_radiales(radios)
+
+@grafo.nodo
+def T1_C(T1, unidad_temp):
+    return convertir_temperatura(T1, unidad_temp)
+
+@grafo.nodo
+def T2_C(T2, unidad_temp):
+    return convertir_temperatura(T2, unidad_temp)
+
+@grafo.nodo
+def A_m2(A_total, unidad_area):
+    return convertir_area(A_total, unidad_area) if A_total is not None else None
+
+@grafo.nodo
+def h_in_SI(h_in, unidad_h):
+    return convertir_h(h_in, unidad_h)
+
+@grafo.nodo
+def h_out_SI(h_out, unidad_h):
+    return convertir_h(h_out, unidad_h)
+
+# Resistencia de cada capa y áreas interior y exterior de la pared
+@grafo.nodo
+def pared(geometria, tabla_capas, radios, A_m2, L_cil):
+    return resistencias_capas(geometria, [c["k"] for c in tabla_capas], [c["L"] for c in tabla_capas],
+                              A_m2, L_cil, radios[0][0] if radios else None)
+
+@grafo.nodo
+def A_exterior(pared):
+    return pared['A_out']
+
+@grafo.nodo
+def R_exterior(h_out_SI, A_exterior, aletas, radios):
+    # Sin convección exterior no hay resistencia exterior (ni aletas que evaluar)
+    if h_out_SI <= 0:
+        return None
+    if aletas is None:
+        return 1 / (h_out_SI * A_exterior)
+    return float(resistencia_pared_aletada(aletas["tipo"], h_out_SI, aletas["k"], aletas["n"], A_exterior,
+                                           aletas["espesor"], aletas["largo"], aletas["ancho"],
+                                           r_base=radios[-1][1] if radios else None, punta=aletas["punta"]))
+
+@grafo.nodo
+def R_total(pared, h_in_SI, R_exterior):
+    R = sum(pared['R_capas'])
+    if h_in_SI > 0:
+        R += 1 / (h_in_SI * pared['A_in'])
+    if R_exterior is not None:
+        R += R_exterior
+    return R
+
+@grafo.nodo
+def radiacion_SI(radiacion, unidad_temp):
+    if radiacion is None:
+        return None
+    return {"emisividad_in": radiacion["emisividad_in"], "emisividad_out": radiacion["emisividad_out"],
+            "T_alr_in": convertir_temperatura(radiacion["T_alr_in"], unidad_temp),
+            "T_alr_out": convertir_temperatura(radiacion["T_alr_out"], unidad_temp)}
+
+# Con radiación las temperaturas de superficie salen del balance no lineal (Newton)
+@grafo.nodo
+def balance_superficies(geometria, T1_C, T2_C, h_in_SI, h_out_SI, A_m2, L_cil, tabla_capas, radios, aletas,
+                        R_exterior, radiacion_SI):
+    if radiacion_SI is None:
+        return None
+    capas = {}
+    for i, capa in enumerate(tabla_capas):
+        capas[f'k_{i + 1}'] = capa['k']
+        capas[f'e_{i + 1}'] = capa['L']
+    resultado = pared_conveccion_radiacion(
+        geometria, T1_C, T2_C, h_in_SI, h_out_SI, A=A_m2, L_cil=L_cil,
+        r_interior=radios[0][0] if radios else None, R_exterior=R_exterior if aletas is not None else None,
+        **radiacion_SI, **capas)
+    return {nombre: np.asarray(valor).tolist() for nombre, valor in resultado.items()}
+
+@grafo.nodo
+def q(T1_C, T2_C, R_total, balance_superficies):
+    if balance_superficies is not None:
+        return balance_superficies['q']
+    return (T1_C - T2_C) / R_total
+
+@grafo.nodo
+def perfil_temperaturas(T1_C, q, tabla_capas, pared, h_in_SI, balance_superficies):
+    if balance_superficies is not None:
+        T_interfaces = balance_superficies['T_interfaces']
+    else:
+        # Sin radiación: caída lineal a lo largo de la cadena de resistencias
+        T_interfaces = [T1_C - q / (h_in_SI * pared['A_in']) if h_in_SI > 0 else T1_C]
+        for R_capa in pared['R_capas']:
+            T_interfaces.append(T_interfaces[-1] - q * R_capa)
+    interfaces = [f"{c['material']} / {s['material']}" for c, s in zip(tabla_capas, tabla_capas[1:])]
+    nombres = ["Superficie interior"] + interfaces + ["Superficie exterior"]
+    return pd.DataFrame({"Posición": nombres, "T (°C)": T_interfaces})
+
+# Sensibilidad de q y R_total respecto de todas las entradas numéricas (paso complejo)
+@grafo.nodo
+def sensibilidad_conduccion(geometria, T1_C, T2_C, h_in_SI, h_out_SI, A_m2, L_cil, tabla_capas, radios, aletas,
+                            radiacion_SI):
+    entradas = {'T1': T1_C, 'T2': T2_C}
+    if h_in_SI > 0:
+        entradas['h_in'] = h_in_SI
+    if h_out_SI > 0:
+        entradas['h_out'] = h_out_SI
+        # Con aletas la resistencia exterior se arma dentro del modelo: h_out y la aleta entran al paso complejo
+        if aletas is not None:
+            entradas.update(k_aleta=aletas['k'], espesor_aleta=aletas['espesor'], largo_aleta=aletas['largo'])
+            if aletas['tipo'] == "recta":
+                entradas['ancho_aleta'] = aletas['ancho']
+    if geometria == "Plana":
+        entradas['A'] = A_m2
+    else:
+        entradas['r_interior'] = radios[0][0]
+        if geometria == "Cilíndrica":
+            entradas['L_cil'] = L_cil
+    for i, capa in enumerate(tabla_capas):
+        entradas[f'k_{i + 1}'] = capa['k']
+        entradas[f'e_{i + 1}'] = capa['L']
+    if radiacion_SI is not None:
+        entradas.update(radiacion_SI)
+    resultado = derivadas_paso_complejo(lambda **x: modelo_conduccion(geometria, aletas=aletas, **x), entradas)
+    return {salida: tabla_sensibilidad(resultado[salida]) for salida in ('q', 'R_total')}
+
 # --- Visualización
 st.subheader("Visualización")
-if geometria == "Plana":
-    dibujar_capas_rectangulares(tabla_capas, unidad_longitud)
-else:
-    dibujar_anillos_radiales(radios)
+st.pyplot(grafo.valor('figura_capas'))
 
 # --- Cálculo
 if st.button("Calcular transferencia de calor"):
-    T1_C = convertir_temperatura(T1, unidad_temp)
-    T2_C = convertir_temperatura(T2, unidad_temp)
-    if geometria == "Plana":
-        A_m2 = convertir_area(A_total, unidad_area)
-        R_total = sum(c["L"] / (c["k"] * A_m2) for c in tabla_capas)
-        if h_in > 0:
-            R_total += 1 / (convertir_h(h_in, unidad_h) * A_m2)
-        if h_out > 0:
-            R_total += 1 / (convertir_h(h_out, unidad_h) * A_m2)
-    elif geometria == "Cilíndrica":
-        R_total = 0
-        for (r_i, r_o, _), c in zip(radios, tabla_capas):
-            R_total += np.log(r_o / r_i) / (2 * np.pi * L_cil * c["k"])
-        if h_in > 0:
-            R_total += 1 / (convertir_h(h_in, unidad_h) * 2 * np.pi * radios[0][0] * L_cil)
-        if h_out > 0:
-            R_total += 1 / (convertir_h(h_out, unidad_h) * 2 * np.pi * radios[-1][1] * L_cil)
-    elif geometria == "Esférica":
-        R_total = 0
-        for (r_i, r_o, _), c in zip(radios, tabla_capas):
-            R_total += (1 / (4 * np.pi * c["k"])) * (1/r_i - 1/r_o)
-        if h_in > 0:
-            R_total += 1 / (convertir_h(h_in, unidad_h) * 4 * np.pi * radios[0][0]**2)
-        if h_out > 0:
-            R_total += 1 / (convertir_h(h_out, unidad_h) * 4 * np.pi * radios[-1][1]**2)
-
-    q = (T1_C - T2_C) / R_total
-    A_ref = convertir_area(A_total, unidad_area) if geometria == "Plana" else 1
+    valor_R_total, valor_q, balance = grafo.valores('R_total', 'q', 'balance_superficies')
+    A_ref = grafo.valor('A_m2') if geometria == "Plana" else 1
+    if balance is not None:
+        # Con radiación la resistencia equivalente incluye el efecto de los alrededores
+        valor_R_total = balance['R_total']
+        if not balance['convergido']:
+            st.error("El balance de superficies con radiación no convergió")
 
     st.success(f"""
     **Resultados:**
-    - Resistencia total: {R_total:.6f} K/W
-    - Flujo de calor: {formatear_resultado(q, unidad_flujo, 'flujo'):.2f} {unidad_flujo}
+    - Resistencia {'equivalente (T1 - T2)/q' if balance is not None else 'total'}: {valor_R_total:.6f} K/W
+    - Flujo de calor: {formatear_resultado(valor_q, unidad_flujo, 'flujo'):.2f} {unidad_flujo}
     """)
     if geometria == "Plana":
-        st.success(f"- Flujo por área: {formatear_resultado(q/A_ref, unidad_flujo_area, 'flujo_area'):.2f} {unidad_flujo_area}")
+        st.success(f"- Flujo por área: {formatear_resultado(valor_q/A_ref, unidad_flujo_area, 'flujo_area'):.2f} {unidad_flujo_area}")
+
+    st.subheader("Temperaturas en superficies e interfaces")
+    perfil = grafo.valor('perfil_temperaturas')
+    st.dataframe(pd.DataFrame({"Posición": perfil["Posición"],
+                               f"T ({unidad_temp})": temperatura_desde_C(perfil["T (°C)"], unidad_temp)}), hide_index=True)
+    if balance is not None:
+        st.dataframe(pd.DataFrame({
+            "Superficie": ["Interior", "Exterior"],
+            f"Convección ({unidad_flujo})": [formatear_resultado(balance['q_conveccion_in'], unidad_flujo, 'flujo'),
+                                             formatear_resultado(balance['q_conveccion_out'], unidad_flujo, 'flujo')],
+            f"Radiación ({unidad_flujo})": [formatear_resultado(balance['q_radiacion_in'], unidad_flujo, 'flujo'),
+                                            formatear_resultado(balance['q_radiacion_out'], unidad_flujo, 'flujo')],
+            "h_rad (W/m²·K)": [balance['h_rad_in'], balance['h_rad_out']],
+        }), hide_index=True)
+
+    # Registro en el almacén de escenarios (unidades SI)
+    entradas = {'geometria': geometria, 'T1': grafo.valor('T1_C'), 'T2': grafo.valor('T2_C'),
+                'h_in': grafo.valor('h_in_SI'), 'h_out': grafo.valor('h_out_SI'), 'aletas': aletas}
+    if geometria == "Plana":
+        entradas['A'] = grafo.valor('A_m2')
+    else:
+        entradas['r_interior'] = radios[0][0]
+        if geometria == "Cilíndrica":
+            entradas['L_cil'] = L_cil
+    for i, capa in enumerate(tabla_capas):
+        entradas[f'k_{i + 1}'] = capa['k']
+        entradas[f'e_{i + 1}'] = capa['L']
+    if radiacion is not None:
+        entradas.update(grafo.valor('radiacion_SI'))
+    escenarios.guardar('conduc', entradas, {'q': valor_q, 'R_total': valor_R_total})
+
+# --- Sensibilidad
+if st.checkbox("Mostrar sensibilidad de q y R_total (derivadas por paso complejo)"):
+    st.subheader("Sensibilidad")
+    sensibilidad = grafo.valor('sensibilidad_conduccion')
+    salida = st.radio("Salida", ["q", "R_total"], horizontal=True)
+    figura = dibujar_tornado(sensibilidad[salida], salida)
+    st.pyplot(figura)
+    plt.close(figura)
+    st.dataframe(sensibilidad[salida])
+    st.caption("k_i y e_i son la conductividad y el espesor de la capa i; k_aleta, espesor_aleta y largo_aleta "
+               "describen las aletas exteriores; la elasticidad es el cambio porcentual de la salida por cada 1 % de cambio en la entrada")
@@ -0,0 +1,107 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+from calculos.dimensionamiento import dimensionar
+from calculos.hidraulica import RUGOSIDADES
+from calculos.propiedades import ARCHIVOS_PROPIEDADES, FLUIDOS_CON_FASES
+
+# --- Configuración de la página ---
+st.set_page_config(page_title="Dimensionamiento Doble Tubo", layout="wide")
+st.title("Dimensionamiento de Intercambiador de Doble Tubo")
+st.markdown("Área y longitud requeridas para alcanzar una carga térmica o temperatura de salida objetivo.")
+
+TIPOS_DOBLE_TUBO = ["Flujo en contraflujo (doble tubo)", "Flujo paralelo (doble tubo)"]
+
+# --- Configuración ---
+with st.sidebar:
+    st.header("⚙️ Configuración")
+    tipo = st.selectbox("Tipo de intercambiador", TIPOS_DOBLE_TUBO)
+    Di = st.number_input("Diámetro interno del tubo (m)", min_value=0.001, value=0.025, format="%.4f")
+    Do = st.number_input("Diámetro de la carcasa (m)", min_value=0.002, value=0.05, format="%.4f")
+    caliente_en_tubo = st.radio("Fluido en el tubo", ["caliente", "frío"], horizontal=True) == "caliente"
+    reevaluar = st.checkbox("Reevaluar propiedades a la temperatura media", value=True)
+    st.subheader("Hidráulica")
+    material = st.selectbox("Material del tubo (rugosidad)", list(RUGOSIDADES))
+    n_retornos = st.number_input("Retornos de 180° por fluido", min_value=0, value=0, step=1)
+    eficiencia_bomba = st.number_input("Eficiencia de bombeo", min_value=0.05, max_value=1.0, value=0.7)
+
+# --- Fluidos ---
+col1, col2 = st.columns(2)
+with col1:
+    st.subheader("Fluido caliente")
+    fluido_caliente = st.selectbox("Fluido caliente", list(ARCHIVOS_PROPIEDADES.keys()))
+    fase_caliente = "líquido"
+    if fluido_caliente in FLUIDOS_CON_FASES:
+        fase_caliente = st.radio("Fase fluido caliente", ["líquido", "vapor"], horizontal=True)
+    m_caliente = st.number_input("Flujo másico caliente (kg/s)", min_value=0.001, value=0.5)
+    T_caliente_entrada = st.number_input("Temperatura entrada caliente (°C)", value=90.0)
+with col2:
+    st.subheader("Fluido frío")
+    fluido_frio = st.selectbox("Fluido frío", list(ARCHIVOS_PROPIEDADES.keys()))
+    fase_frio = "líquido"
+    if fluido_frio in FLUIDOS_CON_FASES:
+        fase_frio = st.radio("Fase fluido frío", ["líquido", "vapor"], horizontal=True)
+    m_frio = st.number_input("Flujo másico frío (kg/s)", min_value=0.001, value=0.5)
+    T_frio_entrada = st.number_input("Temperatura entrada fría (°C)", value=20.0)
+
+# --- Especificación objetivo ---
+st.header("Especificación")
+especificacion = st.radio("Objetivo", ["Carga térmica (Q)", "Temperatura salida caliente", "Temperatura salida fría"],
+                          horizontal=True)
+modo_lote = st.checkbox("Evaluar un lote de especificaciones (CSV con una columna 'objetivo')")
+if modo_lote:
+    archivo = st.file_uploader("Archivo CSV", type="csv")
+    objetivo = pd.read_csv(archivo)['objetivo'].to_numpy(dtype=float) if archivo is not None else None
+else:
+    valor_defecto = 50000.0 if especificacion == "Carga térmica (Q)" else 60.0
+    objetivo = np.array([st.number_input("Valor objetivo (W o °C)", value=valor_defecto)])
+
+argumentos = {
+    "Carga térmica (Q)": "Q",
+    "Temperatura salida caliente": "T_caliente_salida",
+    "Temperatura salida fría": "T_frio_salida",
+}
+
+if objetivo is not None and st.button("Dimensionar"):
+    try:
+        resultado = dimensionar(
+            fluido_caliente, fluido_frio, m_caliente, m_frio, T_caliente_entrada, T_frio_entrada,
+            Di, Do, tipo=tipo, caliente_en_tubo=caliente_en_tubo,
+            fase_caliente=fase_caliente, fase_frio=fase_frio, reevaluar_propiedades=reevaluar,
+            opciones_hidraulica={'rugosidad': RUGOSIDADES[material], 'n_retornos': n_retornos,
+                                 'eficiencia_bomba': eficiencia_bomba},
+            **{argumentos[especificacion]: objetivo}
+        )
+        tabla = pd.DataFrame({
+            'objetivo': objetivo,
+            'Q (W)': resultado['Q'],
+            'T salida caliente (°C)': resultado['T_caliente_salida'],
+            'T salida fría (°C)': resultado['T_frio_salida'],
+            'U (W/m²K)': resultado['U'],
+            'ε': resultado['epsilon'],
+            'ε máx': resultado['epsilon_max'],
+            'NTU': resultado['NTU'],
+            'Área (m²)': resultado['A'],
+            'Longitud (m)': resultado['L'],
+            'Δp caliente (kPa)': resultado['delta_p_caliente'] / 1000,
+            'Δp frío (kPa)': resultado['delta_p_frio'] / 1000,
+            'Potencia bombeo caliente (W)': resultado['potencia_caliente'],
+            'Potencia bombeo frío (W)': resultado['potencia_frio'],
+            'Factible': resultado['factible'],
+        })
+
+        if len(tabla) == 1:
+            if resultado['factible'][0]:
+                st.success(f"**Área requerida: {resultado['A'][0]:.3f} m² — Longitud: {resultado['L'][0]:.2f} m**")
+                st.write(f"Caída de presión: caliente {resultado['delta_p_caliente'][0]/1000:.2f} kPa, "
+                         f"frío {resultado['delta_p_frio'][0]/1000:.2f} kPa — potencia de bombeo total "
+                         f"{resultado['potencia_caliente'][0] + resultado['potencia_frio'][0]:.1f} W")
+            else:
+                st.error(f"Especificación no factible: ε = {resultado['epsilon'][0]:.4f} "
+                         f"supera el límite ε_máx = {resultado['epsilon_max'][0]:.4f} para C = {resultado['C'][0]:.3f}")
+        else:
+            st.write(f"{int(resultado['factible'].sum())} de {len(tabla)} especificaciones factibles")
+        st.dataframe(tabla)
+        st.download_button("Descargar resultados", tabla.to_csv(index=False), "dimensionamiento.csv")
+    except Exception as e:
+        st.error(f"Error en los cálculos: {str(e)}")
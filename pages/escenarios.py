@@ -0,0 +1,89 @@
+import os
+import tempfile
+import streamlit as st
+import pandas as pd
+from calculos import escenarios
+from calculos.propiedades import ARCHIVOS_PROPIEDADES
+
+# --- Configuración de la página ---
+st.set_page_config(page_title="Escenarios guardados", layout="wide")
+st.title("Escenarios Guardados")
+st.markdown("Consulta, exportación y recálculo de los resultados guardados por las demás páginas.")
+
+# La exportación solo se regenera cuando cambia el contenido de la base
+@st.cache_data(max_entries=1, show_spinner=False)
+def exportacion(firma):
+    lineas = list(escenarios.lineas_exportacion())
+    return "".join(lineas).encode("utf-8"), len(lineas)
+
+PAGINAS = {
+    "Todas": None,
+    "Coeficiente global (U)": "u",
+    "Conducción": "conduc",
+    "ε-NTU": "ntu_e",
+    "Intercambiadores (balances)": "hx3",
+}
+
+# --- Filtros ---
+with st.sidebar:
+    st.header("🔎 Filtros")
+    pagina = PAGINAS[st.selectbox("Página", list(PAGINAS))]
+    fluido = st.selectbox("Fluido (interno o externo)", ["Todos"] + list(ARCHIVOS_PROPIEDADES.keys()))
+    geometria = st.selectbox("Geometría (conducción)", ["Todas", "Plana", "Cilíndrica", "Esférica"])
+    columna = st.selectbox("Filtrar por rango de", ["Ninguno", "U", "Q", "epsilon", "NTU", "diametro_int"])
+    rangos = {}
+    if columna != "Ninguno":
+        minimo = st.number_input(f"{columna} mínimo", value=0.0)
+        maximo = st.number_input(f"{columna} máximo", value=1.0e6)
+        rangos = {f"{columna}_min": minimo, f"{columna}_max": maximo}
+    limite = st.number_input("Máximo de filas", min_value=10, value=1000, step=100)
+
+resultados = escenarios.buscar(
+    pagina=pagina,
+    fluido=None if fluido == "Todos" else fluido,
+    geometria=None if geometria == "Todas" else geometria,
+    limite=int(limite),
+    **rangos,
+)
+
+st.header("1. Resultados")
+versiones = ", ".join(f"{p} `{v}`" for p, v in escenarios.VERSIONES_CALCULO.items())
+st.write(f"{len(resultados)} escenarios encontrados (versión actual del cálculo por página: {versiones})")
+desactualizados = int((resultados['version'] != resultados['pagina'].map(escenarios.VERSIONES_CALCULO)).sum())
+if desactualizados:
+    st.warning(f"{desactualizados} escenarios se calcularon con una versión anterior del código")
+st.dataframe(resultados.drop(columns=['hash']), use_container_width=True)
+
+# --- Recálculo en lote ---
+st.header("2. Recálculo en lote")
+col1, col2 = st.columns(2)
+with col1:
+    solo_desactualizados = st.checkbox("Solo escenarios desactualizados", value=True)
+with col2:
+    procesos = st.number_input("Procesos en paralelo", min_value=1, value=os.cpu_count() or 1, step=1)
+if st.button("Recalcular escenarios"):
+    with st.spinner("Recalculando..."):
+        resultado = escenarios.recalcular_todos(procesos=int(procesos), solo_desactualizados=solo_desactualizados)
+    st.success(f"Escenarios actualizados: {resultado['actualizados']}")
+    if resultado['errores']:
+        st.error("Errores en el recálculo:")
+        st.dataframe(pd.DataFrame(list(resultado['errores'].items()), columns=['id', 'error']))
+
+# --- Exportación e importación ---
+st.header("3. Exportar / importar")
+col1, col2 = st.columns(2)
+with col1:
+    contenido, n = exportacion(escenarios.firma())
+    st.download_button(f"Descargar {n} escenarios (JSON Lines)", contenido,
+                       file_name="escenarios.jsonl", mime="application/jsonl")
+with col2:
+    subido = st.file_uploader("Importar escenarios (JSON Lines)", type=["jsonl"])
+    if subido is not None and st.button("Importar"):
+        with tempfile.TemporaryDirectory() as directorio:
+            archivo = os.path.join(directorio, "importados.jsonl")
+            with open(archivo, "wb") as f:
+                f.write(subido.getvalue())
+            try:
+                st.success(f"Escenarios importados: {escenarios.importar(archivo)}")
+            except Exception as e:
+                st.error(f"Error al importar: {str(e)}")
@@ -1,7 +1,7 @@
 import streamlit as st
-import numpy as np
 import pandas as pd
 from scipy.interpolate import interp1d
+from calculos import balance, escenarios
 
 # Configuración de página
 st.set_page_config(page_title="Intercambiadores de Calor - Propiedades Termodinámicas", layout="wide")
@@ -104,7 +104,8 @@ if parametro == "Carga térmica (Q)":
     T_in = st.number_input("Temperatura de entrada (°C)", value=90.0)
     T_out = st.number_input("Temperatura de salida (°C)", value=60.0)
     if st.button("Calcular Q"):
-        Q = m * cp * (T_in - T_out)
+        Q = balance.carga_termica(m, cp, T_in, T_out)
+        escenarios.guardar('hx3', {'parametro': parametro, 'm': m, 'cp': cp, 'T_in': T_in, 'T_out': T_out}, {'Q': Q})
         st.success(f"Carga térmica (Q): {Q/1000:.2f} kW")
 
 elif parametro == "LMTD":
@@ -114,9 +115,9 @@ elif parametro == "LMTD":
     T_cold_in = st.number_input("Temperatura entrada fluido frío (°C)", value=20.0)
     T_cold_out = st.number_input("Temperatura salida fluido frío (°C)", value=50.0)
     if st.button("Calcular LMTD"):
-        delta_T1 = T_hot_in - T_cold_out
-        delta_T2 = T_hot_out - T_cold_in
-        LMTD = (delta_T1 - delta_T2) / np.log(delta_T1 / delta_T2) if delta_T1 != delta_T2 else delta_T1
+        LMTD = balance.lmtd(T_hot_in, T_hot_out, T_cold_in, T_cold_out)
+        escenarios.guardar('hx3', {'parametro': parametro, 'T_hot_in': T_hot_in, 'T_hot_out': T_hot_out,
+                                   'T_cold_in': T_cold_in, 'T_cold_out': T_cold_out}, {'LMTD': LMTD})
         st.success(f"LMTD: {LMTD:.2f} °C")
 
 elif parametro == "Temperatura de salida":
@@ -133,15 +134,19 @@ elif parametro == "Temperatura de salida":
         T_cold_out = st.number_input("Temperatura salida fluido frío (°C)", value=50.0)
         if st.button("Calcular T_hot_out"):
             # Igualar Q_hot = Q_cold
-            # m_hot * cp_hot * (T_hot_in - T_hot_out) = m_cold * cp_cold * (T_cold_out - T_cold_in)
-            T_hot_out = T_hot_in - (m_cold * cp_cold * (T_cold_out - T_cold_in)) / (m_hot * cp_hot)
+            T_hot_out = balance.temperatura_salida_caliente(m_hot, cp_hot, m_cold, cp_cold, T_hot_in, T_cold_in, T_cold_out)
+            escenarios.guardar('hx3', {'parametro': "Temperatura salida caliente", 'm_hot': m_hot, 'cp_hot': cp_hot,
+                                       'm_cold': m_cold, 'cp_cold': cp_cold, 'T_hot_in': T_hot_in,
+                                       'T_cold_in': T_cold_in, 'T_cold_out': T_cold_out}, {'T_hot_out': T_hot_out})
             st.success(f"Temperatura de salida fluido caliente: {T_hot_out:.2f} °C")
     else:
         T_hot_out = st.number_input("Temperatura salida fluido caliente (°C)", value=60.0)
         if st.button("Calcular T_cold_out"):
             # Igualar Q_hot = Q_cold
-            # m_hot * cp_hot * (T_hot_in - T_hot_out) = m_cold * cp_cold * (T_cold_out - T_cold_in)
-            T_cold_out = T_cold_in + (m_hot * cp_hot * (T_hot_in - T_hot_out)) / (m_cold * cp_cold)
+            T_cold_out = balance.temperatura_salida_fria(m_hot, cp_hot, m_cold, cp_cold, T_hot_in, T_cold_in, T_hot_out)
+            escenarios.guardar('hx3', {'parametro': "Temperatura salida fría", 'm_hot': m_hot, 'cp_hot': cp_hot,
+                                       'm_cold': m_cold, 'cp_cold': cp_cold, 'T_hot_in': T_hot_in,
+                                       'T_cold_in': T_cold_in, 'T_hot_out': T_hot_out}, {'T_cold_out': T_cold_out})
             st.success(f"Temperatura de salida fluido frío: {T_cold_out:.2f} °C")
 
 elif parametro == "Eficacia (ε)":
@@ -154,11 +159,9 @@ elif parametro == "Eficacia (ε)":
     T_hot_in = st.number_input("Temperatura entrada caliente (°C)", value=90.0)
     T_cold_in = st.number_input("Temperatura entrada fría (°C)", value=20.0)
     if st.button("Calcular eficacia"):
-        c_hot = m_hot * cp_hot
-        c_cold = m_cold * cp_cold
-        cmin = min(c_hot, c_cold)
-        qmax = cmin * (T_hot_in - T_cold_in)
-        e = Q / qmax if qmax != 0 else np.nan
+        e = balance.eficacia(Q, m_hot, cp_hot, m_cold, cp_cold, T_hot_in, T_cold_in)
+        escenarios.guardar('hx3', {'parametro': parametro, 'Q': Q, 'm_hot': m_hot, 'cp_hot': cp_hot, 'm_cold': m_cold,
+                                   'cp_cold': cp_cold, 'T_hot_in': T_hot_in, 'T_cold_in': T_cold_in}, {'epsilon': e})
         st.success(f"Eficacia (ε): {e:.3f}")
 
 elif parametro == "Razón de capacidades (c)":
@@ -168,11 +171,9 @@ elif parametro == "Razón de capacidades (c)":
     m_cold = st.number_input("Flujo másico frío (kg/s)", min_value=0.01, value=1.0)
     cp_cold = st.number_input("Calor específico frío (J/kg·K)", min_value=100.0, value=4186.0)
     if st.button("Calcular razón de capacidades"):
-        c_hot = m_hot * cp_hot
-        c_cold = m_cold * cp_cold
-        cmin = min(c_hot, c_cold)
-        cmax = max(c_hot, c_cold)
-        c = cmin / cmax if cmax != 0 else np.nan
+        c = balance.razon_capacidades(m_hot, cp_hot, m_cold, cp_cold)
+        escenarios.guardar('hx3', {'parametro': parametro, 'm_hot': m_hot, 'cp_hot': cp_hot,
+                                   'm_cold': m_cold, 'cp_cold': cp_cold}, {'c': c})
         st.success(f"Razón de capacidades (c): {c:.3f}")
 
 elif parametro == "R y P":
@@ -182,7 +183,8 @@ elif parametro == "R y P":
     T_cold_in = st.number_input("Temperatura entrada fría (°C)", value=20.0)
     T_cold_out = st.number_input("Temperatura salida fría (°C)", value=50.0)
     if st.button("Calcular R y P"):
-        R = (T_hot_in - T_hot_out) / (T_cold_out - T_cold_in) if (T_cold_out - T_cold_in) != 0 else np.nan
-        P = (T_cold_out - T_cold_in) / (T_hot_in - T_cold_in) if (T_hot_in - T_cold_in) != 0 else np.nan
+        R, P = balance.r_y_p(T_hot_in, T_hot_out, T_cold_in, T_cold_out)
+        escenarios.guardar('hx3', {'parametro': parametro, 'T_hot_in': T_hot_in, 'T_hot_out': T_hot_out,
+                                   'T_cold_in': T_cold_in, 'T_cold_out': T_cold_out}, {'R': R, 'P': P})
         st.success(f"R: {R:.3f}")
         st.success(f"P: {P:.3f}")
\ No newline at end of file
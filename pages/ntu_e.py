@@ -2,60 +2,24 @@ import streamlit as st
 import numpy as np
 from scipy.optimize import root_scalar
 import matplotlib.pyplot as plt
+from calculos.cambio_fase import intercambiador_cambio_fase
+from calculos.efectividad import efectividad, arreglo_numerico, MEZCLA_CRUZADO
+from calculos import escenarios
+from calculos.grafo import GrafoCalculo
+from calculos.sensibilidad import derivadas_paso_complejo, tabla_sensibilidad, dibujar_tornado, modelo_efectividad, modelo_ntu
 
 # Configuración de la página
 st.set_page_config(page_title="Calculadora NTU-ε", layout="wide")
 st.title("Calculadora NTU-ε para Intercambiadores de Calor")
 
-# --- Funciones para calcular ε dado NTU ---
-def efectividad_paralelo(NTU, C):
-    return (1 - np.exp(-NTU * (1 + C))) / (1 + C)
-
-def efectividad_contraflujo(NTU, C):
-    if C == 1:
-        return NTU / (1 + NTU)
-    return (1 - np.exp(-NTU * (1 - C))) / (1 - C * np.exp(-NTU * (1 - C)))
-
-def efectividad_coraza_tubos(NTU, C):
-    gamma = NTU * np.sqrt(1 + C**2)
-    return 2 / (1 + C + np.sqrt(1 + C**2) * (1 + np.exp(-gamma)) / (1 - np.exp(-gamma)))
-
-def efectividad_cruzado_Cmax_mezclado(NTU, C):
-    return (1 / C) * (1 - np.exp(-C * (1 - np.exp(-NTU))))
-
-def efectividad_cruzado_Cmin_mezclado(NTU, C):
-    return 1 - np.exp(-(1 / C) * (1 - np.exp(-C * NTU)))
-
-def efectividad_cruzado_no_mezclado(NTU, C):
-    # CORRECCIÓN: Paréntesis agregados
-    return 1 - np.exp((1/C) * (NTU**0.22) * (np.exp(-C * NTU**0.78) - 1))
-
-def efectividad_C_cero(NTU, _):
-    return 1 - np.exp(-NTU)
-
 # --- Funciones para calcular NTU dado ε (usando root_scalar) ---
 def resolver_NTU(ecuacion, epsilon, C):
-    try:
-        sol = root_scalar(
-            lambda NTU: ecuacion(NTU, C) - epsilon,
-            bracket=[0.001, 100],  # Rango de búsqueda
-            method='brentq'
-        )
-        return sol.root
-    except Exception as e:
-        st.error(f"Error en cálculo: {str(e)}")
-        return None
-
-# Mapeo de funciones
-funciones_efectividad = {
-    "Flujo paralelo (doble tubo)": efectividad_paralelo,
-    "Flujo en contraflujo (doble tubo)": efectividad_contraflujo,
-    "Coraza y tubos (1-2, 1-4, ...)": efectividad_coraza_tubos,
-    "Flujo cruzado: Cmax mezclado, Cmin no mezclado": efectividad_cruzado_Cmax_mezclado,
-    "Flujo cruzado: Cmax no mezclado, Cmin mezclado": efectividad_cruzado_Cmin_mezclado,
-    "Flujo cruzado: Ambos no mezclados": efectividad_cruzado_no_mezclado,
-    "Caso especial (C=0): Evaporación/Condensación": efectividad_C_cero
-}
+    sol = root_scalar(
+        lambda NTU: ecuacion(NTU, C) - epsilon,
+        bracket=[0.001, 100],  # Rango de búsqueda
+        method='brentq'
+    )
+    return sol.root
 
 # --- Interfaz de usuario ---
 tipo_intercambiador = st.selectbox(
@@ -79,63 +43,169 @@ calculo = st.radio(
 # Determinar si necesitamos C
 necesita_C = tipo_intercambiador != "Caso especial (C=0): Evaporación/Condensación"
 
+# --- Configuración de pasos y corazas (sin forma cerrada: método de celdas) ---
+configuracion = {}
+if tipo_intercambiador == "Coraza y tubos (1-2, 1-4, ...)":
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        configuracion['pasos'] = int(st.number_input("Pasos de tubo por coraza", min_value=2, max_value=12, value=2, step=2))
+    with col2:
+        configuracion['corazas'] = int(st.number_input("Número de corazas en serie", min_value=1, max_value=6, value=1, step=1))
+    with col3:
+        configuracion['pasos_Cmin'] = st.selectbox("Fluido por los tubos", ["Cmin", "Cmax"]) == "Cmin"
+elif tipo_intercambiador in MEZCLA_CRUZADO:
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        configuracion['pasos'] = int(st.number_input("Número de pasos", min_value=1, max_value=8, value=1, step=1))
+    if configuracion['pasos'] > 1:
+        with col2:
+            configuracion['contracorriente'] = st.selectbox(
+                "Disposición de los pasos", ["Contracorriente", "Paralelo"]) == "Contracorriente"
+        with col3:
+            configuracion['pasos_Cmin'] = st.selectbox("Fluido que hace los pasos", ["Cmin", "Cmax"]) == "Cmin"
+if arreglo_numerico(tipo_intercambiador, **configuracion) is not None:
+    st.caption("Sin forma cerrada: ε se obtiene del método de celdas (la primera consulta de cada arreglo arma su tabla)")
+
+# --- Grafo de cálculo: solo se recalcula lo que depende de entradas modificadas ---
+grafo = GrafoCalculo(st.session_state.setdefault("grafo_ntu_e", {}))
+grafo.entradas(tipo_intercambiador=tipo_intercambiador, configuracion=configuracion)
+
+@grafo.nodo
+def epsilon_calculado(tipo_intercambiador, configuracion, NTU_entrada, C):
+    return float(efectividad(tipo_intercambiador, NTU_entrada, C, **configuracion))
+
+@grafo.nodo
+def NTU_calculado(tipo_intercambiador, configuracion, epsilon_entrada, C):
+    # El error se guarda junto al resultado para mostrarlo también cuando el nodo está memoizado
+    try:
+        return resolver_NTU(lambda NTU, C: efectividad(tipo_intercambiador, NTU, C, **configuracion),
+                            epsilon_entrada, C), None
+    except Exception as e:
+        return None, str(e)
+
+@grafo.nodo
+def curva(tipo_intercambiador, configuracion, C_plot):
+    NTU_values = np.linspace(0.01, 5, 200)
+    return NTU_values, efectividad(tipo_intercambiador, NTU_values, C_plot, **configuracion)
+
+# El punto sale de los nodos memoizados, no del botón, para que la figura solo cambie con las entradas
+@grafo.nodo
+def punto_epsilon(NTU_entrada, epsilon_calculado):
+    return (NTU_entrada, epsilon_calculado)
+
+@grafo.nodo
+def punto_NTU(NTU_calculado, epsilon_entrada):
+    NTU, _ = NTU_calculado
+    return None if NTU is None else (NTU, epsilon_entrada)
+
+@grafo.nodo
+def figura_curva(curva, C_plot, punto):
+    NTU_values, epsilon_values = curva
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.plot(NTU_values, epsilon_values, 'b-', linewidth=2.5)
+    
+    # Punto actual si está calculado
+    if punto is not None:
+        ax.plot(*punto, 'ro', markersize=8)
+    
+    ax.set_xlabel('NTU', fontsize=12)
+    ax.set_ylabel('ε (Efectividad)', fontsize=12)
+    ax.set_title(f'Curva ε vs NTU (C = {C_plot:.3f})', fontsize=14)
+    ax.grid(True, alpha=0.3)
+    ax.set_xlim([0, 5])
+    ax.set_ylim([0, 1])
+    return fig
+
+@grafo.nodo
+def sensibilidad_epsilon(tipo_intercambiador, configuracion, NTU_entrada, C):
+    resultado = derivadas_paso_complejo(lambda **x: modelo_efectividad(**x, tipo=tipo_intercambiador, **configuracion),
+                                        {'NTU': NTU_entrada, 'C': C})
+    return tabla_sensibilidad(resultado['ε'])
+
+@grafo.nodo
+def sensibilidad_NTU(tipo_intercambiador, configuracion, epsilon_entrada, C):
+    resultado = derivadas_paso_complejo(lambda **x: modelo_ntu(**x, tipo=tipo_intercambiador, **configuracion),
+                                        {'epsilon': epsilon_entrada, 'C': C})
+    return tabla_sensibilidad(resultado['NTU'])
+
+# La configuración solo se guarda si cambia el arreglo, para no alterar el hash de los escenarios anteriores
+cambia_arreglo = arreglo_numerico(tipo_intercambiador, **configuracion) != arreglo_numerico(tipo_intercambiador)
+guardar_configuracion = {'configuracion': configuracion} if cambia_arreglo else {}
+
 if calculo == "Calcular ε (efectividad) dado NTU":
-    NTU = st.number_input("NTU", min_value=0.001, max_value=100.0, value=1.0, step=0.1)
+    NTU = grafo.entrada("NTU_entrada", st.number_input("NTU", min_value=0.001, max_value=100.0, value=1.0, step=0.1))
     if necesita_C:
         C = st.number_input("C (Cmin/Cmax)", min_value=0.001, max_value=1.0, value=0.5, step=0.01)
     else:
         C = 0.0
+    grafo.entrada("C", C)
     
     if st.button("Calcular ε"):
-        funcion = funciones_efectividad[tipo_intercambiador]
-        epsilon = funcion(NTU, C)
+        epsilon = grafo.valor("epsilon_calculado")
+        escenarios.guardar('ntu_e', {'tipo': tipo_intercambiador, 'NTU': NTU, 'C': C, **guardar_configuracion},
+                           {'epsilon': epsilon})
         st.success(f"## Resultado: ε = {epsilon:.6f}")
         st.metric("Efectividad", f"{epsilon:.4f}")
 
 else:
-    epsilon = st.number_input("ε (efectividad)", min_value=0.001, max_value=0.999, value=0.7, step=0.01)
+    epsilon = grafo.entrada("epsilon_entrada", st.number_input("ε (efectividad)", min_value=0.001, max_value=0.999, value=0.7, step=0.01))
     if necesita_C:
         C = st.number_input("C (Cmin/Cmax)", min_value=0.001, max_value=1.0, value=0.5, step=0.01)
     else:
         C = 0.0
+    grafo.entrada("C", C)
     
     if st.button("Calcular NTU"):
-        funcion_efectividad = funciones_efectividad[tipo_intercambiador]
-        NTU = resolver_NTU(funcion_efectividad, epsilon, C)
+        NTU, error = grafo.valor("NTU_calculado")
+        if error is not None:
+            st.error(f"Error en cálculo: {error}")
         
         if NTU is not None:
+            escenarios.guardar('ntu_e', {'tipo': tipo_intercambiador, 'epsilon': epsilon, 'C': C, **guardar_configuracion},
+                               {'NTU': NTU})
             st.success(f"## Resultado: NTU = {NTU:.6f}")
             st.metric("Número de Unidades de Transferencia", f"{NTU:.4f}")
 
+# --- Caso C = 0 a partir de U (condensadores y evaporadores) ---
+if not necesita_C:
+    with st.expander("Calcular con U, área y el fluido sin cambio de fase"):
+        st.caption("U puede obtenerse en la página de coeficiente global con las correlaciones de condensación o ebullición")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            U_cf = st.number_input("U (W/m²K)", min_value=0.1, value=1500.0)
+            A_cf = st.number_input("Área (m²)", min_value=0.001, value=2.0)
+        with col2:
+            m_cf = st.number_input("Flujo másico del fluido sin cambio de fase (kg/s)", min_value=0.001, value=1.0)
+            cp_cf = st.number_input("Calor específico (J/kg·K)", min_value=100.0, value=4180.0)
+        with col3:
+            T_entrada_cf = st.number_input("Temperatura de entrada (°C)", value=20.0)
+            T_sat_cf = st.number_input("Temperatura de saturación (°C)", value=100.0)
+        es_agua = st.checkbox("El fluido que cambia de fase es agua saturada", value=True)
+        resultado_cf = intercambiador_cambio_fase(U_cf, A_cf, m_cf, cp_cf, T_entrada_cf, T_sat_cf,
+                                                  "agua saturada" if es_agua else None)
+        st.success(f"NTU = {float(resultado_cf['NTU']):.4f}  ·  ε = {float(resultado_cf['epsilon']):.4f}  ·  "
+                   f"Q = {float(resultado_cf['Q'])/1000:.2f} kW  ·  T salida = {float(resultado_cf['T_salida']):.2f} °C")
+        if es_agua:
+            st.write(f"Flujo de vapor condensado/evaporado: {float(resultado_cf['m_cambio_fase']):.4f} kg/s")
+
+# --- Sensibilidad ---
+if st.checkbox("Mostrar sensibilidad (derivadas por paso complejo)"):
+    if calculo == "Calcular ε (efectividad) dado NTU":
+        tabla, salida = grafo.valor("sensibilidad_epsilon"), "ε"
+    else:
+        tabla, salida = grafo.valor("sensibilidad_NTU"), "NTU"
+    figura = dibujar_tornado(tabla, salida)
+    st.pyplot(figura)
+    plt.close(figura)
+    st.dataframe(tabla)
+
 # --- Gráfico interactivo ---
 if st.checkbox("Mostrar curva ε vs NTU"):
     st.subheader(f"Comportamiento para {tipo_intercambiador}")
     
-    if necesita_C:
-        C_plot = C
-    else:
-        C_plot = 0.0
-    
-    funcion_efectividad = funciones_efectividad[tipo_intercambiador]
-    
-    NTU_values = np.linspace(0.01, 5, 200)
-    epsilon_values = [funcion_efectividad(NTU, C_plot) for NTU in NTU_values]
-    
-    fig, ax = plt.subplots(figsize=(10, 6))
-    ax.plot(NTU_values, epsilon_values, 'b-', linewidth=2.5)
-    
-    # Punto actual si está calculado
-    if 'NTU' in locals() and 'epsilon' in locals():
-        ax.plot(NTU, epsilon, 'ro', markersize=8)
-    
-    ax.set_xlabel('NTU', fontsize=12)
-    ax.set_ylabel('ε (Efectividad)', fontsize=12)
-    ax.set_title(f'Curva ε vs NTU (C = {C_plot:.3f})', fontsize=14)
-    ax.grid(True, alpha=0.3)
-    ax.set_xlim([0, 5])
-    ax.set_ylim([0, 1])
-    
-    st.pyplot(fig)
+    nodo_punto = "punto_epsilon" if calculo == "Calcular ε (efectividad) dado NTU" else "punto_NTU"
+    grafo.entradas(C_plot=C if necesita_C else 0.0, punto=grafo.valor(nodo_punto))
+    st.pyplot(grafo.valor("figura_curva"))
 
 # --- Explicación de parámetros ---
 st.divider()
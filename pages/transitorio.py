@@ -0,0 +1,98 @@
+import streamlit as st
+import pandas as pd
+from calculos.propiedades import ARCHIVOS_PROPIEDADES, FLUIDOS_CON_FASES
+from calculos.transitorio import simular_doble_tubo, escalon, MATERIALES_PARED
+
+# --- Configuración de la página ---
+st.set_page_config(page_title="Respuesta Transitoria Doble Tubo", layout="wide")
+st.title("Respuesta Transitoria de Intercambiador de Doble Tubo")
+st.markdown("Temperaturas de salida ante cambios en escalón de una temperatura o un caudal de entrada "
+            "(método de líneas: fluidos y pared discretizados a lo largo del tubo).")
+
+# --- Configuración ---
+with st.sidebar:
+    st.header("⚙️ Configuración")
+    contraflujo = st.radio("Disposición", ["Contraflujo", "Paralelo"], horizontal=True) == "Contraflujo"
+    Di = st.number_input("Diámetro interno del tubo (m)", min_value=0.001, value=0.025, format="%.4f")
+    Do = st.number_input("Diámetro de la carcasa (m)", min_value=0.002, value=0.05, format="%.4f")
+    L = st.number_input("Longitud (m)", min_value=0.1, value=10.0)
+    material_pared = st.selectbox("Material del tubo interno", list(MATERIALES_PARED))
+    espesor_pared = st.number_input("Espesor de pared (mm)", min_value=0.1, value=1.0) / 1000
+    st.subheader("Discretización")
+    n_segmentos = st.number_input("Segmentos", min_value=5, max_value=2000, value=100, step=10)
+    t_final = st.number_input("Tiempo simulado (s)", min_value=1.0, value=120.0)
+    dt = st.number_input("Paso de tiempo (s)", min_value=0.001, value=0.5)
+
+# --- Fluidos ---
+col1, col2 = st.columns(2)
+with col1:
+    st.subheader("Fluido interno (tubo)")
+    fluido_int = st.selectbox("Fluido interno", list(ARCHIVOS_PROPIEDADES.keys()))
+    fase_int = "líquido"
+    if fluido_int in FLUIDOS_CON_FASES:
+        fase_int = st.radio("Fase fluido interno", ["líquido", "vapor"], horizontal=True)
+    m_int = st.number_input("Flujo másico interno (kg/s)", min_value=0.001, value=0.3)
+    T_int_entrada = st.number_input("Temperatura entrada interna (°C)", value=80.0)
+with col2:
+    st.subheader("Fluido externo (anulo)")
+    fluido_ext = st.selectbox("Fluido externo", list(ARCHIVOS_PROPIEDADES.keys()))
+    fase_ext = "líquido"
+    if fluido_ext in FLUIDOS_CON_FASES:
+        fase_ext = st.radio("Fase fluido externo", ["líquido", "vapor"], horizontal=True)
+    m_ext = st.number_input("Flujo másico externo (kg/s)", min_value=0.001, value=0.5)
+    T_ext_entrada = st.number_input("Temperatura entrada externa (°C)", value=20.0)
+
+# --- Perturbación ---
+st.header("Perturbación en escalón")
+entradas = {
+    "Temperatura entrada interna (°C)": T_int_entrada,
+    "Temperatura entrada externa (°C)": T_ext_entrada,
+    "Flujo másico interno (kg/s)": m_int,
+    "Flujo másico externo (kg/s)": m_ext,
+}
+col1, col2 = st.columns(2)
+with col1:
+    variable = st.selectbox("Variable", list(entradas))
+    t_escalon = st.number_input("Instante del escalón (s)", min_value=0.0, value=5.0)
+with col2:
+    valor_final = st.number_input("Valor después del escalón", value=float(entradas[variable]) * 1.2)
+if variable.startswith("Flujo") and valor_final <= 0:
+    st.error("El caudal después del escalón debe ser positivo")
+    st.stop()
+entradas[variable] = escalon(entradas[variable], valor_final, t_escalon)
+
+if st.button("Simular"):
+    progreso = st.progress(0.0)
+    grafico = st.empty()
+    filas = []
+    n_pasos = int(t_final / dt)
+    cada = max(1, n_pasos // 50)
+    try:
+        for i, paso in enumerate(simular_doble_tubo(
+                fluido_int, fluido_ext, entradas["Temperatura entrada interna (°C)"],
+                entradas["Temperatura entrada externa (°C)"], entradas["Flujo másico interno (kg/s)"],
+                entradas["Flujo másico externo (kg/s)"], Di, Do, L, t_final, dt,
+                n_segmentos=int(n_segmentos), contraflujo=contraflujo, fase_int=fase_int, fase_ext=fase_ext,
+                espesor_pared=espesor_pared, material_pared=material_pared)):
+            filas.append({'t (s)': paso['t'], 'T salida interna (°C)': float(paso['T_int_salida']),
+                          'T salida externa (°C)': float(paso['T_ext_salida']), 'Q (kW)': float(paso['Q']) / 1000})
+            # Las salidas se muestran a medida que se integran
+            if i % cada == 0:
+                tabla = pd.DataFrame(filas).set_index('t (s)')
+                grafico.line_chart(tabla[['T salida interna (°C)', 'T salida externa (°C)']])
+                progreso.progress(min(i / max(n_pasos, 1), 1.0))
+        progreso.progress(1.0)
+        tabla = pd.DataFrame(filas).set_index('t (s)')
+        grafico.line_chart(tabla[['T salida interna (°C)', 'T salida externa (°C)']])
+
+        inicial, final = tabla.iloc[0], tabla.iloc[-1]
+        col1, col2, col3 = st.columns(3)
+        col1.metric("T salida interna (°C)", f"{final['T salida interna (°C)']:.2f}",
+                    f"{final['T salida interna (°C)'] - inicial['T salida interna (°C)']:+.2f}")
+        col2.metric("T salida externa (°C)", f"{final['T salida externa (°C)']:.2f}",
+                    f"{final['T salida externa (°C)'] - inicial['T salida externa (°C)']:+.2f}")
+        col3.metric("Q (kW)", f"{final['Q (kW)']:.2f}", f"{final['Q (kW)'] - inicial['Q (kW)']:+.2f}")
+        st.line_chart(tabla[['Q (kW)']])
+        st.download_button("Descargar respuesta", tabla.to_csv(), "respuesta_transitoria.csv")
+    except Exception as e:
+        st.error(f"Error en la simulación: {str(e)}")
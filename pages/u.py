@@ -2,7 +2,19 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 from math import pi
-from scipy.interpolate import interp1d
+from calculos.anulo import nu_anulo, diametro_hidraulico, CASOS_FRONTERA
+from calculos import escenarios
+from calculos.cambio_fase import (
+    temperatura_pared, MECANISMOS_INTERNOS, MECANISMOS_EXTERNOS, CORRELACIONES_CONDENSACION_INTERNA
+)
+from calculos.grafo import GrafoCalculo
+from calculos.hidraulica import hidraulica_doble_tubo, RUGOSIDADES, METODOS_FRICCION
+from calculos.propiedades import propiedades, admite_cambio_fase, ARCHIVOS_PROPIEDADES, FLUIDOS_CON_FASES
+from calculos.sensibilidad import derivadas_paso_complejo, tabla_sensibilidad, dibujar_tornado, modelo_coeficiente_global
+from calculos.flujo_interno import (
+    nusselt_interno, CORRELACIONES_LAMINARES, CORRELACIONES_TURBULENTAS, NOMBRES_REGIMEN, LAMINAR, TRANSICION,
+    TURBULENTO
+)
 
 # --- Configuración de la página ---
 st.set_page_config(page_title="Cálculo Coeficiente Global", layout="wide")
@@ -13,84 +25,6 @@ def convertir_longitud(valor, unidad):
     factores = {"m": 1, "mm": 0.001, "cm": 0.01, "ft": 0.3048, "in": 0.0254}
     return valor * factores[unidad]
 
-# --- Función para obtener Nu externo ---
-def obtener_nu_externo(Di_Do):
-    datos = {
-        'Di_Do': [0.00, 0.05, 0.10, 0.25, 0.50, 1.00],
-        'Nui': [np.nan, 17.46, 11.56, 7.37, 5.74, 4.86]
-    }
-    f_nui = interp1d(datos['Di_Do'][1:], datos['Nui'][1:], kind='linear', fill_value='extrapolate')
-    return float(f_nui(Di_Do)) if Di_Do > 0 else np.nan
-
-# --- Carga de datos con manejo de fases ---
-@st.cache_data
-def cargar_datos():
-    archivos = {
-        "agua saturada": "tabla_a9.csv",
-        "refrigerante 134a": "tabla_a10.csv",
-        "amoniaco": "tabla_a11.csv",
-        "propano": "tabla_a12.csv",
-        "aire": "tabla_a15.csv",
-        "glicerina": "tabla_glicerina.csv",
-        "isobutano": "tabla_isobutano.csv",
-        "metano": "tabla_metano.csv",
-        "metanol": "tabla_metanol.csv",
-        "aceite para motor": "tabla_aceitemotor.csv"
-    }
-    
-    data = {}
-    for nombre, archivo in archivos.items():
-        try:
-            df = pd.read_csv(archivo)
-            
-            # Renombrar columnas para consistencia
-            df.columns = df.columns.str.strip()
-            data[nombre] = df
-            
-        except Exception as e:
-            st.error(f"Error cargando {archivo}: {str(e)}")
-            data[nombre] = None
-    return data
-
-# --- Interpolación de propiedades con manejo de fases ---
-def interpolar_propiedades(df, T_pelicula, fluido, fase=None):
-    try:
-        # Fluidos con fases (tablas A9-A12)
-        if fluido in ["agua saturada", "refrigerante 134a", "amoniaco", "propano"]:
-            if fase == "líquido":
-                return {
-                    'densidad': np.interp(T_pelicula, df['Temp. (°C)'], df['Densidad líquido (kg/m³)']),
-                    'viscosidad': np.interp(T_pelicula, df['Temp. (°C)'], df['Viscosidad dinámica líquido (kg/m·s)']),
-                    'k': np.interp(T_pelicula, df['Temp. (°C)'], df['Conductividad térmica líquido (W/m·K)']),
-                    'Pr': np.interp(T_pelicula, df['Temp. (°C)'], df['Número de Prandtl líquido'])
-                }
-            elif fase == "vapor":
-                return {
-                    'densidad': np.interp(T_pelicula, df['Temp. (°C)'], df['Densidad vapor (kg/m³)']),
-                    'viscosidad': np.interp(T_pelicula, df['Temp. (°C)'], df['Viscosidad dinámica vapor (kg/m·s)']),
-                    'k': np.interp(T_pelicula, df['Temp. (°C)'], df['Conductividad térmica vapor (W/m·K)']),
-                    'Pr': np.interp(T_pelicula, df['Temp. (°C)'], df['Número de Prandtl vapor'])
-                }
-        
-        # Fluidos sin fases (tablas restantes)
-        else:
-            # Manejar diferentes nombres de columnas en tablas sin fases
-            densidad_col = 'Densidad (kg/m³)' if 'Densidad (kg/m³)' in df.columns else 'Densidad'
-            viscosidad_col = 'Viscosidad dinámica (kg/m·s)' if 'Viscosidad dinámica (kg/m·s)' in df.columns else 'Viscosidad'
-            k_col = 'Conductividad térmica (W/m·K)' if 'Conductividad térmica (W/m·K)' in df.columns else 'Conductividad'
-            pr_col = 'Número de Prandtl' if 'Número de Prandtl' in df.columns else 'Prandtl'
-            
-            return {
-                'densidad': np.interp(T_pelicula, df['Temp. (°C)'], df[densidad_col]),
-                'viscosidad': np.interp(T_pelicula, df['Temp. (°C)'], df[viscosidad_col]),
-                'k': np.interp(T_pelicula, df['Temp. (°C)'], df[k_col]),
-                'Pr': np.interp(T_pelicula, df['Temp. (°C)'], df[pr_col])
-            }
-            
-    except Exception as e:
-        st.error(f"Error interpolando propiedades: {str(e)}")
-        return None
-
 # --- Interfaz principal ---
 with st.sidebar:
     st.header("⚙️ Configuración")
@@ -98,33 +32,43 @@ with st.sidebar:
     k_pared = st.number_input("Conductividad pared (W/m·K)", value=50.0)
     espesor = st.number_input("Espesor pared (mm)", value=5.0) / 1000
     n_prandtl = st.selectbox("Exponente n para Prandtl (Dittus-Boelter)", [0.4, 0.3], format_func=lambda x: f"{x} (calentamiento)" if x==0.4 else f"{x} (enfriamiento)")
+    correlacion_turbulenta = st.selectbox("Correlación turbulenta", CORRELACIONES_TURBULENTAS, index=1)
+    correlacion_laminar = st.selectbox("Correlación laminar", CORRELACIONES_LAMINARES)
+    longitud_tubo = st.number_input("Longitud del tubo (m)", min_value=0.01, value=2.0)
+    caso_anulo = st.selectbox("Condición de frontera en el anulo", CASOS_FRONTERA)
+    razon_flujos = 1.0
+    if caso_anulo == "ambas paredes calentadas":
+        razon_flujos = st.number_input("Razón de flujos de calor q''o/q''i", value=1.0, step=0.1)
+    st.subheader("Hidráulica")
+    material_tubo = st.selectbox("Material del tubo (rugosidad)", list(RUGOSIDADES))
+    metodo_friccion = st.selectbox("Factor de fricción turbulento", METODOS_FRICCION)
+    n_retornos = st.number_input("Retornos de 180°", min_value=0, value=0, step=1)
+    eficiencia_bomba = st.number_input("Eficiencia de bombeo", min_value=0.05, max_value=1.0, value=0.7)
 
 # --- Sección de parámetros geométricos ---
 st.header("1. Parámetros Geométricos")
 col1, col2 = st.columns(2)
 with col1:
-    diametro_int = st.number_input(f"Diámetro interno del tubo ({unidad_dia})", value=0.05)
+    diametro_int_entrada = st.number_input(f"Diámetro interno del tubo ({unidad_dia})", value=0.05)
 with col2:
-    diametro_ext = st.number_input(f"Diámetro de la carcasa ({unidad_dia})", value=0.10)
-
-# Conversión de unidades
-diametro_int = convertir_longitud(diametro_int, unidad_dia)
-diametro_ext = convertir_longitud(diametro_ext, unidad_dia)
-Di_Do_ratio = diametro_int / diametro_ext
+    diametro_ext_entrada = st.number_input(f"Diámetro de la carcasa ({unidad_dia})", value=0.10)
 
 # --- Sección de fluidos y propiedades ---
-fluidos = cargar_datos()
-fluidos_con_fases = ["agua saturada", "refrigerante 134a", "amoniaco", "propano"]
-
 st.header("2. Propiedades de los Fluidos")
 
 # Fluido interno
 st.subheader("Fluido Interno (tubo)")
 col3, col4 = st.columns(2)
 with col3:
-    fluido_int = st.selectbox("Fluido interno", list(fluidos.keys()))
-    if fluido_int in fluidos_con_fases:
+    fluido_int = st.selectbox("Fluido interno", list(ARCHIVOS_PROPIEDADES.keys()))
+    fase_int = None
+    if fluido_int in FLUIDOS_CON_FASES:
         fase_int = st.radio("Fase fluido interno", ["líquido", "vapor"], horizontal=True)
+    cambio_fase_int = None
+    if admite_cambio_fase(fluido_int):
+        regimen_int = st.selectbox("Régimen fluido interno", ["Una fase"] + MECANISMOS_INTERNOS,
+                                   help="Con cambio de fase la temperatura promedio es la de saturación")
+        cambio_fase_int = None if regimen_int == "Una fase" else regimen_int
 with col4:
     T_prom_int = st.number_input("Temperatura promedio fluido interno (°C)", value=50.0)
     velocidad = st.number_input("Velocidad fluido interno (m/s)", value=1.0)
@@ -133,66 +77,282 @@ with col4:
 st.subheader("Fluido Externo (carcasa)")
 col5, col6 = st.columns(2)
 with col5:
-    fluido_ext = st.selectbox("Fluido externo", list(fluidos.keys()))
-    if fluido_ext in fluidos_con_fases:
+    fluido_ext = st.selectbox("Fluido externo", list(ARCHIVOS_PROPIEDADES.keys()))
+    fase_ext = None
+    if fluido_ext in FLUIDOS_CON_FASES:
         fase_ext = st.radio("Fase fluido externo", ["líquido", "vapor"], horizontal=True)
+    cambio_fase_ext = None
+    if admite_cambio_fase(fluido_ext):
+        regimen_ext = st.selectbox("Régimen fluido externo", ["Una fase"] + MECANISMOS_EXTERNOS,
+                                   help="Con cambio de fase la temperatura promedio es la de saturación")
+        cambio_fase_ext = None if regimen_ext == "Una fase" else regimen_ext
 with col6:
     T_prom_ext = st.number_input("Temperatura promedio fluido externo (°C)", value=80.0)
+    velocidad_ext = st.number_input("Velocidad fluido externo (m/s)", min_value=0.0, value=0.0,
+                                    help="Con 0 se usa la tabla laminar del anulo")
 
-# --- Cálculos ---
-try:
-    # Validación de datos
-    if fluidos[fluido_int] is None or fluidos[fluido_ext] is None:
-        st.error("No se pueden cargar los datos de los fluidos seleccionados")
-        st.stop()
-
-    # Propiedades fluido interno
-    props_int = interpolar_propiedades(fluidos[fluido_int], T_prom_int, fluido_int, 
-                                     fase_int if fluido_int in fluidos_con_fases else None)
-    
-    # Propiedades fluido externo
-    props_ext = interpolar_propiedades(fluidos[fluido_ext], T_prom_ext, fluido_ext, 
-                                     fase_ext if fluido_ext in fluidos_con_fases else None)
-
-    if props_int is None or props_ext is None:
-        st.error("Error al obtener propiedades termofísicas")
-        st.stop()
+# Opciones de la correlación de cambio de fase
+opciones_cambio_fase = {}
+if cambio_fase_int and cambio_fase_ext:
+    st.error("Solo uno de los fluidos puede cambiar de fase")
+    st.stop()
+cambio_fase = cambio_fase_int or cambio_fase_ext
+if cambio_fase:
+    st.subheader(f"Cambio de fase: {cambio_fase}")
+    if cambio_fase == "condensación en banco de tubos":
+        opciones_cambio_fase['N'] = st.number_input("Tubos por columna vertical (N)", min_value=1, value=4, step=1)
+    elif cambio_fase == "condensación dentro del tubo":
+        opciones_cambio_fase['correlacion'] = st.selectbox("Correlación", CORRELACIONES_CONDENSACION_INTERNA)
+        if opciones_cambio_fase['correlacion'] == "shah":
+            opciones_cambio_fase['G'] = st.number_input("Flujo másico por unidad de área G (kg/m²s)",
+                                                        min_value=1.0, value=200.0)
+    else:
+        st.caption("Rohsenow: ebullición nucleada en estanque sobre la pared exterior del tubo")
+        col7, col8 = st.columns(2)
+        with col7:
+            opciones_cambio_fase['C_sf'] = st.number_input("Coeficiente superficie-fluido C_sf", min_value=0.001,
+                                                           value=0.013, format="%.4f")
+        with col8:
+            opciones_cambio_fase['n'] = st.number_input("Exponente de Prandtl n (Rohsenow)", min_value=0.5,
+                                                        value=1.0)
+
+# --- Grafo de cálculo: solo se recalcula lo que depende de entradas modificadas ---
+grafo = GrafoCalculo(st.session_state.setdefault("grafo_u", {}))
+grafo.entradas(
+    unidad_dia=unidad_dia, diametro_int_entrada=diametro_int_entrada, diametro_ext_entrada=diametro_ext_entrada,
+    n_prandtl=n_prandtl, correlacion_turbulenta=correlacion_turbulenta, correlacion_laminar=correlacion_laminar,
+    longitud_tubo=longitud_tubo, caso_anulo=caso_anulo, razon_flujos=razon_flujos, material_tubo=material_tubo,
+    metodo_friccion=metodo_friccion, n_retornos=n_retornos, eficiencia_bomba=eficiencia_bomba,
+    fluido_int=fluido_int, fase_int=fase_int, T_prom_int=T_prom_int, velocidad=velocidad,
+    fluido_ext=fluido_ext, fase_ext=fase_ext, T_prom_ext=T_prom_ext, velocidad_ext=velocidad_ext,
+    cambio_fase_int=cambio_fase_int, cambio_fase_ext=cambio_fase_ext, opciones_cambio_fase=opciones_cambio_fase,
+)
+
+# Conversión de unidades
+@grafo.nodo
+def diametro_int(diametro_int_entrada, unidad_dia):
+    return convertir_longitud(diametro_int_entrada, unidad_dia)
+
+@grafo.nodo
+def diametro_ext(diametro_ext_entrada, unidad_dia):
+    return convertir_longitud(diametro_ext_entrada, unidad_dia)
+
+@grafo.nodo
+def Di_Do_ratio(diametro_int, diametro_ext):
+    return diametro_int / diametro_ext
+
+# Propiedades
+@grafo.nodo
+def props_int(fluido_int, T_prom_int, fase_int):
+    return propiedades(fluido_int, T_prom_int, fase_int)
+
+@grafo.nodo
+def props_ext(fluido_ext, T_prom_ext, fase_ext):
+    return propiedades(fluido_ext, T_prom_ext, fase_ext)
+
+# Lado tubo
+@grafo.nodo
+def Re(velocidad, diametro_int, props_int):
+    return (velocidad * diametro_int * props_int['densidad']) / props_int['viscosidad']
+
+@grafo.nodo
+def mu_mu_s(correlacion_turbulenta, props_int, fluido_int, fase_int, T_prom_int, T_prom_ext):
+    # Corrección por viscosidad en la pared (Sieder-Tate), evaluada a la temperatura media de pared
+    if correlacion_turbulenta != "sieder-tate":
+        return 1.0
+    props_pared = propiedades(fluido_int, (T_prom_int + T_prom_ext) / 2, fase_int)
+    return props_int['viscosidad'] / props_pared['viscosidad']
+
+@grafo.nodo
+def resultado_nu(Re, props_int, diametro_int, longitud_tubo, correlacion_laminar, correlacion_turbulenta,
+                 n_prandtl, mu_mu_s):
+    resultado = nusselt_interno(Re, props_int['Pr'], D=diametro_int, L=longitud_tubo,
+                                correlacion_laminar=correlacion_laminar,
+                                correlacion_turbulenta=correlacion_turbulenta,
+                                n=n_prandtl, mu_mu_s=mu_mu_s)
+    return {'Nu': float(resultado['Nu']), 'regimen': int(resultado['regimen']), 'valido': bool(resultado['valido'])}
+
+@grafo.nodo
+def h_int(resultado_nu, props_int, diametro_int):
+    return resultado_nu['Nu'] * props_int['k'] / diametro_int
+
+# Lado anulo
+@grafo.nodo
+def D_h(diametro_int, diametro_ext):
+    return float(diametro_hidraulico(diametro_int, diametro_ext))
+
+@grafo.nodo
+def Re_ext(velocidad_ext, D_h, props_ext):
+    return (velocidad_ext * D_h * props_ext['densidad']) / props_ext['viscosidad']
+
+@grafo.nodo
+def resultado_nu_ext(Re_ext, props_ext, Di_Do_ratio, caso_anulo, razon_flujos):
+    resultado = nu_anulo(Re_ext, props_ext['Pr'], Di_Do_ratio, caso=caso_anulo, razon_flujos=razon_flujos)
+    Nu = resultado['Nuo'] if caso_anulo == "pared externa calentada" else resultado['Nui']
+    return {'Nu': float(Nu), 'regimen': int(resultado['regimen'])}
 
+@grafo.nodo
+def Nu_ext(resultado_nu_ext):
+    return resultado_nu_ext['Nu']
+
+@grafo.nodo
+def h_ext(Nu_ext, props_ext, D_h):
+    return Nu_ext * props_ext['k'] / D_h
+
+# Caída de presión y potencia de bombeo de ambos lados
+@grafo.nodo
+def hidraulica(Re, Re_ext, velocidad, velocidad_ext, props_int, props_ext, diametro_int, diametro_ext,
+               longitud_tubo, material_tubo, metodo_friccion, n_retornos, eficiencia_bomba):
+    resultado = hidraulica_doble_tubo(Re, Re_ext, velocidad, velocidad_ext, props_int['densidad'],
+                                      props_ext['densidad'], diametro_int, diametro_ext, longitud_tubo,
+                                      rugosidad=RUGOSIDADES[material_tubo], n_retornos=n_retornos,
+                                      eficiencia_bomba=eficiencia_bomba, metodo=metodo_friccion)
+    return {lado: {clave: float(valor) for clave, valor in r.items()} for lado, r in resultado.items()}
+
+# Lado con cambio de fase: h acoplado al otro lado mediante la temperatura de pared
+@grafo.nodo
+def resultado_cambio_fase(cambio_fase_int, cambio_fase_ext, opciones_cambio_fase, fluido_int, fluido_ext,
+                          T_prom_int, T_prom_ext, h_int, h_ext, diametro_int):
+    if cambio_fase_int is not None:
+        resultado = temperatura_pared(cambio_fase_int, fluido_int, T_prom_int, T_prom_ext, h_ext, diametro_int,
+                                      **opciones_cambio_fase)
+    elif cambio_fase_ext is not None:
+        resultado = temperatura_pared(cambio_fase_ext, fluido_ext, T_prom_ext, T_prom_int, h_int, diametro_int,
+                                      **opciones_cambio_fase)
+    else:
+        return None
+    return {'h': float(resultado['h']), 'T_pared': float(resultado['T_pared']), 'valido': bool(resultado['valido'])}
+
+# Coeficiente global
+@grafo.nodo
+def U(h_int, h_ext, resultado_cambio_fase, cambio_fase_int, cambio_fase_ext):
+    if cambio_fase_int is not None:
+        h_int = resultado_cambio_fase['h']
+    elif cambio_fase_ext is not None:
+        h_ext = resultado_cambio_fase['h']
+    return 1 / ((1/h_int) + (1/h_ext))
+
+# Sensibilidad de U respecto de todas las entradas numéricas (paso complejo)
+@grafo.nodo
+def sensibilidad_U(diametro_int, diametro_ext, T_prom_int, T_prom_ext, velocidad, velocidad_ext, longitud_tubo,
+                   fluido_int, fluido_ext, fase_int, fase_ext, correlacion_laminar, correlacion_turbulenta,
+                   n_prandtl, caso_anulo, razon_flujos):
+    entradas = {
+        'diametro_int': diametro_int, 'diametro_ext': diametro_ext,
+        'T_prom_int': T_prom_int, 'T_prom_ext': T_prom_ext,
+        'velocidad': velocidad, 'velocidad_ext': velocidad_ext, 'longitud_tubo': longitud_tubo,
+    }
+    resultado = derivadas_paso_complejo(
+        lambda **x: modelo_coeficiente_global(
+            **x, fluido_int=fluido_int, fluido_ext=fluido_ext, fase_int=fase_int, fase_ext=fase_ext,
+            correlacion_laminar=correlacion_laminar, correlacion_turbulenta=correlacion_turbulenta,
+            n=n_prandtl, caso_anulo=caso_anulo, razon_flujos=razon_flujos),
+        entradas)
+    return tabla_sensibilidad(resultado['U'])
+
+@grafo.nodo
+def figura_sensibilidad_U(sensibilidad_U):
+    return dibujar_tornado(sensibilidad_U, "U")
+
+# Registro en el almacén de escenarios (a pedido del usuario)
+def guardar_escenario():
+    U, h_int, h_ext, diametro_int, diametro_ext, resultado_cambio_fase = grafo.valores(
+        'U', 'h_int', 'h_ext', 'diametro_int', 'diametro_ext', 'resultado_cambio_fase')
+    entradas = {
+        'diametro_int': diametro_int, 'diametro_ext': diametro_ext,
+        'T_prom_int': T_prom_int, 'T_prom_ext': T_prom_ext,
+        'velocidad': velocidad, 'velocidad_ext': velocidad_ext, 'longitud_tubo': longitud_tubo,
+        'fluido_int': fluido_int, 'fluido_ext': fluido_ext, 'fase_int': fase_int, 'fase_ext': fase_ext,
+        'correlacion_laminar': correlacion_laminar, 'correlacion_turbulenta': correlacion_turbulenta,
+        'n': n_prandtl, 'caso_anulo': caso_anulo,
+    }
+    if caso_anulo == "ambas paredes calentadas":
+        entradas['razon_flujos'] = razon_flujos
+    if cambio_fase_int is not None:
+        h_int = resultado_cambio_fase['h']
+    elif cambio_fase_ext is not None:
+        h_ext = resultado_cambio_fase['h']
+    if resultado_cambio_fase is not None:
+        entradas.update(cambio_fase_int=cambio_fase_int, cambio_fase_ext=cambio_fase_ext,
+                        opciones_cambio_fase=opciones_cambio_fase)
+    return escenarios.guardar('u', entradas, {'U': U, 'h_int': h_int, 'h_ext': h_ext})
+
+# --- Resultados ---
+def mostrar_cambio_fase(resultado):
+    st.write(f"Régimen: {cambio_fase} (temperatura de pared {resultado['T_pared']:.2f} °C)")
+    if not resultado['valido']:
+        st.warning("El punto está fuera del rango de validez de la correlación de cambio de fase "
+                   "(la condensación requiere que el otro fluido esté más frío y la ebullición, más caliente)")
+
+try:
     # --- Cálculo de h interno ---
     st.header("3. Coeficiente de Transferencia Interno")
-    Re = (velocidad * diametro_int * props_int['densidad']) / props_int['viscosidad']
-    st.write(f"Número de Reynolds: {Re:.2f}")
-    
-    # Determinar régimen de flujo
-    if Re < 2300:
-        Nu = 3.66  # Flujo laminar completamente desarrollado
-        st.write("Régimen: Laminar (Nu = 3.66)")
+    if cambio_fase_int is not None:
+        mostrar_cambio_fase(grafo.valor('resultado_cambio_fase'))
+        valor_h_int = grafo.valor('resultado_cambio_fase')['h']
     else:
-        Nu = 0.023 * (Re**0.8) * (props_int['Pr']**n_prandtl)  # Dittus-Boelter con n elegido por usuario
-        st.write(f"Régimen: Turbulento (correlación Dittus-Boelter, n={n_prandtl})")
-    
-    h_int = Nu * props_int['k'] / diametro_int
-    st.success(f"**Coeficiente interno (h_int): {h_int:.2f} W/m²K**")
+        st.write(f"Número de Reynolds: {grafo.valor('Re'):.2f}")
+
+        nu_int = grafo.valor('resultado_nu')
+        regimen = nu_int['regimen']
+        if regimen == TURBULENTO:
+            st.write(f"Régimen: {NOMBRES_REGIMEN[regimen]} (correlación {correlacion_turbulenta}, Nu = {nu_int['Nu']:.2f})")
+        else:
+            st.write(f"Régimen: {NOMBRES_REGIMEN[regimen]} (Nu = {nu_int['Nu']:.2f})")
+        if not nu_int['valido']:
+            st.warning("El punto está fuera del rango de validez de la correlación seleccionada")
+
+        valor_h_int = grafo.valor('h_int')
+    st.success(f"**Coeficiente interno (h_int): {valor_h_int:.2f} W/m²K**")
 
     # --- Cálculo de h externo ---
     st.header("4. Coeficiente de Transferencia Externo")
-    Nu_ext = obtener_nu_externo(Di_Do_ratio)
-    
-    if not np.isnan(Nu_ext):
-        h_ext = Nu_ext * props_ext['k'] / (diametro_ext - diametro_int)
-        st.success(f"**Coeficiente externo (h_ext): {h_ext:.2f} W/m²K**")
-        
+    if cambio_fase_ext is not None:
+        mostrar_cambio_fase(grafo.valor('resultado_cambio_fase'))
+        valor_h_ext = grafo.valor('resultado_cambio_fase')['h']
+    else:
+        valor_Re_ext, regimen_ext = grafo.valor('Re_ext'), grafo.valor('resultado_nu_ext')['regimen']
+        detalle = {LAMINAR: "tabla", TRANSICION: "interpolación tabla-Gnielinski", TURBULENTO: "Gnielinski, Dh"}
+        st.write(f"Número de Reynolds (anulo): {valor_Re_ext:.2f} - Régimen {NOMBRES_REGIMEN[regimen_ext].lower()} "
+                 f"({detalle[regimen_ext]})")
+        valor_h_ext = grafo.valor('h_ext')
+
+    if not np.isnan(valor_h_ext):
+        st.success(f"**Coeficiente externo (h_ext): {valor_h_ext:.2f} W/m²K**")
+
         # --- Cálculo del coeficiente global ---
         st.header("5. Coeficiente Global de Transferencia de Calor")
-        R_total = (1/h_int) + (1/h_ext)
-        U = 1 / R_total
-        
         st.latex(r"\frac{1}{U} = \frac{1}{h_{interno}} + \frac{1}{h_{externo}}")
-        st.latex(rf"\frac{{1}}{{U}} = \frac{{1}}{{{h_int:.2f}}} + \frac{{1}}{{{h_ext:.2f}}}")
-        st.success(f"**Coeficiente global (U): {U:.2f} W/m²K**")
-        
+        st.latex(rf"\frac{{1}}{{U}} = \frac{{1}}{{{valor_h_int:.2f}}} + \frac{{1}}{{{valor_h_ext:.2f}}}")
+        st.success(f"**Coeficiente global (U): {grafo.valor('U'):.2f} W/m²K**")
+        if st.button("Guardar escenario"):
+            st.caption(f"Escenario guardado: {guardar_escenario()[:12]}")
+        if cambio_fase is not None:
+            st.info("Con un fluido en cambio de fase use en la calculadora NTU-ε el caso especial C = 0 con este U")
+
+        # --- Caída de presión ---
+        st.header("6. Caída de Presión y Potencia de Bombeo")
+        valor_hidraulica = grafo.valor('hidraulica')
+        st.dataframe(pd.DataFrame({
+            'Lado': ["Tubo", "Anulo"],
+            'f (Darcy)': [valor_hidraulica['int']['f'], valor_hidraulica['ext']['f']],
+            'Δp (kPa)': [valor_hidraulica['int']['delta_p'] / 1000, valor_hidraulica['ext']['delta_p'] / 1000],
+            'Potencia de bombeo (W)': [valor_hidraulica['int']['potencia'], valor_hidraulica['ext']['potencia']],
+        }))
+        if cambio_fase is not None:
+            st.caption("El lado con cambio de fase se evalúa como líquido en una sola fase")
+
+        # --- Sensibilidad ---
+        if cambio_fase is None and st.checkbox("Mostrar sensibilidad de U (derivadas por paso complejo)"):
+            st.header("7. Sensibilidad del Coeficiente Global")
+            st.pyplot(grafo.valor('figura_sensibilidad_U'))
+            st.dataframe(grafo.valor('sensibilidad_U'))
+            st.caption("Elasticidad = (∂U/∂x)·(x/U): cambio porcentual de U por cada 1 % de cambio en la entrada. "
+                       "Las propiedades y el Nu laminar del anulo se interpolan linealmente en tablas: justo sobre "
+                       "un punto de la tabla (p. ej. T = 50 °C o Di/Do = 0.5) la derivada es la del tramo derecho.")
+
     else:
         st.error("No se puede calcular h_externo para la relación Di/Do ingresada")
 
 except Exception as e:
-    st.error(f"Error en los cálculos: {str(e)}")
\ No newline at end of file
+    st.error(f"Error en los cálculos: {str(e)}")
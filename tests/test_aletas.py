@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+from calculos.aletas import aleta
+
+GEOMETRIAS = {
+    "recta": {'espesor': 0.002, 'longitud': 0.02, 'ancho': 0.1},
+    "aguja": {'diametro': 0.003, 'longitud': 0.03},
+    "anular": {'espesor': 0.002, 'r1': 0.02, 'r2': 0.05},
+}
+
+
+@pytest.mark.parametrize("tipo", list(GEOMETRIAS))
+@pytest.mark.parametrize("punta", ["adiabática", "convectiva", "infinita"])
+def test_paso_complejo_coincide_con_diferencias_centradas(tipo, punta):
+    h, k, paso = 50.0, 200.0, 1e-30
+
+    def q_theta(h):
+        return aleta(tipo, h, k, punta=punta, **GEOMETRIAS[tipo])['q_theta']
+
+    derivada = np.imag(q_theta(h + 1j * paso)) / paso
+    centrada = (q_theta(h * (1 + 1e-6)) - q_theta(h * (1 - 1e-6))) / (2e-6 * h)
+    np.testing.assert_allclose(derivada, centrada, rtol=1e-6)
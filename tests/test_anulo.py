@@ -0,0 +1,12 @@
+import numpy as np
+from calculos.anulo import nu_anulo, CASOS_FRONTERA
+from calculos.flujo_interno import RE_LAMINAR, RE_TURBULENTO
+
+
+def test_nu_anulo_continuo_en_la_transicion():
+    for caso in CASOS_FRONTERA:
+        for Re_limite in (RE_LAMINAR, RE_TURBULENTO):
+            Re = np.array([Re_limite * (1 - 1e-9), Re_limite * (1 + 1e-9)])
+            resultado = nu_anulo(Re, 5.0, 0.5, caso=caso)
+            pared = 'Nuo' if caso == "pared externa calentada" else 'Nui'
+            np.testing.assert_allclose(resultado[pared][0], resultado[pared][1], rtol=1e-6)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from calculos.cambio_fase import (
+    condensacion_interna, condensacion_tubo_horizontal, ebullicion_nucleada, MECANISMOS_INTERNOS
+)
+from calculos.doble_tubo import coeficiente_global
+
+# Valores calculados a mano con la tabla A-9 del agua: T_sat = 100 °C y pared a 90 °C,
+# líquido a la temperatura de película (95 °C): ρl = 961.5, μl = 2.97e-4, kl = 0.677, cpl = 4212;
+# a T_sat: ρv = 0.5978, hfg = 2257 kJ/kg
+
+
+def test_nusselt_tubo_horizontal():
+    # Ja = 4212·10/2257e3 = 0.01866; h = 0.729·[g·ρl(ρl-ρv)·kl³·hfg(1+0.68·Ja)/(μl·ΔT·D)]^¼
+    resultado = condensacion_tubo_horizontal("agua saturada", 100.0, 90.0, 0.025)
+    np.testing.assert_allclose(resultado['Ja'], 0.018662, rtol=1e-4)
+    np.testing.assert_allclose(resultado['h'], 12504.6, rtol=1e-4)
+    assert resultado['valido']
+
+
+def test_chato():
+    # h = 0.555·[g·ρl(ρl-ρv)·kl³·(hfg + 3/8·cpl·ΔT)/(μl·ΔT·D)]^¼
+    resultado = condensacion_interna("agua saturada", 100.0, 90.0, 0.025, correlacion="chato")
+    np.testing.assert_allclose(resultado['h'], 9506.6, rtol=1e-4)
+
+
+def test_shah_1979():
+    # A 100 °C: μl = 2.82e-4, Prl = 1.75, kl = 0.679, p_r = 101.33/22064; G = 200, D = 0.02:
+    # Re_lo = 14 184, h_lo = 0.023·Re_lo^0.8·Prl^0.4·kl/D y el factor de Shah integrado en x ∈ [0, 1]
+    resultado = condensacion_interna("agua saturada", 100.0, 90.0, 0.02, G=200.0, correlacion="shah")
+    np.testing.assert_allclose(resultado['h'], 33497.1, rtol=2e-3)
+    assert resultado['valido']
+
+
+def test_flujo_critico_de_zuber():
+    # σ(100 °C) = 0.0589 N/m, ρl = 957.9: q_max = 0.149·hfg·ρv·[σ·g(ρl-ρv)/ρv²]^¼ ≈ 1.26 MW/m²
+    resultado = ebullicion_nucleada("agua saturada", 100.0, 110.0)
+    np.testing.assert_allclose(resultado['q_max'], 1.26097e6, rtol=1e-3)
+
+
+def test_rohsenow_no_se_ofrece_dentro_del_tubo():
+    assert "ebullición nucleada" not in MECANISMOS_INTERNOS
+    with pytest.raises(ValueError):
+        coeficiente_global("agua saturada", "agua saturada", 100.0, 130.0, 0.1, 0.2, 0.025, 0.05,
+                           cambio_fase_int="ebullición nucleada")
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+from calculos.conduccion import SIGMA_SB, KELVIN, pared_conveccion_radiacion
+from calculos.sensibilidad import modelo_conduccion
+
+CAPAS = {'k_1': 1.2, 'e_1': 0.1, 'k_2': 0.05, 'e_2': 0.04}
+GEOMETRIAS = {
+    "Plana": {'A': 2.0},
+    "Cilíndrica": {'L_cil': 3.0, 'r_interior': 0.05},
+    "Esférica": {'r_interior': 0.3},
+}
+
+
+def resistencia_serie(geometria, h_in, h_out):
+    """R = 1/(h_in·A_in) + Σ R_capa + 1/(h_out·A_out), escrita a mano para cada geometría."""
+    k, e = (1.2, 0.05), (0.1, 0.04)
+    if geometria == "Plana":
+        A = GEOMETRIAS["Plana"]['A']
+        return 1 / (h_in * A) + sum(e_i / (k_i * A) for k_i, e_i in zip(k, e)) + 1 / (h_out * A)
+    r = [GEOMETRIAS[geometria]['r_interior']]
+    r += [r[0] + e[0], r[0] + e[0] + e[1]]
+    if geometria == "Cilíndrica":
+        L = GEOMETRIAS["Cilíndrica"]['L_cil']
+        R_capas = sum(np.log(r[i + 1] / r[i]) / (2 * np.pi * L * k[i]) for i in range(2))
+        return 1 / (h_in * 2 * np.pi * r[0] * L) + R_capas + 1 / (h_out * 2 * np.pi * r[2] * L)
+    R_capas = sum((1 / r[i] - 1 / r[i + 1]) / (4 * np.pi * k[i]) for i in range(2))
+    return 1 / (h_in * 4 * np.pi * r[0]**2) + R_capas + 1 / (h_out * 4 * np.pi * r[2]**2)
+
+
+@pytest.mark.parametrize("geometria", list(GEOMETRIAS))
+def test_sin_radiacion_coincide_con_resistencias_en_serie(geometria):
+    h_in, h_out, T1, T2 = 80.0, 12.0, 250.0, 20.0
+    resultado = pared_conveccion_radiacion(geometria, T1, T2, h_in, h_out, **GEOMETRIAS[geometria], **CAPAS)
+    R = resistencia_serie(geometria, h_in, h_out)
+    np.testing.assert_allclose(resultado['q'], (T1 - T2) / R, rtol=1e-10)
+    np.testing.assert_allclose(resultado['R_total'], R, rtol=1e-10)
+    # Las interfaces recorren la pared de Ts1 a Ts2 con la caída q·R_conducción
+    np.testing.assert_allclose(resultado['T_interfaces'][-1], resultado['T_superficie_out'], rtol=1e-12)
+    np.testing.assert_allclose(resultado['T_superficie_in'] - resultado['T_superficie_out'],
+                               resultado['q'] * resultado['R_conduccion'], rtol=1e-10)
+
+
+@pytest.mark.parametrize("geometria", list(GEOMETRIAS))
+def test_balance_de_energia_con_radiacion(geometria):
+    h_out = np.array([2.0, 10.0, 40.0])
+    resultado = pared_conveccion_radiacion(geometria, 400.0, 25.0, 60.0, h_out, 0.6, 0.9, T_alr_out=10.0,
+                                           **GEOMETRIAS[geometria], **CAPAS)
+    assert np.all(resultado['convergido'])
+    q = resultado['q']
+    np.testing.assert_allclose(resultado['q_conveccion_in'] + resultado['q_radiacion_in'], q, rtol=1e-9)
+    np.testing.assert_allclose(resultado['q_conveccion_out'] + resultado['q_radiacion_out'], q, rtol=1e-9)
+    # La radiación exterior responde a la ley de Stefan-Boltzmann sobre la superficie hallada
+    Ts2 = resultado['T_superficie_out'] + KELVIN
+    A_out = resultado['q_radiacion_out'] / (0.9 * SIGMA_SB * (Ts2**4 - (10.0 + KELVIN)**4))
+    np.testing.assert_allclose(A_out, A_out[0], rtol=1e-10)
+
+
+def test_arreglo_coincide_con_casos_individuales():
+    h_out = np.array([3.0, 15.0, 60.0])
+    lote = pared_conveccion_radiacion("Cilíndrica", 300.0, 20.0, 100.0, h_out, 0.0, 0.8,
+                                      **GEOMETRIAS["Cilíndrica"], **CAPAS)
+    for i, h in enumerate(h_out):
+        individual = pared_conveccion_radiacion("Cilíndrica", 300.0, 20.0, 100.0, h, 0.0, 0.8,
+                                                **GEOMETRIAS["Cilíndrica"], **CAPAS)
+        np.testing.assert_allclose(lote['q'][i], individual['q'], rtol=1e-10)
+
+
+def test_R_exterior_equivale_a_la_conveccion_exterior():
+    h_out, A = 12.0, GEOMETRIAS["Plana"]['A']
+    con_h = pared_conveccion_radiacion("Plana", 150.0, 20.0, 50.0, h_out, 0.5, 0.7, A=A, **CAPAS)
+    con_R = pared_conveccion_radiacion("Plana", 150.0, 20.0, 50.0, 0.0, 0.5, 0.7, A=A,
+                                       R_exterior=1 / (h_out * A), **CAPAS)
+    np.testing.assert_allclose(con_R['q'], con_h['q'], rtol=1e-10)
+
+
+@pytest.mark.parametrize("R_exterior", [0.0, -0.1, np.array([0.2, 0.0])])
+def test_R_exterior_no_positiva_es_error(R_exterior):
+    with pytest.raises(ValueError):
+        pared_conveccion_radiacion("Plana", 150.0, 20.0, 50.0, 0.0, 0.5, 0.7, A=2.0, R_exterior=R_exterior,
+                                   **CAPAS)
+
+
+def test_aletas_sin_conveccion_exterior_no_dan_nan():
+    # Sin h_out las aletas no intervienen: solo la radiación de la superficie exterior
+    aletas = {'tipo': "recta", 'k': 200.0, 'n': 20, 'espesor': 0.002, 'largo': 0.02, 'ancho': 1.0,
+              'punta': "adiabática"}
+    resultado = modelo_conduccion("Plana", 150.0, 20.0, 50.0, 0.0, A=2.0, emisividad_out=0.8, aletas=aletas,
+                                  **CAPAS)
+    assert np.isfinite(resultado['q']) and resultado['q'] > 0
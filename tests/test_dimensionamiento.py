@@ -0,0 +1,45 @@
+import numpy as np
+from calculos.dimensionamiento import dimensionar, TIPO_C_CERO
+from calculos.doble_tubo import coeficiente_global
+from calculos.propiedades import interpolar_propiedad
+
+
+def test_caudales_escalares_con_arreglo_de_objetivos():
+    Q = np.array([5e3, 1e4, 2e4])
+    lote = dimensionar("agua saturada", "agua saturada", 0.5, 0.6, 80.0, 20.0, 0.025, 0.05, Q=Q)
+    assert lote['A'].shape == Q.shape
+    for i, Q_i in enumerate(Q):
+        caso = dimensionar("agua saturada", "agua saturada", 0.5, 0.6, 80.0, 20.0, 0.025, 0.05, Q=Q_i)
+        np.testing.assert_allclose(lote['A'][i], caso['A'], rtol=1e-10)
+
+
+def test_temperaturas_objetivo_en_arreglo():
+    T_objetivo = np.array([60.0, 50.0])
+    resultado = dimensionar("agua saturada", "agua saturada", 0.5, 0.6, 80.0, 20.0, 0.025, 0.05,
+                            T_caliente_salida=T_objetivo)
+    assert resultado['L'].shape == T_objetivo.shape
+    np.testing.assert_allclose(resultado['T_caliente_salida'], T_objetivo, atol=1e-6)
+
+
+def test_condensacion_usa_la_capacidad_del_otro_fluido():
+    # Poco vapor que condensa: su m·cp sensible sería el menor, pero su capacidad es infinita
+    resultado = dimensionar("agua saturada", "agua saturada", 0.02, 0.5, 100.0, 20.0, 0.025, 0.05, Q=3e4,
+                            tipo=TIPO_C_CERO, lado_cambio_fase="caliente", fase_caliente="vapor",
+                            reevaluar_propiedades=False)
+    C_frio = 0.5 * interpolar_propiedad("agua saturada", 'cp', 20.0)
+    epsilon = 3e4 / (C_frio * 80.0)
+    assert resultado['factible']
+    np.testing.assert_allclose(resultado['epsilon'], epsilon, rtol=1e-12)
+    np.testing.assert_allclose(resultado['NTU'], -np.log(1 - epsilon), rtol=1e-12)
+    np.testing.assert_allclose(resultado['T_caliente_salida'], 100.0)
+    np.testing.assert_allclose(resultado['T_frio_salida'], 20.0 + 3e4 / C_frio, rtol=1e-12)
+
+
+def test_longitud_consistente_con_correlacion_en_desarrollo():
+    resultado = dimensionar("aceite para motor", "agua saturada", 0.05, 0.3, 90.0, 20.0, 0.025, 0.05, Q=2e3,
+                            correlacion_laminar="hausen")
+    Th_media = (90.0 + resultado['T_caliente_salida']) / 2
+    Tc_media = (20.0 + resultado['T_frio_salida']) / 2
+    U = coeficiente_global("aceite para motor", "agua saturada", Th_media, Tc_media, 0.05, 0.3, 0.025, 0.05,
+                           L=resultado['L'], correlacion_laminar="hausen")['U']
+    np.testing.assert_allclose(resultado['U'], U, rtol=1e-8)
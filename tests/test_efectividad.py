@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+from calculos.dimensionamiento import dimensionar
+from calculos.efectividad import efectividad, efectividad_maxima, ntu
+
+CONFIGURACIONES = [
+    ("Flujo cruzado: Ambos no mezclados", {}),
+    ("Coraza y tubos (1-2, 1-4, ...)", {'pasos': 4}),
+    ("Coraza y tubos (1-2, 1-4, ...)", {'pasos': 2, 'corazas': 2}),
+    ("Flujo cruzado: Ambos no mezclados", {'pasos': 2, 'contracorriente': False}),
+    ("Flujo cruzado: Cmax mezclado, Cmin no mezclado", {'pasos': 2, 'contracorriente': False}),
+    ("Flujo cruzado: Cmax no mezclado, Cmin mezclado", {'pasos': 3}),
+]
+
+
+@pytest.mark.parametrize("tipo, configuracion", CONFIGURACIONES)
+def test_ntu_justo_bajo_la_efectividad_maxima(tipo, configuracion):
+    C = np.linspace(0.05, 1, 20)
+    epsilon = efectividad_maxima(tipo, C, **configuracion) * (1 - 1e-6)
+    NTU = ntu(tipo, epsilon, C, **configuracion)
+    assert np.all(np.isfinite(NTU))
+    np.testing.assert_allclose(efectividad(tipo, NTU, C, **configuracion), epsilon, rtol=1e-9)
+
+
+def test_dimensionamiento_justo_bajo_la_efectividad_maxima():
+    tipo = "Flujo cruzado: Ambos no mezclados"
+    argumentos = ("agua saturada", "agua saturada", 0.5, 0.6, 80.0, 20.0, 0.025, 0.05)
+    referencia = dimensionar(*argumentos, Q=5e4, tipo=tipo, reevaluar_propiedades=False)
+    Q_max = 5e4 / referencia['epsilon']
+    resultado = dimensionar(*argumentos, Q=referencia['epsilon_max'] * (1 - 1e-6) * Q_max, tipo=tipo,
+                            reevaluar_propiedades=False)
+    assert resultado['factible'] and np.isfinite(resultado['A'])
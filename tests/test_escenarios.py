@@ -0,0 +1,60 @@
+import json
+import sqlite3
+
+import numpy as np
+import pandas as pd
+from calculos import escenarios
+
+ENTRADAS_NTU = {'tipo': "Flujo en contraflujo (doble tubo)", 'NTU': 1.5, 'C': 0.5}
+
+
+def test_hash_de_contenido():
+    base = escenarios.hash_contenido('ntu_e', ENTRADAS_NTU)
+    # Orden de claves, tipos de numpy y ruido por debajo de 12 cifras no cambian el hash
+    equivalente = {'C': np.float64(0.5), 'NTU': 1.5 * (1 + 1e-15), 'tipo': ENTRADAS_NTU['tipo']}
+    assert escenarios.hash_contenido('ntu_e', equivalente) == base
+    assert escenarios.hash_contenido('ntu_e', {**ENTRADAS_NTU, 'C': 0.6}) != base
+    assert escenarios.hash_contenido('hx3', ENTRADAS_NTU) != base
+
+
+def test_guardar_repetido_actualiza_la_misma_fila(tmp_path):
+    ruta = str(tmp_path / "escenarios.db")
+    primero = escenarios.guardar('ntu_e', ENTRADAS_NTU, {'epsilon': 0.1}, ruta=ruta)
+    segundo = escenarios.guardar('ntu_e', ENTRADAS_NTU, {'epsilon': 0.2}, ruta=ruta)
+    guardados = escenarios.buscar(ruta)
+    assert primero == segundo and len(guardados) == 1
+    assert guardados['epsilon'][0] == 0.2
+
+
+def test_exportar_e_importar(tmp_path):
+    origen, destino, archivo = (str(tmp_path / nombre) for nombre in ("origen.db", "destino.db", "e.jsonl"))
+    escenarios.guardar('ntu_e', ENTRADAS_NTU, escenarios.calcular('ntu_e', ENTRADAS_NTU), ruta=origen)
+    escenarios.guardar('hx3', {'parametro': "Carga térmica (Q)", 'm': 1.0, 'cp': 4186.0, 'T_in': 90.0,
+                               'T_out': 60.0}, {'Q': 125580.0}, ruta=origen)
+    assert escenarios.exportar(archivo, ruta=origen) == 2
+    assert escenarios.importar(archivo, ruta=destino) == 2
+    columnas = ['pagina', 'hash', 'version', 'creado', 'entradas', 'salidas', 'epsilon', 'Q']
+    pd.testing.assert_frame_equal(escenarios.buscar(origen)[columnas], escenarios.buscar(destino)[columnas])
+
+
+def test_recalcula_solo_versiones_distintas(tmp_path):
+    ruta = str(tmp_path / "escenarios.db")
+    escenarios.guardar('ntu_e', ENTRADAS_NTU, {'epsilon': 0.0}, ruta=ruta)
+    actual = {**ENTRADAS_NTU, 'NTU': 0.5}
+    escenarios.guardar('ntu_e', actual, escenarios.calcular('ntu_e', actual), ruta=ruta)
+    with sqlite3.connect(ruta) as conexion:
+        conexion.execute("UPDATE escenarios SET version = 'anterior' WHERE NTU = 1.5")
+
+    resultado = escenarios.recalcular_todos(ruta, procesos=1)
+    assert resultado == {'actualizados': 1, 'errores': {}}
+    guardados = escenarios.buscar(ruta).set_index('NTU')
+    assert json.loads(guardados.loc[1.5, 'salidas']) == escenarios.calcular('ntu_e', ENTRADAS_NTU)
+    assert set(guardados['version']) == {escenarios.VERSIONES_CALCULO['ntu_e']}
+    assert escenarios.recalcular_todos(ruta, procesos=1)['actualizados'] == 0
+
+
+def test_version_limitada_a_los_modulos_importados():
+    assert escenarios.modulos_calculo('hx3') == {'balance'}
+    assert 'conduccion' not in escenarios.modulos_calculo('u')
+    assert 'celdas' in escenarios.modulos_calculo('ntu_e')
+    assert 'flujo_interno' in escenarios.modulos_calculo('u')
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+from calculos.flujo_interno import nu_shah, nusselt_interno, TRANSICION
+
+# Nu promedio exacto de Graetz (temperatura de pared constante), serie de 5 términos
+LAMBDA = np.array([2.7043644, 6.6790315, 10.6733795, 14.6710785, 18.6698719])
+G = np.array([0.7486, 0.5436, 0.4628, 0.4154, 0.3836])
+
+
+def nu_graetz(x_est):
+    theta = 8 * np.sum(G / LAMBDA**2 * np.exp(-2 * LAMBDA**2 * x_est))
+    return -np.log(theta) / (4 * x_est)
+
+
+def test_shah_continuo_en_los_tramos():
+    for x_corte in (0.005, 0.03):
+        antes, despues = nu_shah(1.0, 1.0, 1.0, np.array([x_corte * (1 - 1e-9), x_corte * (1 + 1e-9)]))
+        assert abs(antes - despues) < 1e-6
+
+
+def test_shah_es_nu_promedio():
+    for x_est in (0.005, 0.01, 0.03, 0.1, 0.5):
+        assert abs(nu_shah(1.0, 1.0, 1.0, x_est) / nu_graetz(x_est) - 1) < 0.015
+    assert abs(nu_shah(1.0, 1.0, 1.0, 1e3) / 3.657 - 1) < 0.002
+
+
+def test_correlacion_de_desarrollo_exige_longitud():
+    for correlacion in ("hausen", "shah"):
+        with pytest.raises(ValueError):
+            nusselt_interno(1000.0, 5.0, D=0.02, correlacion_laminar=correlacion)
+
+
+def test_transicion_verifica_longitud():
+    # Re·Pr = 2300·5 en el extremo laminar: la entrada térmica ocupa ≈ 575 diámetros
+    corto = nusselt_interno(5000.0, 5.0, D=0.02, L=2.0)
+    largo = nusselt_interno(5000.0, 5.0, D=0.02, L=20.0)
+    assert corto['regimen'] == TRANSICION and not corto['valido']
+    assert largo['valido']
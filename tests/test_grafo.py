@@ -0,0 +1,88 @@
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+from calculos.grafo import GrafoCalculo
+
+
+def grafo_contado(estado=None):
+    """Grafo a → doble → signo → texto que cuenta las evaluaciones de cada nodo."""
+    grafo, llamadas = GrafoCalculo(estado), {'doble': 0, 'signo': 0, 'texto': 0}
+
+    @grafo.nodo
+    def doble(a):
+        llamadas['doble'] += 1
+        return 2 * a
+
+    @grafo.nodo
+    def signo(doble):
+        llamadas['signo'] += 1
+        return doble >= 0
+
+    @grafo.nodo
+    def texto(signo):
+        llamadas['texto'] += 1
+        return "positivo" if signo else "negativo"
+
+    return grafo, llamadas
+
+
+def test_reutiliza_si_la_firma_no_cambia():
+    grafo, llamadas = grafo_contado()
+    grafo.entradas(a=1.0)
+    assert grafo.valor('texto') == "positivo"
+    grafo.entradas(a=1.0)
+    assert grafo.valor('texto') == "positivo"
+    assert llamadas == {'doble': 1, 'signo': 1, 'texto': 1}
+
+
+def test_cambio_de_entrada_invalida_la_version():
+    grafo, llamadas = grafo_contado()
+    grafo.entradas(a=1.0)
+    grafo.valor('doble')
+    grafo.entradas(a=3.0)
+    assert grafo.valor('doble') == 6.0
+    assert llamadas['doble'] == 2
+
+
+def test_propagacion_aguas_abajo():
+    grafo, llamadas = grafo_contado()
+    grafo.entradas(a=1.0)
+    grafo.valor('texto')
+    # signo no cambia: texto no se recalcula
+    grafo.entradas(a=2.0)
+    assert grafo.valor('texto') == "positivo"
+    assert llamadas == {'doble': 2, 'signo': 2, 'texto': 1}
+    # signo cambia: el cambio llega hasta texto
+    grafo.entradas(a=-1.0)
+    assert grafo.valor('texto') == "negativo"
+    assert llamadas == {'doble': 3, 'signo': 3, 'texto': 2}
+
+
+def test_estado_compartido_entre_reejecuciones():
+    # Cada reejecución de la página arma un grafo nuevo sobre el mismo estado
+    estado = {}
+    primero, _ = grafo_contado(estado)
+    primero.entradas(a=1.0)
+    primero.valor('texto')
+    segundo, llamadas_segundo = grafo_contado(estado)
+    segundo.entradas(a=1.0)
+    assert segundo.valor('texto') == "positivo"
+    assert llamadas_segundo == {'doble': 0, 'signo': 0, 'texto': 0}
+
+
+def test_cierra_figuras_reemplazadas():
+    grafo = GrafoCalculo()
+
+    @grafo.nodo
+    def figura(a):
+        fig, ax = plt.subplots()
+        ax.plot([0, 1], [0, a])
+        return fig
+
+    grafo.entradas(a=1.0)
+    anterior = grafo.valor('figura')
+    grafo.entradas(a=2.0)
+    actual = grafo.valor('figura')
+    assert not plt.fignum_exists(anterior.number)
+    assert plt.fignum_exists(actual.number)
+    plt.close(actual)
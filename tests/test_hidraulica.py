@@ -0,0 +1,44 @@
+import numpy as np
+from calculos.hidraulica import (
+    factor_friccion, factor_friccion_colebrook, factor_friccion_haaland, factor_friccion_swamee_jain,
+    f_re_anulo_laminar
+)
+
+RE = np.geomspace(4e3, 1e8, 40)[:, None]
+RUGOSIDAD = np.concatenate([[0.0], np.geomspace(1e-6, 0.05, 20)])[None, :]
+
+
+def colebrook_punto_fijo(Re, e, iteraciones=500):
+    x = np.full(np.broadcast(Re, e).shape, 8.0)
+    for _ in range(iteraciones):
+        x = -2 * np.log10(e / 3.7 + 2.51 * x / Re)
+    return 1 / x**2
+
+
+def test_colebrook_newton_coincide_con_punto_fijo():
+    np.testing.assert_allclose(factor_friccion_colebrook(RE, RUGOSIDAD), colebrook_punto_fijo(RE, RUGOSIDAD),
+                               rtol=1e-10)
+
+
+def test_haaland_dentro_del_2_por_ciento():
+    error = factor_friccion_haaland(RE, RUGOSIDAD) / factor_friccion_colebrook(RE, RUGOSIDAD) - 1
+    assert np.abs(error).max() < 0.02
+
+
+def test_swamee_jain_dentro_del_3_por_ciento():
+    Re, e = np.geomspace(5e3, 1e8, 40)[:, None], np.geomspace(1e-6, 1e-2, 20)[None, :]
+    error = factor_friccion_swamee_jain(Re, e) / factor_friccion_colebrook(Re, e) - 1
+    assert np.abs(error).max() < 0.03
+
+
+def test_laminar_64_sobre_re():
+    Re = np.array([10.0, 500.0, 2000.0])
+    for metodo in ("colebrook", "haaland", "swamee-jain"):
+        np.testing.assert_allclose(factor_friccion(Re, 1e-3, metodo=metodo), 64 / Re, rtol=1e-14)
+
+
+def test_f_re_anulo_tabulado():
+    # Shah y London (1978), f·Re de Fanning del anulo concéntrico basado en Dh
+    Di_Do = np.array([0.0, 0.05, 0.10, 0.25, 0.50, 0.75])
+    tabla = np.array([16.000, 21.567, 22.343, 23.302, 23.813, 23.967])
+    np.testing.assert_allclose(f_re_anulo_laminar(Di_Do) / 4, tabla, rtol=1e-4)
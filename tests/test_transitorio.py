@@ -0,0 +1,38 @@
+import numpy as np
+from calculos.doble_tubo import coeficiente_global
+from calculos.efectividad import efectividad
+from calculos.propiedades import interpolar_propiedad
+from calculos.transitorio import respuesta_doble_tubo
+
+CASO = dict(fluido_int="agua saturada", fluido_ext="agua saturada", T_int_entrada=30.0, T_ext_entrada=20.0,
+            m_int=0.05, m_ext=0.08, Di=0.02, Do=0.04)
+
+
+def test_tiempo_largo_alcanza_el_estacionario_epsilon_ntu():
+    L = 30.0
+    respuesta = respuesta_doble_tubo(**CASO, L=L, t_final=3000.0, dt=5.0, n_segmentos=400, T_inicial=20.0)
+    T_int_salida, T_ext_salida = respuesta['T_int_salida'][-1], respuesta['T_ext_salida'][-1]
+
+    # ε-NTU en contraflujo con U y cp a las temperaturas medias de cada fluido
+    T_int_media, T_ext_media = (30.0 + T_int_salida) / 2, (20.0 + T_ext_salida) / 2
+    U = coeficiente_global("agua saturada", "agua saturada", T_int_media, T_ext_media, 0.05, 0.08,
+                           0.02, 0.04)['U']
+    C_int = 0.05 * interpolar_propiedad("agua saturada", 'cp', T_int_media)
+    C_ext = 0.08 * interpolar_propiedad("agua saturada", 'cp', T_ext_media)
+    C_min, C_max = min(C_int, C_ext), max(C_int, C_ext)
+    epsilon = efectividad("Flujo en contraflujo (doble tubo)", U * np.pi * 0.02 * L / C_min, C_min / C_max)
+    Q = epsilon * C_min * 10.0
+    np.testing.assert_allclose(T_int_salida, 30.0 - Q / C_int, atol=0.05)
+    np.testing.assert_allclose(T_ext_salida, 20.0 + Q / C_ext, atol=0.05)
+
+
+def test_bdf2_de_segundo_orden():
+    # Coeficientes fijos (sin reevaluar propiedades) para aislar el error de la integración temporal
+    salidas = np.array([
+        respuesta_doble_tubo(**CASO, L=5.0, t_final=40.0, dt=dt, n_segmentos=50, T_inicial=20.0,
+                             actualizar_cada=10**9)['T_int_salida'][-1]
+        for dt in (0.4, 0.2, 0.1, 0.05)
+    ])
+    diferencias = np.diff(salidas)
+    razones = diferencias[:-1] / diferencias[1:]
+    assert np.all((razones > 3.5) & (razones < 4.5))